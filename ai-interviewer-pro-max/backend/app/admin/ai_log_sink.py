@@ -0,0 +1,189 @@
+"""
+AI API Log Sink
+
+Write-behind buffer for AI API call logs.
+
+- Rows are queued in memory (bounded) instead of being committed on the
+  caller's request session
+- A background worker bulk-inserts batches on its own connection, either
+  every flush interval or as soon as a batch fills up
+- When the queue is full, new rows are dropped and counted rather than
+  slowing down the AI call that produced them
+- flush() / stop() are called from the application lifespan on shutdown
+"""
+
+import queue
+import threading
+import uuid
+import logging
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class AILogSink:
+    """Bounded in-process queue that batches AIAPILog rows."""
+
+    def __init__(
+        self,
+        max_queue_size: int = None,
+        batch_size: int = None,
+        flush_interval: float = None,
+    ):
+        self.max_queue_size = max_queue_size or settings.AI_LOG_QUEUE_SIZE
+        self.batch_size = batch_size or settings.AI_LOG_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.AI_LOG_FLUSH_INTERVAL_SECONDS
+
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=self.max_queue_size)
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._write_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+        # Counters (exposed on the admin AI stats endpoint)
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    # ===========================================
+    # PRODUCER SIDE
+    # ===========================================
+
+    def enqueue(self, **fields: Any) -> bool:
+        """
+        Queue a log row. Never blocks and never raises.
+
+        Returns:
+            True if queued, False if dropped because the queue is full
+        """
+        row = {
+            "id": str(uuid.uuid4()),
+            "created_at": datetime.utcnow(),
+            **fields,
+        }
+
+        self._ensure_started()
+
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 100 == 0:
+                print(f"[AI Log Sink] Queue full - dropped {self.dropped} log rows so far")
+            return False
+
+        self.enqueued += 1
+        if self._queue.qsize() >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    # ===========================================
+    # WORKER
+    # ===========================================
+
+    def _ensure_started(self) -> None:
+        """Start the background worker on first use."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+
+        with self._start_lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._stopping.clear()
+            self._worker = threading.Thread(
+                target=self._run,
+                name="ai-log-sink",
+                daemon=True,
+            )
+            self._worker.start()
+
+    def start(self) -> None:
+        """Start the background worker (application startup)."""
+        self._ensure_started()
+
+    def _run(self) -> None:
+        """Drain the queue every flush interval, or early when a batch fills up."""
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        """Pop up to one batch of rows from the queue."""
+        rows = []
+        while len(rows) < self.batch_size:
+            try:
+                rows.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return rows
+
+    def flush(self) -> int:
+        """
+        Write every queued row to the database.
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        with self._write_lock:
+            while True:
+                rows = self._drain()
+                if not rows:
+                    break
+                written += self._write_batch(rows)
+        return written
+
+    def _write_batch(self, rows: List[Dict[str, Any]]) -> int:
+        """Bulk-insert one batch on a dedicated connection."""
+        from app.db.session import engine
+        from app.admin.models import AIAPILog
+
+        try:
+            with engine.begin() as conn:
+                conn.execute(AIAPILog.__table__.insert(), rows)
+        except Exception as e:
+            self.failed += len(rows)
+            logger.warning(f"AI log batch insert failed ({len(rows)} rows): {e}")
+            return 0
+
+        self.written += len(rows)
+        return len(rows)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the worker and flush whatever is left (application shutdown)."""
+        self._stopping.set()
+        self._wakeup.set()
+
+        worker = self._worker
+        if worker is not None and worker.is_alive():
+            worker.join(timeout)
+        self._worker = None
+
+        self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and lifetime counters."""
+        return {
+            "queued": self._queue.qsize(),
+            "max_queue_size": self.max_queue_size,
+            "batch_size": self.batch_size,
+            "flush_interval_seconds": self.flush_interval,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+# ===========================================
+# SINK INSTANCE
+# ===========================================
+
+ai_log_sink = AILogSink()
@@ -20,6 +20,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, desc, and_
 from typing import Optional, List, Any
 from datetime import datetime, timedelta
+import json
 from pydantic import BaseModel, Field
 
 from app.db.session import get_db
@@ -36,6 +37,18 @@ from app.admin.service import (
     ErrorLogService, APILogService, BugReportService,
     IntegrationService
 )
+from app.admin.ai_log_sink import ai_log_sink
+from app.ai.registry import ai_client_registry
+from app.ai.circuit_breaker import circuit_breakers
+from app.ai.model_router import model_router, validate_route, ROUTES_SETTING_KEY
+from app.interviews.session_cache import live_session_cache
+from app.interviews.prefetch import question_prefetcher
+from app.interviews.turn_planner import turn_planner
+from app.jobs.queue import job_queue
+from app.core.idempotency import idempotency_store
+from app.core.single_flight import single_flight_stats
+from app.interviews.plan_warmer import plan_warm_pool
+from app.interviews.plan_stream import plan_streams
 
 
 router = APIRouter()
@@ -446,7 +459,16 @@ async def get_system_health(
             "database": {
                 **db_health,
                 "table_stats": db_stats
-            }
+            },
+            "ai_circuit_breakers": circuit_breakers.snapshot(),
+            "live_session_cache": live_session_cache.get_stats(),
+            "question_prefetch": question_prefetcher.get_stats(),
+            "turn_planner": turn_planner.get_stats(),
+            "background_jobs": job_queue.get_stats(),
+            "idempotency": idempotency_store.get_stats(),
+            "single_flight": single_flight_stats(),
+            "plan_warm_pool": plan_warm_pool.get_stats(),
+            "plan_streams": plan_streams.get_stats()
         }
     }
 
@@ -489,7 +511,8 @@ async def get_realtime_metrics(
             "requests_per_hour": recent_requests,
             "errors_per_hour": recent_errors,
             "active_users": active_users,
-            "overall_status": SystemMonitor._calculate_overall_status()
+            "overall_status": SystemMonitor._calculate_overall_status(),
+            "ai_circuit_breakers": circuit_breakers.snapshot()["providers"]
         }
     }
 
@@ -651,6 +674,9 @@ async def get_ai_api_logs(
     error_calls = db.query(func.count(AIAPILog.id)).filter(
         AIAPILog.created_at >= since, AIAPILog.status == "error"
     ).scalar() or 0
+    timeout_calls = db.query(func.count(AIAPILog.id)).filter(
+        AIAPILog.created_at >= since, AIAPILog.status == "timeout"
+    ).scalar() or 0
     
     # Token usage
     total_tokens = db.query(func.sum(AIAPILog.total_tokens)).filter(
@@ -670,7 +696,8 @@ async def get_ai_api_logs(
             "gemini_calls": gemini_calls,
             "groq_calls": groq_calls,
             "error_calls": error_calls,
-            "success_rate": round((total_calls - error_calls) / total_calls * 100, 1) if total_calls > 0 else 100,
+            "timeout_calls": timeout_calls,
+            "success_rate": round((total_calls - error_calls - timeout_calls) / total_calls * 100, 1) if total_calls > 0 else 100,
             "total_tokens": total_tokens,
             "avg_response_time_ms": round(avg_response_time, 1),
             "hours": hours
@@ -748,7 +775,8 @@ async def get_ai_api_stats(
                 for o in operation_stats
             ],
             "daily": daily_stats,
-            "period_days": days
+            "period_days": days,
+            "log_sink": ai_log_sink.get_stats()
         }
     }
 
@@ -828,7 +856,8 @@ async def get_usage_stats(
                 "total": total_resumes
             },
             "daily": daily_stats,
-            "period_days": days
+            "period_days": days,
+            "log_sink": ai_log_sink.get_stats()
         }
     }
 
@@ -1249,23 +1278,14 @@ async def update_api_keys(
     
     if request.gemini_api_key is not None:
         SettingsService.set_setting(db, "gemini_api_key", request.gemini_api_key, current_admin["id"])
-        # Update runtime config
-        from app.core.config import settings
-        settings.GEMINI_API_KEY = request.gemini_api_key
-        # Reconfigure Gemini
-        try:
-            import google.generativeai as genai  # type: ignore
-            if request.gemini_api_key:
-                genai.configure(api_key=request.gemini_api_key)
-        except Exception:
-            pass
+        # Rebuild the shared Gemini client
+        ai_client_registry.configure(gemini_api_key=request.gemini_api_key)
         updated.append("gemini")
     
     if request.groq_api_key is not None:
         SettingsService.set_setting(db, "groq_api_key", request.groq_api_key, current_admin["id"])
-        # Update runtime config
-        from app.core.config import settings
-        settings.GROQ_API_KEY = request.groq_api_key
+        # Rebuild the shared Groq client
+        ai_client_registry.configure(groq_api_key=request.groq_api_key)
         updated.append("groq")
     
     return {
@@ -1303,7 +1323,7 @@ async def test_api_keys(
             import google.generativeai as genai  # type: ignore
             genai.configure(api_key=active_gemini)
             model = genai.GenerativeModel('gemini-1.5-flash')
-            response = model.generate_content("Say 'API key is valid' in exactly 5 words")
+            response = await model.generate_content_async("Say 'API key is valid' in exactly 5 words")
             results["gemini"] = {
                 "valid": True,
                 "message": "Gemini API key is valid and working",
@@ -1323,13 +1343,13 @@ async def test_api_keys(
     # Test Groq
     if active_groq:
         try:
-            from groq import Groq  # type: ignore
-            client = Groq(api_key=active_groq)
-            response = client.chat.completions.create(
-                model="llama-3.1-8b-instant",
-                messages=[{"role": "user", "content": "Say 'API key valid' in 3 words"}],
-                max_tokens=20
-            )
+            from groq import AsyncGroq  # type: ignore
+            async with AsyncGroq(api_key=active_groq) as client:
+                response = await client.chat.completions.create(
+                    model="llama-3.1-8b-instant",
+                    messages=[{"role": "user", "content": "Say 'API key valid' in 3 words"}],
+                    max_tokens=20
+                )
             results["groq"] = {
                 "valid": True,
                 "message": "Groq API key is valid and working",
@@ -1377,12 +1397,107 @@ async def remove_api_key_override(
         setting.value = ""
         db.commit()
     
+    # Revert the shared client to the .env key
+    ai_client_registry.configure(**{f"{provider}_api_key": ""})
+    
     return {
         "success": True,
         "message": f"API key override for {provider} removed. Now using .env value if available."
     }
 
 
+# ===========================================
+# AI MODEL ROUTING
+# ===========================================
+
+class ModelRouteEntry(BaseModel):
+    model: str
+    slo_ms: int = Field(..., gt=0)
+
+
+class ModelRouteUpdateRequest(BaseModel):
+    provider: str
+    models: List[ModelRouteEntry]
+
+
+def _save_model_routes(db: Session, admin_id: str) -> None:
+    """Persist admin route overrides."""
+    SettingsService.set_setting(
+        db, ROUTES_SETTING_KEY, json.dumps(model_router.get_overrides()), admin_id
+    )
+
+
+@router.get(
+    "/ai-routing",
+    summary="Get AI model routing table",
+    description="Ranked models and latency SLOs per AI operation, with the active model and observed p95."
+)
+async def get_model_routes(
+    current_admin: dict = Depends(get_current_admin),
+):
+    """Get the AI model routing table."""
+    return {
+        "success": True,
+        "routes": model_router.get_table()
+    }
+
+
+@router.put(
+    "/ai-routing/{operation}",
+    summary="Update AI model route",
+    description="Set the ranked model list (preferred first) and latency SLOs for an AI operation."
+)
+async def update_model_route(
+    operation: str,
+    request: ModelRouteUpdateRequest,
+    current_admin: dict = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Update the model route for one operation."""
+    overrides = model_router.get_overrides()
+    try:
+        overrides[operation] = validate_route({
+            "provider": request.provider,
+            "models": [entry.dict() for entry in request.models],
+        })
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    model_router.load_overrides(overrides)
+    _save_model_routes(db, current_admin["id"])
+    
+    return {
+        "success": True,
+        "message": f"Model route for '{operation}' updated",
+        "routes": model_router.get_table()
+    }
+
+
+@router.delete(
+    "/ai-routing/{operation}",
+    summary="Reset AI model route",
+    description="Remove the admin override for an operation, reverting to the default route."
+)
+async def reset_model_route(
+    operation: str,
+    current_admin: dict = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Reset one operation to its default route."""
+    overrides = model_router.get_overrides()
+    if operation not in overrides:
+        raise HTTPException(status_code=404, detail=f"No override for operation: {operation}")
+    
+    del overrides[operation]
+    model_router.load_overrides(overrides)
+    _save_model_routes(db, current_admin["id"])
+    
+    return {
+        "success": True,
+        "message": f"Model route for '{operation}' reset to default"
+    }
+
+
 # ===========================================
 # BROADCAST / ANNOUNCEMENTS
 # ===========================================
@@ -1559,3 +1674,45 @@ async def reset_toon_stats_endpoint(
         "message": "TOON statistics reset"
     }
 
+
+# ===========================================
+# PROMPT TOKEN BUDGETS
+# ===========================================
+
+@router.get(
+    "/prompt-budgets",
+    summary="Get prompt token budgets",
+    description="Tokens used vs. budget per AI operation since startup."
+)
+async def get_prompt_budgets(
+    current_admin: dict = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get per-operation prompt budget usage."""
+    from app.ai.prompt_builder import get_prompt_budget_stats, PROMPT_BUDGETS
+
+    return {
+        "success": True,
+        "budgets": PROMPT_BUDGETS,
+        "operations": get_prompt_budget_stats(),
+    }
+
+
+@router.post(
+    "/prompt-budgets/reset",
+    summary="Reset prompt budget statistics",
+    description="Reset prompt token usage counters."
+)
+async def reset_prompt_budgets(
+    current_admin: dict = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Reset prompt budget statistics."""
+    from app.ai.prompt_builder import reset_prompt_budget_stats
+
+    reset_prompt_budget_stats()
+
+    return {
+        "success": True,
+        "message": "Prompt budget statistics reset"
+    }
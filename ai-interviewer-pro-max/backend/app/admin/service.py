@@ -25,7 +25,7 @@ from app.admin.models import (
 from app.users.models import User
 from app.interviews.models import InterviewSession
 from app.resumes.models import Resume
-from app.core.config import settings
+from app.ai.registry import ai_client_registry
 
 
 # ===========================================
@@ -216,6 +216,7 @@ class SettingsService:
         "gemini_api_key": {"value": "", "type": "string", "category": "api", "description": "Google Gemini API Key", "sensitive": True},
         "groq_api_key": {"value": "", "type": "string", "category": "api", "description": "Groq API Key", "sensitive": True},
         "openai_api_key": {"value": "", "type": "string", "category": "api", "description": "OpenAI API Key (optional)", "sensitive": True},
+        "ai_model_routes": {"value": "", "type": "json", "category": "api", "description": "Admin overrides of the AI model routing table (edit via /api/admin/ai-routing)"},
         
         # Rate Limits
         "rate_limit_requests_per_minute": {"value": "60", "type": "integer", "category": "limits", "description": "Maximum API requests per minute per user"},
@@ -686,13 +687,13 @@ class IntegrationService:
         try:
             if integration_name == "gemini":
                 # Check Gemini API
-                if settings.GEMINI_API_KEY:
+                if ai_client_registry.is_gemini_configured():
                     health_status = "healthy"
                 else:
                     health_status = "not_configured"
             elif integration_name == "groq":
                 # Check Groq API
-                if settings.GROQ_API_KEY:
+                if ai_client_registry.is_groq_configured():
                     health_status = "healthy"
                 else:
                     health_status = "not_configured"
@@ -723,7 +724,7 @@ class AIAPILogService:
     
     @staticmethod
     def log_ai_call(
-        db: Session,
+        db: Optional[Session],
         provider: str,
         operation: str,
         model: str = None,
@@ -735,11 +736,16 @@ class AIAPILogService:
         error_message: str = None,
         user_id: str = None,
         session_id: str = None
-    ) -> AIAPILog:
+    ) -> bool:
         """
         Log an AI API call.
         
+        The row is queued on the write-behind sink and bulk-inserted on the
+        sink's own connection - the caller's session is never touched, so
+        logging adds no commit to the AI hot path.
+        
         Args:
+            db: Unused (kept for call-site compatibility)
             provider: "gemini" or "groq"
             operation: What the AI call was for (e.g., "evaluate_answer", "generate_plan")
             model: Model used (e.g., "gemini-pro", "llama-3.1-8b-instant")
@@ -747,12 +753,17 @@ class AIAPILogService:
             completion_tokens: Number of output tokens
             total_tokens: Total tokens used
             response_time_ms: Response time in milliseconds
-            status: "success" or "error"
-            error_message: Error message if status is "error"
+            status: "success", "error" or "timeout"
+            error_message: Error message if status is "error" or "timeout"
             user_id: User ID if applicable
             session_id: Interview session ID if applicable
+        
+        Returns:
+            True if queued, False if dropped (queue full)
         """
-        log = AIAPILog(
+        from app.admin.ai_log_sink import ai_log_sink
+        
+        return ai_log_sink.enqueue(
             provider=provider,
             model=model,
             operation=operation,
@@ -765,11 +776,6 @@ class AIAPILogService:
             user_id=user_id,
             session_id=session_id
         )
-        
-        db.add(log)
-        db.commit()
-        db.refresh(log)
-        return log
     
     @staticmethod
     def get_recent_logs(
@@ -815,6 +821,10 @@ class AIAPILogService:
             AIAPILog.created_at >= since, AIAPILog.status == "error"
         ).scalar() or 0
         
+        timeouts = db.query(func.count(AIAPILog.id)).filter(
+            AIAPILog.created_at >= since, AIAPILog.status == "timeout"
+        ).scalar() or 0
+        
         total_tokens = db.query(func.sum(AIAPILog.total_tokens)).filter(
             AIAPILog.created_at >= since
         ).scalar() or 0
@@ -828,7 +838,8 @@ class AIAPILogService:
             "gemini_calls": gemini_calls,
             "groq_calls": groq_calls,
             "error_calls": errors,
-            "success_rate": round((total - errors) / total * 100, 1) if total > 0 else 100,
+            "timeout_calls": timeouts,
+            "success_rate": round((total - errors - timeouts) / total * 100, 1) if total > 0 else 100,
             "total_tokens": total_tokens,
             "avg_response_time_ms": round(avg_response, 1),
             "hours": hours
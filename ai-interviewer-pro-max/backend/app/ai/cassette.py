@@ -0,0 +1,238 @@
+"""
+AI Call Cassettes (record / replay)
+
+Captures Groq and Gemini calls made through the AI gateway so the
+interview flow can be benchmarked and regression-tested without network
+access or provider latency variance.
+
+- record: every successful call is appended to the cassette file
+  (JSON lines) with its operation, prompt hash, prompt, response text,
+  token usage and observed latency
+- replay: calls are answered from the cassette instead of the provider,
+  keyed by operation + prompt hash. Latency is the recorded one, a fixed
+  synthetic one per provider, or none (AI_CASSETTE_LATENCY)
+- Prompts that embed per-run data (ids, randomized question picks) will
+  not hash the same across runs; unless AI_CASSETTE_STRICT is set these
+  fall back to the recordings of the same operation, served round-robin
+  in file order, so replays stay deterministic
+- A replay miss raises CassetteMissError, which the services handle like
+  any provider error (deterministic fallback)
+
+Mode and file are selected in Settings (AI_CASSETTE_MODE / AI_CASSETTE_PATH)
+and can be switched at runtime with ai_cassette.configure().
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Union
+
+from app.core.config import settings
+
+
+MODES = ("off", "record", "replay")
+
+Payload = Union[str, List[Dict[str, str]]]
+
+
+class CassetteMissError(Exception):
+    """Replay requested for a call that was never recorded."""
+
+
+class AICassette:
+    """Records AI calls to, and replays them from, a JSON-lines cassette."""
+
+    def __init__(self):
+        self._mode: Optional[str] = None
+        self._path: Optional[str] = None
+        self._lock = threading.Lock()
+        # Loaded recordings (replay)
+        self._by_key: Dict[str, List[Dict[str, Any]]] = {}
+        self._by_operation: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursors: Dict[str, int] = {}
+        self._loaded_path: Optional[str] = None
+        self._stats = {"recorded": 0, "hits": 0, "fallback_hits": 0, "misses": 0}
+
+    # ===========================================
+    # MODE
+    # ===========================================
+
+    @property
+    def mode(self) -> str:
+        mode = (self._mode or settings.AI_CASSETTE_MODE or "off").lower()
+        return mode if mode in MODES else "off"
+
+    @property
+    def path(self) -> str:
+        return self._path or settings.AI_CASSETTE_PATH
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def configure(self, mode: Optional[str] = None, path: Optional[str] = None) -> None:
+        """
+        Override the Settings mode / cassette file at runtime.
+
+        Args:
+            mode: off, record or replay (None keeps the current value)
+            path: Cassette file (None keeps the current value)
+
+        Raises:
+            ValueError: Unknown mode
+        """
+        if mode is not None and mode not in MODES:
+            raise ValueError(f"Cassette mode must be one of {', '.join(MODES)}")
+
+        with self._lock:
+            if mode is not None:
+                self._mode = mode
+            if path is not None:
+                self._path = path
+            self._loaded_path = None
+            self._cursors = {}
+            self._stats = {"recorded": 0, "hits": 0, "fallback_hits": 0, "misses": 0}
+
+        print(f"[AI Cassette] Mode: {self.mode} ({self.path})")
+
+    # ===========================================
+    # KEYS
+    # ===========================================
+
+    @staticmethod
+    def prompt_hash(payload: Payload) -> str:
+        """Stable hash of a prompt string or chat message list."""
+        if not isinstance(payload, str):
+            payload = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def key(cls, operation: str, payload: Payload) -> str:
+        return f"{operation}:{cls.prompt_hash(payload)}"
+
+    # ===========================================
+    # RECORD
+    # ===========================================
+
+    def record(self, provider: str, operation: str, payload: Payload, result: Any) -> None:
+        """Append one successful call (an AIResponse) to the cassette."""
+        entry = {
+            "key": self.key(operation, payload),
+            "provider": provider,
+            "operation": operation,
+            "model": result.model,
+            "prompt": payload,
+            "response": result.text,
+            "response_time_ms": result.response_time_ms,
+            "prompt_tokens": result.prompt_tokens,
+            "completion_tokens": result.completion_tokens,
+            "total_tokens": result.total_tokens,
+            "recorded_at": datetime.utcnow().isoformat(),
+        }
+
+        try:
+            with self._lock:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as cassette:
+                    cassette.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                self._stats["recorded"] += 1
+        except OSError as e:
+            print(f"[AI Cassette] Failed to record {operation}: {e}")
+
+    # ===========================================
+    # REPLAY
+    # ===========================================
+
+    def _load(self) -> None:
+        """Read the cassette file (lock held)."""
+        by_key: Dict[str, List[Dict[str, Any]]] = {}
+        by_operation: Dict[str, List[Dict[str, Any]]] = {}
+
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as cassette:
+                for line in cassette:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    by_key.setdefault(entry["key"], []).append(entry)
+                    by_operation.setdefault(entry["operation"], []).append(entry)
+        else:
+            print(f"[AI Cassette] Cassette not found: {self.path}")
+
+        self._by_key = by_key
+        self._by_operation = by_operation
+        self._cursors = {}
+        self._loaded_path = self.path
+        print(f"[AI Cassette] Loaded {sum(len(v) for v in by_key.values())} recordings from {self.path}")
+
+    def _next(self, cursor_key: str, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Round-robin over entries (lock held)."""
+        index = self._cursors.get(cursor_key, 0)
+        self._cursors[cursor_key] = index + 1
+        return entries[index % len(entries)]
+
+    def lookup(self, operation: str, payload: Payload) -> Dict[str, Any]:
+        """
+        Recorded call for this operation and prompt.
+
+        Raises:
+            CassetteMissError: Nothing recorded (or no exact match in strict mode)
+        """
+        key = self.key(operation, payload)
+
+        with self._lock:
+            if self._loaded_path != self.path:
+                self._load()
+
+            if key in self._by_key:
+                self._stats["hits"] += 1
+                return self._next(key, self._by_key[key])
+
+            if not settings.AI_CASSETTE_STRICT and operation in self._by_operation:
+                self._stats["fallback_hits"] += 1
+                return self._next(operation, self._by_operation[operation])
+
+            self._stats["misses"] += 1
+
+        raise CassetteMissError(f"No recording for {key}")
+
+    def replay_latency_ms(self, entry: Dict[str, Any]) -> int:
+        """Latency to simulate for a replayed call."""
+        latency = (settings.AI_CASSETTE_LATENCY or "recorded").lower()
+        if latency == "none":
+            return 0
+        if latency == "synthetic":
+            if entry.get("provider") == "groq":
+                return settings.AI_CASSETTE_SYNTHETIC_GROQ_MS
+            return settings.AI_CASSETTE_SYNTHETIC_GEMINI_MS
+        return int(entry.get("response_time_ms") or 0)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Current mode, file and hit/miss counters."""
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "path": self.path,
+                "latency": settings.AI_CASSETTE_LATENCY,
+                "strict": settings.AI_CASSETTE_STRICT,
+                **self._stats,
+            }
+
+
+# ===========================================
+# CASSETTE INSTANCE
+# ===========================================
+
+ai_cassette = AICassette()
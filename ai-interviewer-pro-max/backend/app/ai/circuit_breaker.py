@@ -0,0 +1,219 @@
+"""
+AI Circuit Breakers
+
+One breaker per (provider, operation), fed by the latency and outcome of
+every call the AI gateway makes.
+
+- CLOSED: calls go through; outcomes are tracked in a rolling window
+- OPEN: the failure rate (errors, timeouts and slow calls) crossed the
+  threshold - calls are rejected immediately so services take their
+  deterministic fallback without paying the provider's error latency
+- HALF_OPEN: after the cool-down a single probe call is let through;
+  success closes the breaker, failure re-opens it
+
+The same rolling window provides the p95 latency used as the hedge delay
+for latency-critical Groq operations.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional, Tuple
+
+from app.core.config import settings
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Call rejected because the provider/operation breaker is open."""
+
+
+class CircuitBreaker:
+    """Rolling-window circuit breaker for one provider operation."""
+
+    def __init__(
+        self,
+        provider: str,
+        operation: str,
+        slow_call_ms: int,
+        window_size: int = None,
+        min_calls: int = None,
+        failure_rate_threshold: float = None,
+        open_seconds: float = None,
+    ):
+        self.provider = provider
+        self.operation = operation
+        self.slow_call_ms = slow_call_ms
+        self.window_size = window_size or settings.AI_BREAKER_WINDOW_SIZE
+        self.min_calls = min_calls or settings.AI_BREAKER_MIN_CALLS
+        self.failure_rate_threshold = failure_rate_threshold or settings.AI_BREAKER_FAILURE_RATE
+        self.open_seconds = open_seconds or settings.AI_BREAKER_OPEN_SECONDS
+
+        # (succeeded, latency_ms) per call
+        self._window: deque = deque(maxlen=self.window_size)
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+
+        self.rejected = 0
+        self.times_opened = 0
+        self.hedged = 0
+
+    # ===========================================
+    # STATE
+    # ===========================================
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        """State with the OPEN -> HALF_OPEN cool-down applied (lock held)."""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check if a call may go to the provider right now."""
+        with self._lock:
+            state = self._current_state()
+
+            if state == CLOSED:
+                return True
+
+            if state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+
+            self.rejected += 1
+            return False
+
+    # ===========================================
+    # OUTCOMES
+    # ===========================================
+
+    def record_success(self, latency_ms: int) -> None:
+        """Record a completed call (slow calls count against the breaker)."""
+        self._record(latency_ms <= self.slow_call_ms, latency_ms)
+
+    def record_failure(self, latency_ms: Optional[int] = None) -> None:
+        """Record an error or timeout."""
+        self._record(False, latency_ms)
+
+    def record_cancelled(self) -> None:
+        """Release a half-open probe whose call was cancelled without an outcome."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _record(self, succeeded: bool, latency_ms: Optional[int]) -> None:
+        with self._lock:
+            self._window.append((succeeded, latency_ms))
+            state = self._current_state()
+
+            if state == HALF_OPEN:
+                self._probe_in_flight = False
+                if succeeded:
+                    self._state = CLOSED
+                    self._window.clear()
+                else:
+                    self._trip()
+                return
+
+            if state == CLOSED and len(self._window) >= self.min_calls:
+                failures = sum(1 for ok, _ in self._window if not ok)
+                if failures / len(self._window) >= self.failure_rate_threshold:
+                    self._trip()
+
+    def _trip(self) -> None:
+        """Open the breaker (lock held)."""
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+        print(f"[Circuit Breaker] {self.provider}/{self.operation} OPEN for {self.open_seconds}s")
+
+    # ===========================================
+    # METRICS
+    # ===========================================
+
+    def p95_latency_ms(self) -> Optional[int]:
+        """p95 latency of recent successful calls (None until enough samples)."""
+        with self._lock:
+            latencies = sorted(ms for ok, ms in self._window if ok and ms is not None)
+
+        if len(latencies) < self.min_calls:
+            return None
+        return latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Breaker state for the admin health endpoints."""
+        with self._lock:
+            state = self._current_state()
+            calls = len(self._window)
+            failures = sum(1 for ok, _ in self._window if not ok)
+            opened_at = self._opened_at
+
+        return {
+            "provider": self.provider,
+            "operation": self.operation,
+            "state": state,
+            "window_calls": calls,
+            "failure_rate": round(failures / calls, 2) if calls else 0.0,
+            "p95_latency_ms": self.p95_latency_ms(),
+            "rejected": self.rejected,
+            "hedged": self.hedged,
+            "times_opened": self.times_opened,
+            "retry_in_seconds": (
+                round(max(0.0, self.open_seconds - (time.monotonic() - opened_at)), 1)
+                if state == OPEN else None
+            ),
+        }
+
+
+class CircuitBreakerRegistry:
+    """Lazily created breakers keyed by (provider, operation)."""
+
+    def __init__(self):
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, provider: str, operation: str) -> CircuitBreaker:
+        key = (provider, operation)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    slow_call_ms = (
+                        settings.GROQ_SLOW_CALL_MS if provider == "groq"
+                        else settings.GEMINI_SLOW_CALL_MS
+                    )
+                    breaker = CircuitBreaker(provider, operation, slow_call_ms)
+                    self._breakers[key] = breaker
+        return breaker
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All breakers, plus a per-provider rollup."""
+        breakers = [breaker.snapshot() for breaker in list(self._breakers.values())]
+        providers = {}
+        for item in breakers:
+            summary = providers.setdefault(item["provider"], {"open": 0, "half_open": 0, "closed": 0})
+            summary[item["state"]] += 1
+
+        return {
+            "providers": providers,
+            "breakers": sorted(breakers, key=lambda b: (b["provider"], b["operation"])),
+        }
+
+
+# ===========================================
+# REGISTRY INSTANCE
+# ===========================================
+
+circuit_breakers = CircuitBreakerRegistry()
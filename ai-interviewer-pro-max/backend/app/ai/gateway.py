@@ -0,0 +1,538 @@
+"""
+AI Gateway
+
+Single async entry point for every Groq and Gemini call made by the services.
+
+- Native async transports (AsyncGroq over a pooled httpx client,
+  Gemini generate_content_async over gRPC asyncio) - calls never block
+  the event loop
+- Every call is timed and recorded in the AI API log (write-behind,
+  see app.admin.ai_log_sink)
+- Every call is bounded by the provider timeout and the request
+  deadline; expiry raises AITimeoutError and is logged as "timeout"
+- A circuit breaker per provider/operation rejects calls immediately
+  (CircuitOpenError) while the provider is failing or slow
+- Latency-critical Groq calls can be hedged after the observed p95
+- The model for each operation comes from the SLO-driven model router
+- Calls can be recorded to / replayed from a cassette for offline,
+  deterministic benchmarking (see app.ai.cassette)
+- Provider errors are raised to the caller so each service keeps its
+  own deterministic fallback path
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, AsyncIterator, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.deadline import Deadline, AITimeoutError
+from app.ai.registry import ai_client_registry, AIClientRegistry
+from app.ai.model_router import model_router, ModelRouter
+from app.ai.circuit_breaker import circuit_breakers, CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+from app.ai.cassette import ai_cassette, AICassette
+
+
+@dataclass
+class AIResponse:
+    """Normalized result of a single AI call."""
+
+    text: str
+    provider: str
+    model: str
+    response_time_ms: int
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    total_tokens: Optional[int] = None
+
+
+class AIGateway:
+    """
+    Shared async gateway for Groq (fast) and Gemini (deep) operations.
+
+    Usage:
+        response = await ai_gateway.groq_chat(messages, "generate_acknowledgment", db=self.db)
+        response = await ai_gateway.gemini_generate(prompt, "ats_analysis", db=self.db)
+        async for text in ai_gateway.gemini_stream(prompt, "generate_interview_plan"):
+            ...
+    """
+
+    def __init__(
+        self,
+        registry: AIClientRegistry = ai_client_registry,
+        breakers: CircuitBreakerRegistry = circuit_breakers,
+        router: ModelRouter = model_router,
+        cassette: AICassette = ai_cassette,
+    ):
+        self.registry = registry
+        self.breakers = breakers
+        self.router = router
+        self.cassette = cassette
+        self.groq = registry.groq
+        self.gemini = registry.gemini
+
+    def is_groq_configured(self) -> bool:
+        """Check if Groq API is configured (or calls are replayed)."""
+        return self.cassette.replaying or self.groq.is_configured()
+
+    def is_gemini_configured(self) -> bool:
+        """Check if Gemini API is configured (or calls are replayed)."""
+        return self.cassette.replaying or self.gemini.is_configured()
+
+    # ===========================================
+    # GROQ
+    # ===========================================
+
+    async def groq_chat(
+        self,
+        messages: List[Dict[str, str]],
+        operation: str,
+        max_tokens: int = 150,
+        temperature: float = 0.7,
+        model: Optional[str] = None,
+        db: Optional[Session] = None,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+        hedge: bool = False,
+    ) -> AIResponse:
+        """
+        Run a Groq chat completion.
+
+        hedge: Send a backup request if the first one is slower than the
+            operation's p95 (only when GROQ_HEDGE_ENABLED)
+
+        Raises:
+            CircuitOpenError: Breaker open - use the fallback right away
+            AITimeoutError: Deadline/timeout expired (already logged)
+            Exception: Provider/transport errors (already logged)
+        """
+        if self.cassette.replaying:
+            return await self._replay(
+                "groq", operation, messages, settings.GROQ_TIMEOUT_SECONDS,
+                db, user_id, session_id, deadline,
+            )
+
+        model = model or self.router.resolve("groq", operation) or self.groq.model
+        breaker = self._acquire("groq", operation)
+        start_time = time.time()
+
+        def call():
+            return self.groq.chat_completion(
+                messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                model=model,
+            )
+
+        try:
+            response = await self._with_timeout(
+                self._hedged(call, breaker) if hedge else call(),
+                settings.GROQ_TIMEOUT_SECONDS,
+                deadline,
+            )
+        except AITimeoutError as e:
+            breaker.record_failure(self._elapsed_ms(start_time))
+            self._log_timeout(db, "groq", operation, model, start_time, e, user_id, session_id)
+            raise
+        except asyncio.CancelledError:
+            breaker.record_cancelled()
+            raise
+        except Exception as e:
+            breaker.record_failure(self._elapsed_ms(start_time))
+            self._log(
+                db, "groq", operation, model,
+                response_time_ms=self._elapsed_ms(start_time),
+                status="error",
+                error_message=str(e)[:500],
+                user_id=user_id,
+                session_id=session_id,
+            )
+            raise
+
+        usage = getattr(response, "usage", None)
+        result = AIResponse(
+            text=(response.choices[0].message.content or "").strip(),
+            provider="groq",
+            model=model,
+            response_time_ms=int((time.time() - start_time) * 1000),
+            prompt_tokens=getattr(usage, "prompt_tokens", None),
+            completion_tokens=getattr(usage, "completion_tokens", None),
+            total_tokens=getattr(usage, "total_tokens", None),
+        )
+        breaker.record_success(result.response_time_ms)
+        self._log_response(db, operation, result, user_id, session_id)
+        if self.cassette.recording:
+            self.cassette.record("groq", operation, messages, result)
+        return result
+
+    # ===========================================
+    # GEMINI
+    # ===========================================
+
+    async def gemini_generate(
+        self,
+        prompt: str,
+        operation: str,
+        model: Optional[str] = None,
+        db: Optional[Session] = None,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> AIResponse:
+        """
+        Run a Gemini content generation.
+
+        Raises:
+            CircuitOpenError: Breaker open - use the fallback right away
+            AITimeoutError: Deadline/timeout expired (already logged)
+            Exception: Provider/transport errors (already logged)
+        """
+        if self.cassette.replaying:
+            return await self._replay(
+                "gemini", operation, prompt, settings.GEMINI_TIMEOUT_SECONDS,
+                db, user_id, session_id, deadline,
+            )
+
+        model = model or self.router.resolve("gemini", operation) or self.gemini.model
+        breaker = self._acquire("gemini", operation)
+        start_time = time.time()
+
+        try:
+            response = await self._with_timeout(
+                self.gemini.generate_content(prompt, model=model),
+                settings.GEMINI_TIMEOUT_SECONDS,
+                deadline,
+            )
+            text = response.text
+        except AITimeoutError as e:
+            breaker.record_failure(self._elapsed_ms(start_time))
+            self._log_timeout(db, "gemini", operation, model, start_time, e, user_id, session_id)
+            raise
+        except asyncio.CancelledError:
+            breaker.record_cancelled()
+            raise
+        except Exception as e:
+            breaker.record_failure(self._elapsed_ms(start_time))
+            self._log(
+                db, "gemini", operation, model,
+                response_time_ms=self._elapsed_ms(start_time),
+                status="error",
+                error_message=str(e)[:500],
+                user_id=user_id,
+                session_id=session_id,
+            )
+            raise
+
+        usage = getattr(response, "usage_metadata", None)
+        result = AIResponse(
+            text=text,
+            provider="gemini",
+            model=model,
+            response_time_ms=int((time.time() - start_time) * 1000),
+            prompt_tokens=getattr(usage, "prompt_token_count", None),
+            completion_tokens=getattr(usage, "candidates_token_count", None),
+            total_tokens=getattr(usage, "total_token_count", None),
+        )
+        breaker.record_success(result.response_time_ms)
+        self._log_response(db, operation, result, user_id, session_id)
+        if self.cassette.recording:
+            self.cassette.record("gemini", operation, prompt, result)
+        return result
+
+    async def gemini_stream(
+        self,
+        prompt: str,
+        operation: str,
+        model: Optional[str] = None,
+        db: Optional[Session] = None,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Run a Gemini content generation, yielding text as it is produced.
+
+        The whole stream (first chunk to last) is bounded by the provider
+        timeout and the deadline, and is logged once, when it ends.
+        Replays yield the recorded response as a single chunk.
+
+        Raises:
+            CircuitOpenError: Breaker open - use the fallback right away
+            AITimeoutError: Deadline/timeout expired mid-stream (already logged)
+            Exception: Provider/transport errors (already logged)
+        """
+        if self.cassette.replaying:
+            result = await self._replay(
+                "gemini", operation, prompt, settings.GEMINI_TIMEOUT_SECONDS,
+                db, user_id, session_id, deadline,
+            )
+            yield result.text
+            return
+
+        model = model or self.router.resolve("gemini", operation) or self.gemini.model
+        breaker = self._acquire("gemini", operation)
+        start_time = time.time()
+        timeout = deadline.timeout_for(settings.GEMINI_TIMEOUT_SECONDS) if deadline is not None else settings.GEMINI_TIMEOUT_SECONDS
+        expires_at = time.monotonic() + timeout
+
+        stream = self.gemini.generate_content_stream(prompt, model=model)
+        parts: List[str] = []
+        usage = None
+        try:
+            while True:
+                remaining = expires_at - time.monotonic()
+                if remaining <= 0:
+                    raise AITimeoutError(f"AI stream exceeded {timeout:.1f}s")
+                try:
+                    chunk = await asyncio.wait_for(stream.__anext__(), timeout=remaining)
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    raise AITimeoutError(f"AI stream exceeded {timeout:.1f}s")
+
+                usage = getattr(chunk, "usage_metadata", None) or usage
+                text = chunk.text or ""
+                if text:
+                    parts.append(text)
+                    yield text
+        except AITimeoutError as e:
+            breaker.record_failure(self._elapsed_ms(start_time))
+            self._log_timeout(db, "gemini", operation, model, start_time, e, user_id, session_id)
+            raise
+        except (asyncio.CancelledError, GeneratorExit):
+            # Consumer stopped early or was cancelled
+            breaker.record_cancelled()
+            raise
+        except Exception as e:
+            breaker.record_failure(self._elapsed_ms(start_time))
+            self._log(
+                db, "gemini", operation, model,
+                response_time_ms=self._elapsed_ms(start_time),
+                status="error",
+                error_message=str(e)[:500],
+                user_id=user_id,
+                session_id=session_id,
+            )
+            raise
+        finally:
+            await stream.aclose()
+
+        result = AIResponse(
+            text="".join(parts),
+            provider="gemini",
+            model=model,
+            response_time_ms=self._elapsed_ms(start_time),
+            prompt_tokens=getattr(usage, "prompt_token_count", None),
+            completion_tokens=getattr(usage, "candidates_token_count", None),
+            total_tokens=getattr(usage, "total_token_count", None),
+        )
+        breaker.record_success(result.response_time_ms)
+        self._log_response(db, operation, result, user_id, session_id)
+        if self.cassette.recording:
+            self.cassette.record("gemini", operation, prompt, result)
+
+    # ===========================================
+    # REPLAY
+    # ===========================================
+
+    async def _replay(
+        self,
+        provider: str,
+        operation: str,
+        payload: Any,
+        cap: float,
+        db: Optional[Session],
+        user_id: Optional[str],
+        session_id: Optional[str],
+        deadline: Optional[Deadline],
+    ) -> AIResponse:
+        """
+        Serve a call from the cassette.
+
+        Timeouts and deadlines still apply to the simulated latency;
+        breakers and hedging are bypassed so replays stay deterministic.
+
+        Raises:
+            CassetteMissError: Call was never recorded (already logged)
+            AITimeoutError: Simulated latency exceeded the deadline (already logged)
+        """
+        start_time = time.time()
+        try:
+            entry = self.cassette.lookup(operation, payload)
+        except Exception as e:
+            self._log(
+                db, provider, operation, "cassette",
+                response_time_ms=0,
+                status="error",
+                error_message=str(e)[:500],
+                user_id=user_id,
+                session_id=session_id,
+            )
+            raise
+
+        model = entry.get("model") or "cassette"
+        try:
+            await self._with_timeout(
+                asyncio.sleep(self.cassette.replay_latency_ms(entry) / 1000),
+                cap,
+                deadline,
+            )
+        except AITimeoutError as e:
+            self._log_timeout(db, provider, operation, model, start_time, e, user_id, session_id)
+            raise
+
+        result = AIResponse(
+            text=entry.get("response") or "",
+            provider=provider,
+            model=model,
+            response_time_ms=self._elapsed_ms(start_time),
+            prompt_tokens=entry.get("prompt_tokens"),
+            completion_tokens=entry.get("completion_tokens"),
+            total_tokens=entry.get("total_tokens"),
+        )
+        self._log_response(db, operation, result, user_id, session_id)
+        return result
+
+    # ===========================================
+    # CIRCUIT BREAKERS, HEDGING & TIMEOUTS
+    # ===========================================
+
+    def _acquire(self, provider: str, operation: str) -> CircuitBreaker:
+        """Get the operation's breaker, rejecting the call if it is open."""
+        breaker = self.breakers.get(provider, operation)
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"{provider}/{operation} circuit open - using fallback")
+        return breaker
+
+    @staticmethod
+    def _elapsed_ms(start_time: float) -> int:
+        return int((time.time() - start_time) * 1000)
+
+    async def _hedged(self, call, breaker: CircuitBreaker):
+        """
+        Run call(); if it has not answered within the operation's p95
+        latency, start a second identical request and take whichever
+        succeeds first. The loser is cancelled.
+        """
+        p95 = breaker.p95_latency_ms()
+        if not settings.GROQ_HEDGE_ENABLED or p95 is None:
+            return await call()
+
+        delay = max(p95, settings.GROQ_HEDGE_MIN_DELAY_MS) / 1000
+        tasks = [asyncio.ensure_future(call())]
+
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                breaker.hedged += 1
+                tasks.append(asyncio.ensure_future(call()))
+
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _with_timeout(self, coro, cap: float, deadline: Optional[Deadline]):
+        """Await a provider call within min(cap, deadline remaining)."""
+        timeout = deadline.timeout_for(cap) if deadline is not None else cap
+
+        if timeout <= 0:
+            coro.close()
+            raise AITimeoutError("Request deadline already expired")
+
+        try:
+            return await asyncio.wait_for(coro, timeout=timeout)
+        except AITimeoutError:
+            raise
+        except asyncio.TimeoutError:
+            raise AITimeoutError(f"AI call exceeded {timeout:.1f}s")
+
+    # ===========================================
+    # LOGGING & LIFECYCLE
+    # ===========================================
+
+    def _log_timeout(
+        self,
+        db: Optional[Session],
+        provider: str,
+        operation: str,
+        model: str,
+        start_time: float,
+        error: Exception,
+        user_id: Optional[str],
+        session_id: Optional[str],
+    ) -> None:
+        """Record a call cut off by its timeout or the request deadline."""
+        self._log(
+            db, provider, operation, model,
+            response_time_ms=int((time.time() - start_time) * 1000),
+            status="timeout",
+            error_message=str(error)[:500],
+            user_id=user_id,
+            session_id=session_id,
+        )
+
+    def _log_response(
+        self,
+        db: Optional[Session],
+        operation: str,
+        result: AIResponse,
+        user_id: Optional[str],
+        session_id: Optional[str],
+    ) -> None:
+        """Record a successful call."""
+        self._log(
+            db, result.provider, operation, result.model,
+            prompt_tokens=result.prompt_tokens,
+            completion_tokens=result.completion_tokens,
+            total_tokens=result.total_tokens,
+            response_time_ms=result.response_time_ms,
+            status="success",
+            user_id=user_id,
+            session_id=session_id,
+        )
+
+    def _log(
+        self,
+        db: Optional[Session],
+        provider: str,
+        operation: str,
+        model: str,
+        **fields: Any,
+    ) -> None:
+        """Queue an AI API log row. Logging failures never break the call."""
+        try:
+            from app.admin.service import AIAPILogService
+            AIAPILogService.log_ai_call(
+                db=db,
+                provider=provider,
+                operation=operation,
+                model=model,
+                **fields,
+            )
+        except Exception as log_error:
+            print(f"[AI Log Error] Failed to log {provider} call: {log_error}")
+
+    async def aclose(self) -> None:
+        """Release pooled connections (application shutdown)."""
+        await self.groq.aclose()
+        self.gemini.reset()
+
+
+# ===========================================
+# GATEWAY INSTANCE
+# ===========================================
+
+ai_gateway = AIGateway()
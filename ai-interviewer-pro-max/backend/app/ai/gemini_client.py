@@ -15,12 +15,16 @@ Per AI Responsibility Contract (Step 4):
 - All outputs must be structured (JSON-friendly)
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional
 import json
 
 from app.core.config import settings
 
 
+# Default model used by every Gemini operation
+DEFAULT_GEMINI_MODEL = "gemini-pro"
+
+
 class GeminiClient:
     """
     Client for Gemini API interactions.
@@ -47,34 +51,86 @@ class GeminiClient:
         - Any operation requiring < 2s response
     """
     
-    def __init__(self):
-        """Initialize Gemini client."""
-        self.api_key = settings.GEMINI_API_KEY
-        self.model = "gemini-pro"  # TODO: Configure model version
-        self._client = None
+    def __init__(self, api_key: Optional[str] = None):
+        """Initialize Gemini client (model handles are built on first use)."""
+        self.model = DEFAULT_GEMINI_MODEL
+        # (api_key, {model_name: GenerativeModel}) - swapped as one reference
+        self._active = (settings.GEMINI_API_KEY if api_key is None else api_key, None)
+    
+    @property
+    def api_key(self) -> str:
+        """Active API key (.env value or database override)."""
+        return self._active[0]
+    
+    def _build_models(self, api_key: str) -> Dict[str, Any]:
+        """Configure genai for a key and build the default model handle."""
+        import google.generativeai as genai
+        
+        genai.configure(api_key=api_key)
+        return {self.model: genai.GenerativeModel(self.model)}
+    
+    def configure(self, api_key: str) -> None:
+        """
+        Switch to a new API key.
         
-    def _get_client(self):
+        Model handles for the new key are built before the swap; handles
+        already serving in-flight requests keep their own channel.
         """
-        Get or create Gemini client instance.
+        models = self._build_models(api_key) if api_key else None
+        self._active = (api_key, models)
+    
+    def _get_client(self, model: Optional[str] = None):
+        """
+        Get or create a Gemini model handle.
         
-        TODO:
-            - Initialize google.generativeai client
-            - Configure with API key
+        genai is configured once per API key. Each model handle lazily
+        opens a single gRPC asyncio channel that is multiplexed across
+        all concurrent requests, so calls never block the event loop.
         """
-        if not self.api_key:
+        api_key, models = self._active
+        if not api_key:
             raise ValueError("GEMINI_API_KEY not configured")
         
-        # TODO: Initialize actual client
-        # import google.generativeai as genai
-        # genai.configure(api_key=self.api_key)
-        # self._client = genai.GenerativeModel(self.model)
+        if models is None:
+            models = self._build_models(api_key)
+            self._active = (api_key, models)
         
-        return self._client
+        model_name = model or self.model
+        if model_name not in models:
+            import google.generativeai as genai
+            models[model_name] = genai.GenerativeModel(model_name)
+        
+        return models[model_name]
     
     def is_configured(self) -> bool:
         """Check if Gemini API is configured."""
         return bool(self.api_key)
     
+    async def generate_content(self, prompt: str, model: Optional[str] = None) -> Any:
+        """
+        Generate content on the async transport.
+        
+        Returns the raw SDK response (text + usage_metadata when available).
+        """
+        client = self._get_client(model)
+        return await client.generate_content_async(prompt)
+    
+    async def generate_content_stream(self, prompt: str, model: Optional[str] = None) -> AsyncIterator[Any]:
+        """
+        Generate content as a stream of partial responses.
+        
+        Yields the raw SDK chunks (each with .text; the last one carries
+        usage_metadata when available).
+        """
+        client = self._get_client(model)
+        response = await client.generate_content_async(prompt, stream=True)
+        async for chunk in response:
+            yield chunk
+    
+    def reset(self) -> None:
+        """Drop cached model handles (application shutdown)."""
+        self._active = (self.api_key, None)
+    
     # ===========================================
     # G01: RESUME SEMANTIC PARSING
     # ===========================================
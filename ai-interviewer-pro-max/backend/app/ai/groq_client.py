@@ -14,11 +14,24 @@ Per AI Responsibility Contract (Step 4):
 - Outputs must be concise and predictable
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+import httpx
 
 from app.core.config import settings
 
 
+# Default model (mixtral-8x7b-32768 is decommissioned)
+DEFAULT_GROQ_MODEL = "llama-3.1-8b-instant"
+
+# Keep-alive pool shared by every Groq request in this worker
+GROQ_HTTP_LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+
 class GroqClient:
     """
     Client for Groq API interactions.
@@ -42,33 +55,87 @@ class GroqClient:
         - Any operation requiring > 5s response
     """
     
-    def __init__(self):
-        """Initialize Groq client."""
-        self.api_key = settings.GROQ_API_KEY
-        self.model = "llama-3.1-8b-instant"  # Updated: mixtral-8x7b-32768 is decommissioned
-        self._client = None
+    def __init__(self, api_key: Optional[str] = None):
+        """Initialize Groq client (the SDK client is built on first use)."""
+        self.model = DEFAULT_GROQ_MODEL
+        self._http_client = None
+        # (api_key, AsyncGroq) - swapped as one reference on key changes
+        self._active = (settings.GROQ_API_KEY if api_key is None else api_key, None)
+    
+    @property
+    def api_key(self) -> str:
+        """Active API key (.env value or database override)."""
+        return self._active[0]
+    
+    def _build_client(self, api_key: str):
+        """Build an AsyncGroq client on the shared keep-alive pool."""
+        from groq import AsyncGroq
+        
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(limits=GROQ_HTTP_LIMITS)
+        
+        return AsyncGroq(api_key=api_key, http_client=self._http_client)
+    
+    def configure(self, api_key: str) -> None:
+        """
+        Switch to a new API key.
+        
+        The replacement client is fully built before it is swapped in, so
+        concurrent requests see either the old or the new client - never
+        a half-configured one. In-flight requests finish on the old client.
+        """
+        client = self._build_client(api_key) if api_key else None
+        self._active = (api_key, client)
     
     def _get_client(self):
         """
-        Get or create Groq client instance.
+        Get or create the async Groq client.
         
-        TODO:
-            - Initialize groq client
-            - Configure with API key
+        The client is built once per API key on top of a pooled
+        keep-alive httpx transport, so requests reuse TLS connections
+        and never block the event loop.
         """
-        if not self.api_key:
+        api_key, client = self._active
+        if not api_key:
             raise ValueError("GROQ_API_KEY not configured")
         
-        # TODO: Initialize actual client
-        # from groq import Groq
-        # self._client = Groq(api_key=self.api_key)
+        if client is None:
+            client = self._build_client(api_key)
+            self._active = (api_key, client)
         
-        return self._client
+        return client
     
     def is_configured(self) -> bool:
         """Check if Groq API is configured."""
         return bool(self.api_key)
     
+    async def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 150,
+        temperature: float = 0.7,
+        model: Optional[str] = None,
+    ) -> Any:
+        """
+        Run a chat completion on the async transport.
+        
+        Returns the raw SDK response (choices + usage).
+        """
+        client = self._get_client()
+        return await client.chat.completions.create(
+            model=model or self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+    
+    async def aclose(self) -> None:
+        """Close pooled connections (application shutdown)."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+        self._http_client = None
+        self._active = (self.api_key, None)
+    
     # ===========================================
     # Q01: QUESTION PRESENTATION FORMATTING
     # ===========================================
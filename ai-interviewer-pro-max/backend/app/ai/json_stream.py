@@ -0,0 +1,97 @@
+"""
+Incremental JSON Array Parser
+
+Pulls complete items out of one array of a JSON document while the
+document is still being streamed, e.g. the "questions" of a plan:
+
+    parser = JSONArrayStreamParser("questions")
+    async for chunk in ai_gateway.gemini_stream(prompt, "generate_interview_plan"):
+        for question in parser.feed(chunk):
+            ...
+
+- Scans each character once (string and escape aware), so nested
+  objects, brackets inside strings and markdown code fences are handled
+- An object (or array) item is handed out as soon as its closing
+  brace/bracket arrives, parsed with json.loads; an item that does not
+  parse is skipped
+- Everything outside the array is ignored (parse the full text with
+  json.loads once the stream ends for the other fields)
+"""
+
+import json
+import re
+from typing import Any, List
+
+
+class JSONArrayStreamParser:
+    """Yields the items of the array under `key` as they complete."""
+
+    def __init__(self, key: str):
+        self._key_pattern = re.compile(r'(?<!\\)"' + re.escape(key) + r'"\s*:\s*\[')
+        self._buffer = ""
+        self._pos = 0
+        self._in_array = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._item_start = None
+        self.done = False
+        self.skipped = 0
+
+    def feed(self, chunk: str) -> List[Any]:
+        """Add streamed text; returns the items completed by it."""
+        self._buffer += chunk
+        items = []
+        if self.done or not chunk:
+            return items
+
+        if not self._in_array:
+            match = self._key_pattern.search(self._buffer)
+            if match is None:
+                return items
+            self._in_array = True
+            self._pos = match.end()
+
+        buffer = self._buffer
+        for i in range(self._pos, len(buffer)):
+            char = buffer[i]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if self._depth == 0:
+                    self._item_start = i
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == 0:
+                    # Closing bracket of the array itself
+                    self.done = True
+                    self._pos = i + 1
+                    return items
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(buffer[self._item_start:i + 1], items)
+                    self._item_start = None
+
+        self._pos = len(buffer)
+        return items
+
+    def _emit(self, text: str, items: List[Any]) -> None:
+        try:
+            items.append(json.loads(text))
+        except json.JSONDecodeError:
+            self.skipped += 1
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return self._buffer
@@ -0,0 +1,310 @@
+"""
+AI Model Router
+
+SLO-driven model selection per named AI operation.
+
+- Each operation maps to a ranked list of models (preferred first), each
+  with a p95 latency SLO in milliseconds
+- Rolling p95 latency per (operation, model) is computed from the
+  AIAPILog table (successful calls within ROUTER_WINDOW_MINUTES)
+- When the active model's p95 breaches its SLO, traffic moves to the next
+  model in the list; it moves back up once the preferred model's p95 is
+  under ROUTER_RECOVERY_RATIO * SLO again (or its samples age out)
+- The table is editable from the admin panel and persisted in
+  SystemSettings ("ai_model_routes"); edits override the defaults below
+- resolve() only reads the cached p95 map: when it is older than
+  ROUTER_REFRESH_SECONDS, the AIAPILog query runs in a worker thread
+  (asyncio.to_thread) and the call keeps the current routing meanwhile
+"""
+
+import asyncio
+import copy
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+
+from app.core.config import settings
+from app.ai.groq_client import DEFAULT_GROQ_MODEL
+from app.ai.gemini_client import DEFAULT_GEMINI_MODEL
+
+
+ROUTES_SETTING_KEY = "ai_model_routes"
+
+GEMINI_FAST_MODEL = "gemini-1.5-flash"
+
+# Ranked models per operation (preferred first). The first entry is the
+# model every operation used before routing existed.
+DEFAULT_ROUTES: Dict[str, Dict[str, Any]] = {
+    # Groq - real-time
+    "generate_greeting": {"provider": "groq", "models": [
+        {"model": DEFAULT_GROQ_MODEL, "slo_ms": 1500},
+    ]},
+    "generate_acknowledgment": {"provider": "groq", "models": [
+        {"model": DEFAULT_GROQ_MODEL, "slo_ms": 1200},
+    ]},
+    "check_answer_relevance": {"provider": "groq", "models": [
+        {"model": DEFAULT_GROQ_MODEL, "slo_ms": 1200},
+    ]},
+    "pressure_follow_up": {"provider": "groq", "models": [
+        {"model": DEFAULT_GROQ_MODEL, "slo_ms": 1500},
+    ]},
+    "stress_mode_question": {"provider": "groq", "models": [
+        {"model": DEFAULT_GROQ_MODEL, "slo_ms": 2000},
+    ]},
+    "quick_answer_evaluation": {"provider": "groq", "models": [
+        {"model": DEFAULT_GROQ_MODEL, "slo_ms": 1500},
+    ]},
+    # Gemini - deep
+    "ats_analysis": {"provider": "gemini", "models": [
+        {"model": DEFAULT_GEMINI_MODEL, "slo_ms": 15000},
+        {"model": GEMINI_FAST_MODEL, "slo_ms": 8000},
+    ]},
+    "generate_interview_plan": {"provider": "gemini", "models": [
+        {"model": DEFAULT_GEMINI_MODEL, "slo_ms": 20000},
+        {"model": GEMINI_FAST_MODEL, "slo_ms": 10000},
+    ]},
+    "generate_pressure_questions": {"provider": "gemini", "models": [
+        {"model": DEFAULT_GEMINI_MODEL, "slo_ms": 20000},
+        {"model": GEMINI_FAST_MODEL, "slo_ms": 10000},
+    ]},
+    "deep_answer_evaluation": {"provider": "gemini", "models": [
+        {"model": DEFAULT_GEMINI_MODEL, "slo_ms": 15000},
+        {"model": GEMINI_FAST_MODEL, "slo_ms": 8000},
+    ]},
+    "batch_deep_answer_evaluation": {"provider": "gemini", "models": [
+        {"model": DEFAULT_GEMINI_MODEL, "slo_ms": 30000},
+        {"model": GEMINI_FAST_MODEL, "slo_ms": 15000},
+    ]},
+    "behavioral_analysis": {"provider": "gemini", "models": [
+        {"model": DEFAULT_GEMINI_MODEL, "slo_ms": 20000},
+        {"model": GEMINI_FAST_MODEL, "slo_ms": 10000},
+    ]},
+    "generate_report_narrative": {"provider": "gemini", "models": [
+        {"model": DEFAULT_GEMINI_MODEL, "slo_ms": 30000},
+        {"model": GEMINI_FAST_MODEL, "slo_ms": 15000},
+    ]},
+    "generate_career_roadmap": {"provider": "gemini", "models": [
+        {"model": DEFAULT_GEMINI_MODEL, "slo_ms": 20000},
+        {"model": GEMINI_FAST_MODEL, "slo_ms": 10000},
+    ]},
+}
+
+
+def validate_route(route: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate and normalize one routing table entry.
+
+    Raises:
+        ValueError: Invalid provider, empty model list or bad SLO
+    """
+    provider = route.get("provider")
+    if provider not in ("groq", "gemini"):
+        raise ValueError("provider must be 'groq' or 'gemini'")
+
+    models = route.get("models") or []
+    if not models:
+        raise ValueError("At least one model is required")
+
+    normalized = []
+    for entry in models:
+        model = str(entry.get("model", "")).strip()
+        if not model:
+            raise ValueError("Model name cannot be empty")
+        slo_ms = int(entry.get("slo_ms", 0))
+        if slo_ms <= 0:
+            raise ValueError(f"slo_ms must be positive for model '{model}'")
+        normalized.append({"model": model, "slo_ms": slo_ms})
+
+    return {"provider": provider, "models": normalized}
+
+
+class ModelRouter:
+    """Picks the model for each AI operation based on observed p95 latency."""
+
+    def __init__(self):
+        self._routes: Dict[str, Dict[str, Any]] = copy.deepcopy(DEFAULT_ROUTES)
+        self._overridden: set = set()
+        # operation -> index of the active model in its ranked list
+        self._active: Dict[str, int] = {}
+        # (operation, model) -> (p95_ms, samples)
+        self._p95: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        self._refreshed_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+
+    # ===========================================
+    # ROUTING
+    # ===========================================
+
+    def resolve(self, provider: str, operation: str) -> Optional[str]:
+        """
+        Model to use for an operation, or None if the operation has no
+        route for this provider (the client default applies).
+        """
+        route = self._routes.get(operation)
+        if not route or route["provider"] != provider:
+            return None
+
+        self._refresh_if_stale()
+
+        with self._lock:
+            index = self._select(operation, route["models"])
+            return route["models"][index]["model"]
+
+    def current_model(self, provider: str, operation: str) -> Optional[str]:
+        """Active model for an operation without triggering a refresh."""
+        route = self._routes.get(operation)
+        if not route or route["provider"] != provider:
+            return None
+        index = min(self._active.get(operation, 0), len(route["models"]) - 1)
+        return route["models"][index]["model"]
+
+    def _select(self, operation: str, models: List[Dict[str, Any]]) -> int:
+        """Apply SLO demotion / recovery promotion (lock held)."""
+        current = min(self._active.get(operation, 0), len(models) - 1)
+
+        # Move back up: the best-ranked model that has recovered
+        for index in range(current):
+            if self._within_slo(operation, models[index], settings.ROUTER_RECOVERY_RATIO):
+                print(f"[Model Router] {operation}: {models[current]['model']} -> {models[index]['model']} (recovered)")
+                current = index
+                break
+
+        # Move down while the active model breaches its SLO
+        while current < len(models) - 1 and not self._within_slo(operation, models[current], 1.0):
+            print(f"[Model Router] {operation}: {models[current]['model']} -> {models[current + 1]['model']} (p95 over SLO)")
+            current += 1
+
+        self._active[operation] = current
+        return current
+
+    def _within_slo(self, operation: str, entry: Dict[str, Any], ratio: float) -> bool:
+        """True when p95 is under ratio * SLO, or there are too few samples to judge."""
+        p95, samples = self._p95.get((operation, entry["model"]), (None, 0))
+        if p95 is None or samples < settings.ROUTER_MIN_SAMPLES:
+            return True
+        return p95 <= entry["slo_ms"] * ratio
+
+    # ===========================================
+    # LATENCY WINDOW (from AIAPILog)
+    # ===========================================
+
+    def _refresh_if_stale(self) -> None:
+        """Refresh the p95 map when it is older than ROUTER_REFRESH_SECONDS, off the event loop."""
+        if time.monotonic() - self._refreshed_at < settings.ROUTER_REFRESH_SECONDS:
+            return
+        self._refreshed_at = time.monotonic()
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop in this thread (sync routes, scripts): nothing to block
+            self.refresh()
+            return
+
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = loop.create_task(
+                asyncio.to_thread(self.refresh), name="model-router-refresh"
+            )
+
+    def refresh(self) -> None:
+        """Recompute rolling p95 per (operation, model) from recent successful calls."""
+        from app.db.session import SessionLocal
+        from app.admin.models import AIAPILog
+
+        since = datetime.utcnow() - timedelta(minutes=settings.ROUTER_WINDOW_MINUTES)
+        latencies: Dict[Tuple[str, str], List[int]] = {}
+
+        db = SessionLocal()
+        try:
+            rows = db.query(
+                AIAPILog.operation, AIAPILog.model, AIAPILog.response_time_ms
+            ).filter(
+                AIAPILog.created_at >= since,
+                AIAPILog.status == "success",
+                AIAPILog.response_time_ms.isnot(None),
+                AIAPILog.operation.in_(list(self._routes.keys())),
+            ).all()
+        except Exception as e:
+            print(f"[Model Router] Latency refresh failed: {e}")
+            return
+        finally:
+            db.close()
+
+        for operation, model, response_time_ms in rows:
+            latencies.setdefault((operation, model), []).append(response_time_ms)
+
+        p95 = {}
+        for key, values in latencies.items():
+            values.sort()
+            p95[key] = (values[min(len(values) - 1, int(len(values) * 0.95))], len(values))
+
+        with self._lock:
+            self._p95 = p95
+
+    # ===========================================
+    # ROUTING TABLE (admin)
+    # ===========================================
+
+    def load_overrides(self, overrides: Dict[str, Any]) -> None:
+        """Apply persisted admin edits on top of the defaults."""
+        routes = copy.deepcopy(DEFAULT_ROUTES)
+        overridden = set()
+        for operation, route in (overrides or {}).items():
+            try:
+                routes[operation] = validate_route(route)
+                overridden.add(operation)
+            except (ValueError, TypeError, AttributeError) as e:
+                print(f"[Model Router] Ignoring invalid route for {operation}: {e}")
+
+        with self._lock:
+            self._routes = routes
+            self._overridden = overridden
+            self._active = {}
+
+    def load_from_db(self, db) -> None:
+        """Load persisted overrides (application startup / after edits)."""
+        from app.admin.service import SettingsService
+
+        raw = SettingsService.get_setting(db, ROUTES_SETTING_KEY, "")
+        if isinstance(raw, str):
+            raw = json.loads(raw) if raw else {}
+        self.load_overrides(raw)
+
+    def get_table(self) -> List[Dict[str, Any]]:
+        """Routing table with active model and observed p95 per model."""
+        self._refresh_if_stale()
+
+        table = []
+        with self._lock:
+            for operation, route in sorted(self._routes.items()):
+                active = min(self._active.get(operation, 0), len(route["models"]) - 1)
+                table.append({
+                    "operation": operation,
+                    "provider": route["provider"],
+                    "source": "override" if operation in self._overridden else "default",
+                    "active_model": route["models"][active]["model"],
+                    "models": [
+                        {
+                            **entry,
+                            "p95_ms": self._p95.get((operation, entry["model"]), (None, 0))[0],
+                            "samples": self._p95.get((operation, entry["model"]), (None, 0))[1],
+                        }
+                        for entry in route["models"]
+                    ],
+                })
+        return table
+
+    def get_overrides(self) -> Dict[str, Any]:
+        """Only the admin-edited routes (what gets persisted)."""
+        with self._lock:
+            return {op: copy.deepcopy(self._routes[op]) for op in self._overridden}
+
+
+# ===========================================
+# ROUTER INSTANCE
+# ===========================================
+
+model_router = ModelRouter()
@@ -0,0 +1,172 @@
+"""
+Token-Budgeted Prompt Builder
+
+Fills prompt sections up to an explicit per-operation token budget
+instead of cutting each input at an arbitrary character count.
+
+- The prompt is rendered once with every section empty to measure its
+  static part (instructions, JSON schema); that count is cached
+- Sections are then filled in priority order (keyword order), each taking
+  what is left of the budget, optionally capped per section
+- Every build reports tokens used vs. budget (printed and aggregated in
+  get_prompt_budget_stats for the admin panel)
+
+Usage:
+    prompt = build_prompt(
+        "ats_analysis",
+        lambda s: f"Analyze for {role}:\\n{s['resume_text']}\\n{s['job_description']}",
+        resume_text=resume_text,
+        job_description=target_description or "",
+        caps={"job_description": 150},
+    )
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from app.utils.token_counter import count_tokens, count_static_tokens, truncate_to_tokens
+
+
+# Per-message overhead of chat formats (role markers, separators)
+CHAT_MESSAGE_OVERHEAD = 4
+
+# Token budget per operation (whole prompt, static part included)
+PROMPT_BUDGETS: Dict[str, int] = {
+    # Groq - real-time (small prompts keep latency down)
+    "generate_acknowledgment": 700,
+    "check_answer_relevance": 400,
+    "pressure_follow_up": 650,
+    "quick_answer_evaluation": 600,
+    # Gemini - deep
+    "ats_analysis": 2000,
+    "deep_answer_evaluation": 2000,
+    "batch_deep_answer_evaluation": 6000,
+    "behavioral_analysis": 900,
+    "generate_interview_plan": 1800,
+    "generate_pressure_questions": 900,
+}
+
+DEFAULT_PROMPT_BUDGET = 1000
+
+Prompt = Union[str, List[Dict[str, str]]]
+
+
+def count_prompt_tokens(prompt: Prompt, static: bool = False) -> int:
+    """Token count of a text prompt or a list of chat messages."""
+    count = count_static_tokens if static else count_tokens
+    if isinstance(prompt, str):
+        return count(prompt)
+    return sum(count(m.get("content", "")) + CHAT_MESSAGE_OVERHEAD for m in prompt)
+
+
+def build_prompt(
+    operation: str,
+    render: Callable[[Dict[str, str]], Prompt],
+    caps: Optional[Dict[str, int]] = None,
+    budget: Optional[int] = None,
+    **sections: str,
+) -> Prompt:
+    """
+    Render a prompt with its sections fitted to the operation's budget.
+
+    Args:
+        operation: AI operation name (selects the budget)
+        render: Builds the prompt (str or chat messages) from section values
+        caps: Optional max tokens per section
+        budget: Override the operation's budget
+        **sections: Section name -> full text, highest priority first
+
+    Returns:
+        The rendered prompt
+    """
+    budget = budget or PROMPT_BUDGETS.get(operation, DEFAULT_PROMPT_BUDGET)
+    caps = caps or {}
+
+    # Static part: the prompt with every section empty (cached count)
+    static_tokens = count_prompt_tokens(render({name: "" for name in sections}), static=True)
+    remaining = max(0, budget - static_tokens)
+
+    fitted = {}
+    trimmed = []
+    for name, text in sections.items():
+        text = text or ""
+        allowance = min(remaining, caps.get(name, remaining))
+        tokens = count_tokens(text)
+        if tokens > allowance:
+            fitted[name] = truncate_to_tokens(text, allowance)
+            trimmed.append(f"{name} {tokens}->{allowance}")
+        else:
+            fitted[name] = text
+        remaining -= count_tokens(fitted[name])
+
+    prompt = render(fitted)
+    used = count_prompt_tokens(prompt)
+
+    # Text that only renders around a non-empty section (labels, headers)
+    # is not in the static count; take any overshoot from the last sections
+    for name in reversed(list(fitted)):
+        if used <= budget:
+            break
+        if not fitted[name]:
+            continue
+        tokens = count_tokens(fitted[name])
+        fitted[name] = truncate_to_tokens(fitted[name], tokens - (used - budget))
+        trimmed.append(f"{name} {tokens}->{count_tokens(fitted[name])}")
+        prompt = render(fitted)
+        used = count_prompt_tokens(prompt)
+    _record(operation, used, budget, static_tokens, bool(trimmed))
+
+    print(
+        f"[Prompt Budget] {operation}: {used}/{budget} tokens "
+        f"(static {static_tokens})" + (f" trimmed: {', '.join(trimmed)}" if trimmed else "")
+    )
+
+    return prompt
+
+
+# ===========================================
+# STATS
+# ===========================================
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, Dict[str, Any]] = {}
+
+
+def _record(operation: str, used: int, budget: int, static_tokens: int, was_trimmed: bool) -> None:
+    with _stats_lock:
+        entry = _stats.setdefault(operation, {
+            "calls": 0, "tokens_used": 0, "max_used": 0, "trimmed_calls": 0,
+        })
+        entry["calls"] += 1
+        entry["tokens_used"] += used
+        entry["max_used"] = max(entry["max_used"], used)
+        entry["budget"] = budget
+        entry["static_tokens"] = static_tokens
+        if was_trimmed:
+            entry["trimmed_calls"] += 1
+
+
+def get_prompt_budget_stats() -> List[Dict[str, Any]]:
+    """Average / max tokens used vs. budget per operation."""
+    with _stats_lock:
+        items = [(op, dict(entry)) for op, entry in _stats.items()]
+
+    return [
+        {
+            "operation": op,
+            "budget": entry["budget"],
+            "static_tokens": entry["static_tokens"],
+            "calls": entry["calls"],
+            "avg_used": round(entry["tokens_used"] / entry["calls"], 1),
+            "max_used": entry["max_used"],
+            "avg_utilization_percent": round(entry["tokens_used"] / entry["calls"] / entry["budget"] * 100, 1),
+            "trimmed_calls": entry["trimmed_calls"],
+        }
+        for op, entry in sorted(items)
+    ]
+
+
+def reset_prompt_budget_stats() -> None:
+    """Reset budget statistics."""
+    with _stats_lock:
+        _stats.clear()
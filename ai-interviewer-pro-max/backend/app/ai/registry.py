@@ -0,0 +1,97 @@
+"""
+AI Client Registry
+
+Process-wide owner of the Groq and Gemini clients.
+
+- One warmed client per provider (and per model for Gemini), shared by
+  every service through the AI gateway
+- Active API keys live here (.env value or admin database override);
+  the global settings object keeps the .env values only
+- Key changes from the admin panel rebuild the affected client and swap
+  it in atomically
+"""
+
+import threading
+from typing import Dict, Any, List, Optional
+
+from app.core.config import settings
+from app.ai.groq_client import groq_client, GroqClient
+from app.ai.gemini_client import gemini_client, GeminiClient
+
+
+class AIClientRegistry:
+    """Holds the shared provider clients and their active API keys."""
+
+    def __init__(self, groq: GroqClient = groq_client, gemini: GeminiClient = gemini_client):
+        self.groq = groq
+        self.gemini = gemini
+        self._lock = threading.Lock()
+        self._sources = {
+            "gemini": "env" if settings.GEMINI_API_KEY else "none",
+            "groq": "env" if settings.GROQ_API_KEY else "none",
+        }
+
+    def configure(
+        self,
+        gemini_api_key: Optional[str] = None,
+        groq_api_key: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Apply API key overrides.
+
+        None leaves a provider untouched; an empty string drops the
+        override and reverts to the .env value.
+
+        Returns:
+            Providers that were reconfigured
+        """
+        updated = []
+
+        with self._lock:
+            if gemini_api_key is not None:
+                self.gemini.configure(gemini_api_key or settings.GEMINI_API_KEY)
+                updated.append("gemini")
+                self._sources["gemini"] = self._source(gemini_api_key, settings.GEMINI_API_KEY)
+
+            if groq_api_key is not None:
+                self.groq.configure(groq_api_key or settings.GROQ_API_KEY)
+                updated.append("groq")
+                self._sources["groq"] = self._source(groq_api_key, settings.GROQ_API_KEY)
+
+        return updated
+
+    @staticmethod
+    def _source(override: str, env_value: str) -> str:
+        if override:
+            return "database"
+        return "env" if env_value else "none"
+
+    def is_groq_configured(self) -> bool:
+        """Check if Groq API is configured."""
+        return self.groq.is_configured()
+
+    def is_gemini_configured(self) -> bool:
+        """Check if Gemini API is configured."""
+        return self.gemini.is_configured()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Configured flag and key source per provider."""
+        return {
+            "gemini": {
+                "configured": self.is_gemini_configured(),
+                "source": self._sources["gemini"],
+                "model": self.gemini.model,
+            },
+            "groq": {
+                "configured": self.is_groq_configured(),
+                "source": self._sources["groq"],
+                "model": self.groq.model,
+            },
+        }
+
+
+# ===========================================
+# REGISTRY INSTANCE
+# ===========================================
+
+ai_client_registry = AIClientRegistry()
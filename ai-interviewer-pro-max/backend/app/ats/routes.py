@@ -16,8 +16,9 @@ from sqlalchemy.orm import Session
 from typing import Optional
 
 from app.db.session import get_db
+from app.core.deadline import Deadline
 from app.core.security import get_current_active_user
-from app.core.config import settings
+from app.ai.gateway import ai_gateway
 from app.ats.service import ATSService
 from app.ats.schemas import (
     ATSAnalyzeRequest,
@@ -95,7 +96,7 @@ async def analyze_resume(
     
     try:
         # Perform analysis
-        service = ATSService(db)
+        service = ATSService(db, deadline=Deadline.deep())
         analysis = await service.analyze_resume(
             resume=resume,
             user_id=current_user["id"],
@@ -364,10 +365,10 @@ async def get_ats_status(
     """
     return {
         "success": True,
-        "gemini_configured": settings.is_gemini_configured(),
-        "analysis_mode": "gemini" if settings.is_gemini_configured() else "mock",
+        "gemini_configured": ai_gateway.is_gemini_configured(),
+        "analysis_mode": "gemini" if ai_gateway.is_gemini_configured() else "mock",
         "message": (
-            "Real AI analysis available" if settings.is_gemini_configured()
+            "Real AI analysis available" if ai_gateway.is_gemini_configured()
             else "Using mock analysis (configure GEMINI_API_KEY for real analysis)"
         ),
     }
@@ -17,10 +17,11 @@ import re
 from typing import Dict, Any, List, Optional, Set
 from sqlalchemy.orm import Session
 
-from app.core.config import settings
+from app.core.deadline import Deadline
+from app.ai.gateway import ai_gateway
+from app.ai.prompt_builder import build_prompt
 from app.ats.models import ATSAnalysis
 from app.resumes.models import Resume
-from app.admin.service import AIAPILogService
 
 
 # ===========================================
@@ -326,26 +327,16 @@ class ATSService:
     Skills not relevant to target_role do NOT boost scores.
     """
     
-    def __init__(self, db: Session):
-        """Initialize ATS service with database session."""
-        self.db = db
-        self._gemini_client = None
-    
-    def _get_gemini_client(self):
-        """Get Gemini client if configured."""
-        if not settings.is_gemini_configured():
-            return None
+    def __init__(self, db: Session, deadline: Optional[Deadline] = None):
+        """
+        Initialize ATS service with database session.
         
-        if self._gemini_client is None:
-            try:
-                import google.generativeai as genai
-                genai.configure(api_key=settings.GEMINI_API_KEY)
-                self._gemini_client = genai.GenerativeModel('gemini-pro')
-            except Exception as e:
-                print(f"Failed to initialize Gemini client: {e}")
-                return None
-        
-        return self._gemini_client
+        Args:
+            db: Database session
+            deadline: Optional request deadline (bounds every AI call)
+        """
+        self.db = db
+        self.deadline = deadline
     
     def _get_role_taxonomy(self, target_role: str) -> Dict[str, Any]:
         """
@@ -755,9 +746,7 @@ class ATSService:
         """
         Analyze resume using Gemini API with STRICT role conditioning.
         """
-        client = self._get_gemini_client()
-        
-        if not client:
+        if not ai_gateway.is_gemini_configured():
             # Fallback to role-conditioned mock
             return self._generate_role_conditioned_analysis(resume_text, target_role)
         
@@ -765,8 +754,10 @@ class ATSService:
             # Get role taxonomy
             taxonomy = self._get_role_taxonomy(target_role)
             
-            # Build role-conditioned prompt
-            prompt = f"""You are an ATS (Applicant Tracking System) expert. Analyze this resume STRICTLY for the role: {target_role}
+            # Build role-conditioned prompt (JD capped, resume gets the rest of the budget)
+            prompt = build_prompt(
+                "ats_analysis",
+                lambda sections: f"""You are an ATS (Applicant Tracking System) expert. Analyze this resume STRICTLY for the role: {target_role}
 
 CRITICAL INSTRUCTIONS:
 1. Evaluate ONLY skills and experience relevant to {target_role}
@@ -780,9 +771,9 @@ SECONDARY skills for {target_role}: {', '.join(taxonomy.get('secondary', [])[:8]
 Skills to IGNORE/PENALIZE (wrong domain): {', '.join(taxonomy.get('exclude', [])[:8])}
 
 RESUME TEXT:
-{resume_text[:4000]}
+{sections["resume_text"]}
 
-{f"JOB DESCRIPTION: {target_description[:500]}" if target_description else ""}
+{f"JOB DESCRIPTION: {sections['job_description']}" if sections["job_description"] else ""}
 
 Respond with JSON only:
 {{
@@ -799,26 +790,15 @@ Respond with JSON only:
     "recommendations": [<specific improvements for {target_role}>],
     "summary": "<include explicit warning if resume is oriented toward different role>"
 }}
-"""
+""",
+                caps={"job_description": 150},
+                job_description=target_description or "",
+                resume_text=resume_text,
+            )
             
             # Call Gemini API
-            start_time = time.time()
-            response = client.generate_content(prompt)
+            response = await ai_gateway.gemini_generate(prompt, "ats_analysis", db=self.db, deadline=self.deadline)
             response_text = response.text
-            response_time_ms = int((time.time() - start_time) * 1000)
-            
-            # Log successful Gemini API call
-            try:
-                AIAPILogService.log_ai_call(
-                    db=self.db,
-                    provider="gemini",
-                    operation="ats_analysis",
-                    model="gemini-pro",
-                    response_time_ms=response_time_ms,
-                    status="success"
-                )
-            except Exception as log_error:
-                print(f"[AI Log Error] Failed to log Gemini call: {log_error}")
             
             # Parse JSON response
             try:
@@ -907,7 +887,7 @@ Respond with JSON only:
             raise ValueError("Resume has no extracted text content")
         
         # Determine analysis source
-        use_gemini = settings.is_gemini_configured()
+        use_gemini = ai_gateway.is_gemini_configured()
         
         # Perform ROLE-CONDITIONED analysis
         if use_gemini:
@@ -915,7 +895,7 @@ Respond with JSON only:
                 resume_text, target_role, target_description
             )
             analysis_source = "gemini"
-            analysis_model = "gemini-pro"
+            analysis_model = ai_gateway.router.current_model("gemini", "ats_analysis")
         else:
             analysis_result = self._generate_role_conditioned_analysis(resume_text, target_role)
             analysis_source = "mock"
@@ -1019,6 +999,6 @@ Respond with JSON only:
         ).order_by(ATSAnalysis.created_at.desc()).limit(limit).all()
 
 
-def get_ats_service(db: Session) -> ATSService:
+def get_ats_service(db: Session, deadline: Optional[Deadline] = None) -> ATSService:
     """Get ATS service instance."""
-    return ATSService(db)
+    return ATSService(db, deadline=deadline)
@@ -0,0 +1,3 @@
+"""
+Benchmarks module - offline performance harnesses.
+"""
@@ -0,0 +1,277 @@
+"""
+Fake AI Providers
+
+Drop-in Groq/Gemini clients for load testing: no network, no API keys,
+a configurable latency per call and canned responses shaped like the real
+ones, so every service takes its normal AI path (JSON parsing included)
+instead of the "not configured" mock branch.
+
+    from app.benchmarks.fake_providers import install_fake_providers
+    install_fake_providers(groq_latency_ms=300, gemini_latency_ms=3000)
+
+The fakes replace the clients held by the registry and the gateway, so
+circuit breakers, the model router, deadlines and AI call logging all
+run exactly as they would against the live providers.
+"""
+
+import asyncio
+import json
+import random
+import re
+from types import SimpleNamespace
+from typing import Dict, Any, AsyncIterator, List, Optional
+
+from app.ai.groq_client import GroqClient
+from app.ai.gemini_client import GeminiClient
+
+FAKE_API_KEY = "fake-load-test-key"
+
+
+def _latency_seconds(latency_ms: float, jitter: float) -> float:
+    """Base latency +/- a uniform jitter fraction."""
+    if latency_ms <= 0:
+        return 0.0
+    spread = latency_ms * jitter
+    return max(0.0, latency_ms + random.uniform(-spread, spread)) / 1000
+
+
+def _token_estimate(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+# ===========================================
+# GROQ
+# ===========================================
+
+class FakeGroqClient(GroqClient):
+    """GroqClient that sleeps instead of calling the API."""
+
+    def __init__(self, latency_ms: float = 300, jitter: float = 0.25):
+        super().__init__(api_key=FAKE_API_KEY)
+        self.latency_ms = latency_ms
+        self.jitter = jitter
+        self.calls = 0
+
+    def configure(self, api_key: str) -> None:
+        """Keys are irrelevant here - stay configured whatever the admin settings say."""
+
+    async def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 150,
+        temperature: float = 0.7,
+        model: Optional[str] = None,
+    ) -> Any:
+        self.calls += 1
+        await asyncio.sleep(_latency_seconds(self.latency_ms, self.jitter))
+
+        content = self._respond(messages)
+        prompt_tokens = sum(_token_estimate(m.get("content", "")) for m in messages)
+        completion_tokens = _token_estimate(content)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+            ),
+        )
+
+    @staticmethod
+    def _respond(messages: List[Dict[str, str]]) -> str:
+        system = messages[0].get("content", "") if messages else ""
+
+        if "Return ONLY a JSON object" in system:
+            return json.dumps({"relevance": random.randint(6, 9), "complete": True, "flags": []})
+
+        if "challenging variant" in (messages[-1].get("content", "") if messages else ""):
+            return (
+                "You have ten minutes and a hard budget: walk me through your approach, "
+                "the main trade-offs, and what you would cut first if traffic doubled."
+            )
+
+        return "Thanks, that's a clear answer. Let's keep going."
+
+
+# ===========================================
+# GEMINI
+# ===========================================
+
+class FakeGeminiClient(GeminiClient):
+    """GeminiClient that sleeps instead of calling the API."""
+
+    STREAM_CHUNKS = 20
+
+    def __init__(self, latency_ms: float = 3000, jitter: float = 0.25):
+        super().__init__(api_key=FAKE_API_KEY)
+        self.latency_ms = latency_ms
+        self.jitter = jitter
+        self.calls = 0
+
+    def configure(self, api_key: str) -> None:
+        """Keys are irrelevant here - stay configured whatever the admin settings say."""
+
+    async def generate_content(self, prompt: str, model: Optional[str] = None) -> Any:
+        self.calls += 1
+        await asyncio.sleep(_latency_seconds(self.latency_ms, self.jitter))
+
+        text = self._respond(prompt)
+        return SimpleNamespace(text=text, usage_metadata=self._usage(prompt, text))
+
+    async def generate_content_stream(self, prompt: str, model: Optional[str] = None) -> AsyncIterator[Any]:
+        """Same response in STREAM_CHUNKS chunks spread over the call latency."""
+        self.calls += 1
+        text = self._respond(prompt)
+        size = max(1, -(-len(text) // self.STREAM_CHUNKS))
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        delay = _latency_seconds(self.latency_ms, self.jitter) / len(chunks)
+
+        for index, chunk in enumerate(chunks):
+            await asyncio.sleep(delay)
+            last = index == len(chunks) - 1
+            yield SimpleNamespace(text=chunk, usage_metadata=self._usage(prompt, text) if last else None)
+
+    @staticmethod
+    def _usage(prompt: str, text: str) -> Any:
+        prompt_tokens = _token_estimate(prompt)
+        completion_tokens = _token_estimate(text)
+        return SimpleNamespace(
+            prompt_token_count=prompt_tokens,
+            candidates_token_count=completion_tokens,
+            total_token_count=prompt_tokens + completion_tokens,
+        )
+
+    def _respond(self, prompt: str) -> str:
+        if "[answer_id:" in prompt:
+            return json.dumps([
+                self._evaluation(answer_id)
+                for answer_id in re.findall(r"\[answer_id: ([^\]]+)\]", prompt)
+            ])
+
+        if "Generate a personalized interview plan" in prompt:
+            match = re.search(r"Question Count: (\d+)", prompt)
+            count = int(match.group(1)) if match else 5
+            return json.dumps({
+                "question_categories": [
+                    {"category": "technical", "count": count, "difficulty": "medium", "rationale": "Core role skills"},
+                ],
+                "strength_focus_areas": [{"area": "Backend APIs", "reason": "Strong resume signal", "question_count": 1}],
+                "weakness_focus_areas": [{"area": "System design", "reason": "Limited evidence", "question_count": 1}],
+                "skills_to_test": ["python", "sql", "system design"],
+                "questions": self._questions(count),
+                "summary": "Balanced plan probing backend depth and collaboration.",
+                "rationale": "Mix of technical and behavioral questions for the target role.",
+            })
+
+        if "Return JSON array" in prompt:
+            match = re.search(r"Generate (\d+) challenging (.+?) interview questions", prompt)
+            if match is None:
+                return json.dumps(self._questions(8))
+            return json.dumps(self._questions(int(match.group(1)), topic=match.group(2)))
+
+        if "ATS (Applicant Tracking System)" in prompt:
+            return json.dumps({
+                "overall_score": 74,
+                "breakdown": {
+                    "keyword_match": 72,
+                    "skills_coverage": 78,
+                    "experience_alignment": 75,
+                    "education_fit": 65,
+                    "format_quality": 80,
+                },
+                "matched_keywords": ["python", "fastapi", "postgresql", "docker"],
+                "missing_keywords": ["terraform"],
+                "recommendations": ["Quantify the impact of the caching work."],
+                "summary": "Well aligned backend profile.",
+            })
+
+        if "performance report" in prompt:
+            return json.dumps({
+                "executive_summary": "The candidate gave structured, relevant answers with concrete examples.",
+                "recommendation": "Ready for interviews with some system design practice.",
+                "score_explanation": "Weighted average of relevance, depth, clarity and confidence.",
+                "behavioral_narrative": "Communicates calmly and organises answers clearly.",
+                "top_improvement": "Discuss trade-offs explicitly.",
+            })
+
+        if "behavioral patterns" in prompt:
+            return json.dumps({
+                "refined_observations": ["Answers follow a clear situation-action-result structure."],
+                "refined_suggestions": ["Lead with the outcome, then the details."],
+                "communication_style": "Structured and concise",
+                "notable_patterns": ["Uses concrete metrics"],
+            })
+
+        # Single deep evaluation, roadmap and anything new: a generic object
+        return json.dumps(self._evaluation(None))
+
+    @staticmethod
+    def _questions(count: int, topic: str = "") -> List[Dict[str, Any]]:
+        types = ["technical", "behavioral", "technical", "situational", "hr"]
+        prefix = f"{topic} " if topic else ""
+        return [
+            {
+                "id": f"q-{index}",
+                "text": f"Walk me through how you would approach {prefix}problem {index} in a production backend.",
+                "type": types[(index - 1) % len(types)],
+                "category": "Backend",
+                "difficulty": "medium",
+                "time_limit_seconds": 180,
+                "expected_topics": ["trade-offs", "scalability"],
+                "scoring_rubric": {"key_points": ["clear approach"], "red_flags": ["no trade-offs"]},
+            }
+            for index in range(1, count + 1)
+        ]
+
+    @staticmethod
+    def _evaluation(answer_id: Optional[str]) -> Dict[str, Any]:
+        evaluation = {
+            "relevance_score": random.randint(6, 9),
+            "depth_score": random.randint(5, 8),
+            "clarity_score": random.randint(6, 9),
+            "confidence_score": random.randint(5, 8),
+            "explanations": {
+                "relevance": "Addresses the question directly.",
+                "depth": "Reasonable detail.",
+                "clarity": "Well structured.",
+                "confidence": "Assertive.",
+            },
+            "strengths": ["Concrete example"],
+            "improvements": ["Quantify the result"],
+            "key_points_covered": ["approach"],
+            "missing_points": ["trade-offs"],
+            "feedback": "Solid answer; add measurable outcomes.",
+        }
+        if answer_id is not None:
+            evaluation["answer_id"] = answer_id
+        return evaluation
+
+
+# ===========================================
+# INSTALL
+# ===========================================
+
+def install_fake_providers(
+    groq_latency_ms: float = 300,
+    gemini_latency_ms: float = 3000,
+    jitter: float = 0.25,
+) -> Dict[str, Any]:
+    """
+    Swap the shared Groq/Gemini clients for fakes.
+
+    Returns:
+        {"groq": FakeGroqClient, "gemini": FakeGeminiClient}
+    """
+    from app.ai.registry import ai_client_registry
+    from app.ai.gateway import ai_gateway
+
+    groq = FakeGroqClient(latency_ms=groq_latency_ms, jitter=jitter)
+    gemini = FakeGeminiClient(latency_ms=gemini_latency_ms, jitter=jitter)
+
+    ai_client_registry.groq = groq
+    ai_client_registry.gemini = gemini
+    ai_gateway.groq = groq
+    ai_gateway.gemini = gemini
+
+    print(f"[FakeAI] Installed fake providers (groq {groq_latency_ms}ms, gemini {gemini_latency_ms}ms, jitter {jitter:.0%})")
+    return {"groq": groq, "gemini": gemini}
@@ -0,0 +1,363 @@
+"""
+Interview Flow Load Test
+
+Simulates N concurrent virtual candidates, each running the full flow:
+signup -> resume upload -> ATS -> plan generate -> start -> consent ->
+answer every question -> report.
+
+AI calls go to built-in fake Groq/Gemini clients with configurable
+latency (see fake_providers.py), so a run needs no keys and no network
+and measures our own overhead under realistic provider waits.
+
+    # In-process (httpx ASGI transport, no sockets)
+    python -m app.benchmarks.load_test --candidates 20
+
+    # Over localhost (uvicorn on a background thread, real HTTP)
+    python -m app.benchmarks.load_test --target localhost --candidates 20 --concurrency 10
+
+    # Isolate our overhead from provider latency
+    python -m app.benchmarks.load_test --candidates 50 --groq-latency-ms 0 --gemini-latency-ms 0
+
+Reports throughput, p50/p95/p99 per endpoint, DB queries per endpoint
+and event-loop lag. Every run uses a fresh SQLite database.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import contextvars
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.benchmarks.replay_harness import ANSWERS, _resume_docx, _percentile  # noqa: E402
+
+
+STEP_HEADER = "x-load-step"
+BACKGROUND = "(startup+jobs)"
+
+# Step of the request being served - set by QueryAttribution, read by the DB listener
+_current_step: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("load_test_step", default=None)
+
+
+# ===========================================
+# SERVER-SIDE PROBES
+# ===========================================
+
+class QueryAttribution:
+    """
+    ASGI wrapper tagging each request with the client's step name.
+
+    The virtual candidates send it in the x-load-step header; SQL issued
+    while serving the request is counted against that step. Queries from
+    startup and background jobs (finalization) land under "(startup+jobs)".
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        step = dict(scope.get("headers") or []).get(STEP_HEADER.encode())
+        token = _current_step.set(step.decode() if step else scope.get("path"))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_step.reset(token)
+
+
+class QueryCounter:
+    """Counts SQL statements per step via a before_cursor_execute listener."""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+
+        self.counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        step = _current_step.get() or BACKGROUND
+        with self._lock:
+            self.counts[step] = self.counts.get(step, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts.clear()
+
+
+class LoopLagMonitor:
+    """Samples event-loop lag: how late a fixed-interval sleep wakes up."""
+
+    def __init__(self, interval_ms: float = 20):
+        self.interval = interval_ms / 1000
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, (time.perf_counter() - start - self.interval) * 1000))
+
+
+# ===========================================
+# VIRTUAL CANDIDATE
+# ===========================================
+
+class StepFailed(Exception):
+    """A request in the flow returned an error status."""
+
+
+class VirtualCandidate:
+    """One candidate walking the whole flow on a shared httpx.AsyncClient."""
+
+    def __init__(self, client, index: int, run_id: str, role: str, question_count: int, timings: Dict[str, List[float]]):
+        self.client = client
+        self.index = index
+        self.run_id = run_id
+        self.role = role
+        self.question_count = question_count
+        self.timings = timings
+        self.headers: Dict[str, str] = {}
+
+    async def _request(self, step: str, method: str, url: str, **kwargs):
+        headers = {**self.headers, STEP_HEADER: step}
+        start = time.perf_counter()
+        response = await self.client.request(method, url, headers=headers, **kwargs)
+        self.timings.setdefault(step, []).append((time.perf_counter() - start) * 1000)
+        if response.status_code >= 400:
+            raise StepFailed(f"{step} failed ({response.status_code}): {response.text[:200]}")
+        return response
+
+    async def run(self) -> None:
+        signup = (await self._request("signup", "POST", "/api/auth/signup", json={
+            "name": f"Load Candidate {self.index}",
+            "email": f"load-{self.run_id}-{self.index}@example.com",
+            "password": "Loadtest1",
+        })).json()
+        token = signup.get("access_token") or signup["token"]["access_token"]
+        self.headers = {"Authorization": f"Bearer {token}"}
+
+        resume = (await self._request(
+            "resume_upload", "POST", "/api/resumes/upload",
+            files={"file": ("resume.docx", _resume_docx(), "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
+        )).json()
+        resume_id = resume["resume"]["id"]
+
+        await self._request("ats_analysis", "POST", f"/api/ats/analyze/{resume_id}", json={"target_role": self.role})
+
+        plan = (await self._request(
+            "generate_plan", "POST", f"/api/interviews/plan/{resume_id}",
+            json={"target_role": self.role, "question_count": self.question_count},
+        )).json()
+
+        started = (await self._request(
+            "start_interview", "POST", "/api/interviews/live/start", json={"plan_id": plan["plan"]["id"]},
+        )).json()
+        session_id = started["session_id"]
+        await self._request("consent", "POST", f"/api/interviews/live/{session_id}/consent")
+
+        turn = 0
+        while True:
+            result = (await self._request(
+                "submit_answer", "POST", f"/api/interviews/live/{session_id}/answer",
+                json={"answer_text": ANSWERS[turn % len(ANSWERS)]},
+            )).json()
+            turn += 1
+            if result.get("is_complete") or turn > self.question_count * 3:
+                break
+
+        # GET /reports waits on the finalization job; 202 means it is still running
+        start = time.perf_counter()
+        while True:
+            response = await self._request("report", "GET", f"/api/reports/{session_id}")
+            if response.status_code != 202:
+                break
+            await asyncio.sleep(0.5)
+        self.timings.setdefault("report_ready", []).append((time.perf_counter() - start) * 1000)
+
+
+# ===========================================
+# RUNNER
+# ===========================================
+
+async def run_candidates(client, args, run_id: str, timings: Dict[str, List[float]]) -> Dict[str, Any]:
+    """Run every candidate, at most args.concurrency at a time."""
+    semaphore = asyncio.Semaphore(args.concurrency or args.candidates)
+    completed = 0
+    errors: List[str] = []
+
+    async def one(index: int) -> None:
+        nonlocal completed
+        if args.ramp_up_seconds:
+            await asyncio.sleep(args.ramp_up_seconds * index / args.candidates)
+        async with semaphore:
+            candidate = VirtualCandidate(client, index, run_id, args.role, args.questions, timings)
+            try:
+                await candidate.run()
+                completed += 1
+            except Exception as e:
+                errors.append(f"candidate {index}: {e}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(args.candidates)))
+    return {"completed": completed, "errors": errors, "elapsed": time.perf_counter() - start}
+
+
+async def run_in_process(app, args, run_id: str, timings, lag: LoopLagMonitor) -> Dict[str, Any]:
+    """httpx ASGI transport: candidates and app share this event loop."""
+    import httpx
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=QueryAttribution(app))
+        async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=args.timeout) as client:
+            lag.start()
+            try:
+                return await run_candidates(client, args, run_id, timings)
+            finally:
+                await lag.stop()
+
+
+async def run_over_localhost(app, args, run_id: str, timings, lag: LoopLagMonitor) -> Dict[str, Any]:
+    """uvicorn on a background thread; lag is sampled on the server's loop."""
+    import httpx
+    import uvicorn
+
+    port = args.port or _free_port()
+    server = uvicorn.Server(uvicorn.Config(QueryAttribution(app), host="127.0.0.1", port=port, log_level="warning"))
+    server_loop: Dict[str, asyncio.AbstractEventLoop] = {}
+
+    async def serve() -> None:
+        server_loop["loop"] = asyncio.get_running_loop()
+        lag.start()
+        try:
+            await server.serve()
+        finally:
+            await lag.stop()
+
+    thread = threading.Thread(target=lambda: asyncio.run(serve()), name="load-test-server", daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("uvicorn failed to start")
+        await asyncio.sleep(0.05)
+
+    limits = httpx.Limits(max_connections=args.concurrency or args.candidates)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=args.timeout, limits=limits) as client:
+            return await run_candidates(client, args, run_id, timings)
+    finally:
+        server.should_exit = True
+        await asyncio.get_running_loop().run_in_executor(None, thread.join)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# ===========================================
+# REPORT
+# ===========================================
+
+def print_report(args, outcome: Dict[str, Any], timings: Dict[str, List[float]], queries: Dict[str, int], lag: List[float], fakes) -> None:
+    elapsed = outcome["elapsed"]
+    requests = sum(len(values) for step, values in timings.items() if step != "report_ready")
+
+    print()
+    print("=" * 86)
+    print(f"Load test: {args.candidates} candidates, concurrency {args.concurrency or args.candidates}, "
+          f"{args.questions} questions, target {args.target}")
+    print(f"Fake AI latency: groq {args.groq_latency_ms}ms, gemini {args.gemini_latency_ms}ms (+/-{args.jitter:.0%})")
+    print("-" * 86)
+    print(f"{'endpoint':<18}{'calls':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'queries':>10}{'q/call':>9}")
+    print("-" * 86)
+    for step, values in timings.items():
+        count = queries.get(step, 0)
+        print(
+            f"{step:<18}{len(values):>7}{_percentile(values, 0.5):>10.1f}{_percentile(values, 0.95):>10.1f}"
+            f"{_percentile(values, 0.99):>10.1f}{max(values):>10.1f}"
+            f"{(count if step != 'report_ready' else ''):>10}{(f'{count / len(values):.1f}' if step != 'report_ready' else ''):>9}"
+        )
+    other = {step: count for step, count in queries.items() if step not in timings}
+    for step, count in other.items():
+        print(f"{step:<18}{'':>7}{'':>10}{'':>10}{'':>10}{'':>10}{count:>10}")
+    print("-" * 86)
+    print(f"Throughput:     {outcome['completed'] / elapsed:.2f} candidates/s, {requests / elapsed:.1f} requests/s "
+          f"({outcome['completed']}/{args.candidates} completed in {elapsed:.1f}s)")
+    print(f"DB queries:     {sum(queries.values())} total, "
+          f"{sum(queries.values()) / max(1, outcome['completed']):.0f} per completed candidate")
+    if lag:
+        print(f"Event-loop lag: p50 {_percentile(lag, 0.5):.1f}ms, p95 {_percentile(lag, 0.95):.1f}ms, "
+              f"p99 {_percentile(lag, 0.99):.1f}ms, max {max(lag):.1f}ms ({len(lag)} samples)")
+    print(f"AI calls:       groq {fakes['groq'].calls}, gemini {fakes['gemini'].calls}")
+    if outcome["errors"]:
+        print(f"Errors ({len(outcome['errors'])}):")
+        for error in outcome["errors"][:10]:
+            print(f"  - {error}")
+    print("=" * 86)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test of the full interview flow with fake AI providers")
+    parser.add_argument("--candidates", type=int, default=10, help="Virtual candidates to simulate")
+    parser.add_argument("--concurrency", type=int, default=0, help="Max candidates in flight (default: all)")
+    parser.add_argument("--ramp-up-seconds", type=float, default=0.0, help="Spread candidate starts over this window")
+    parser.add_argument("--target", choices=["inprocess", "localhost"], default="inprocess")
+    parser.add_argument("--port", type=int, default=0, help="localhost port (default: a free one)")
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--role", default="Backend Engineer")
+    parser.add_argument("--groq-latency-ms", type=float, default=300)
+    parser.add_argument("--gemini-latency-ms", type=float, default=3000)
+    parser.add_argument("--jitter", type=float, default=0.25, help="Uniform +/- fraction applied to fake latencies")
+    parser.add_argument("--lag-interval-ms", type=float, default=20, help="Event-loop lag sampling interval")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-request client timeout (seconds)")
+    parser.add_argument("--verbose", action="store_true", help="Keep the application's own log output")
+    args = parser.parse_args()
+
+    # Isolated database and uploads - must be set before the app is imported
+    workdir = tempfile.mkdtemp(prefix="ai-load-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{workdir}/load.db"
+    os.environ["UPLOAD_DIR"] = f"{workdir}/uploads"
+    os.environ["AI_CASSETTE_MODE"] = "off"
+
+    from app.main import app
+    from app.db.session import engine
+    from app.benchmarks.fake_providers import install_fake_providers
+
+    fakes = install_fake_providers(args.groq_latency_ms, args.gemini_latency_ms, args.jitter)
+    counter = QueryCounter(engine)
+    lag = LoopLagMonitor(args.lag_interval_ms)
+    timings: Dict[str, List[float]] = {}
+    run_id = str(int(time.time()))
+    runner = run_in_process if args.target == "inprocess" else run_over_localhost
+
+    output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(open(os.devnull, "w"))
+    with output:
+        outcome = asyncio.run(runner(app, args, run_id, timings, lag))
+
+    print_report(args, outcome, timings, dict(counter.counts), lag.samples, fakes)
+
+
+if __name__ == "__main__":
+    main()
@@ -75,7 +75,237 @@ class Settings(BaseSettings):
         default="",
         description="Groq API key"
     )
-    
+
+    # AI call timeouts (seconds) - per call, further bounded by the request deadline
+    GROQ_TIMEOUT_SECONDS: float = Field(
+        default=3.0,
+        description="Max seconds for a single Groq call (real-time operations)"
+    )
+    GEMINI_TIMEOUT_SECONDS: float = Field(
+        default=30.0,
+        description="Max seconds for a single Gemini call (deep operations)"
+    )
+    REALTIME_REQUEST_DEADLINE_SECONDS: float = Field(
+        default=8.0,
+        description="Total AI budget for an interactive request (live turns, quick evaluation)"
+    )
+    DEEP_REQUEST_DEADLINE_SECONDS: float = Field(
+        default=60.0,
+        description="Total AI budget for a deep analysis request (ATS, plans, reports, roadmaps)"
+    )
+
+    # AI circuit breakers (per provider + operation)
+    AI_BREAKER_WINDOW_SIZE: int = Field(default=20, description="Recent calls tracked per breaker")
+    AI_BREAKER_MIN_CALLS: int = Field(default=5, description="Calls needed before a breaker can trip")
+    AI_BREAKER_FAILURE_RATE: float = Field(
+        default=0.5,
+        description="Share of failed/slow calls in the window that opens the breaker"
+    )
+    AI_BREAKER_OPEN_SECONDS: float = Field(
+        default=30.0,
+        description="Seconds an open breaker serves fallbacks before probing again"
+    )
+    GROQ_SLOW_CALL_MS: int = Field(default=2000, description="Groq calls slower than this count as failures")
+    GEMINI_SLOW_CALL_MS: int = Field(default=30000, description="Gemini calls slower than this count as failures")
+
+    # Hedged Groq requests (acknowledgment, relevance)
+    GROQ_HEDGE_ENABLED: bool = Field(
+        default=False,
+        description="Send a second Groq request when the first exceeds the p95 latency"
+    )
+    GROQ_HEDGE_MIN_DELAY_MS: int = Field(
+        default=150,
+        description="Never hedge earlier than this, even if p95 is lower"
+    )
+
+    # SLO-driven model routing (see app/ai/model_router.py)
+    ROUTER_WINDOW_MINUTES: int = Field(default=15, description="Rolling window for p95 latency per model")
+    ROUTER_REFRESH_SECONDS: float = Field(default=30.0, description="How often p95 latencies are recomputed")
+    ROUTER_MIN_SAMPLES: int = Field(default=10, description="Calls needed before a model's p95 is trusted")
+    ROUTER_RECOVERY_RATIO: float = Field(
+        default=0.8,
+        description="A demoted model is restored once its p95 is under this fraction of its SLO"
+    )
+
+    # AI record/replay cassettes (offline benchmarking, see app/ai/cassette.py)
+    AI_CASSETTE_MODE: str = Field(
+        default="off",
+        description="off | record (write every AI call to the cassette) | replay (serve AI calls from it)"
+    )
+    AI_CASSETTE_PATH: str = Field(
+        default="./cassettes/ai_calls.jsonl",
+        description="Cassette file (JSON lines, one recorded call per line)"
+    )
+    AI_CASSETTE_LATENCY: str = Field(
+        default="recorded",
+        description="Replay latency: recorded (as captured) | synthetic (fixed per provider) | none"
+    )
+    AI_CASSETTE_SYNTHETIC_GROQ_MS: int = Field(default=400, description="Synthetic replay latency for Groq calls")
+    AI_CASSETTE_SYNTHETIC_GEMINI_MS: int = Field(default=4000, description="Synthetic replay latency for Gemini calls")
+    AI_CASSETTE_STRICT: bool = Field(
+        default=False,
+        description="Replay only exact prompt matches; otherwise fall back to recordings of the same operation"
+    )
+
+    # AI call log write-behind buffer
+    AI_LOG_QUEUE_SIZE: int = Field(
+        default=10000,
+        description="Max AI call log rows held in memory before new rows are dropped"
+    )
+    AI_LOG_BATCH_SIZE: int = Field(
+        default=100,
+        description="Flush AI call logs as soon as this many rows are queued"
+    )
+    AI_LOG_FLUSH_INTERVAL_SECONDS: float = Field(
+        default=2.0,
+        description="Max seconds an AI call log row waits before being written"
+    )
+
+    # Batch deep evaluation (Gemini)
+    DEEP_EVAL_BATCH_SIZE: int = Field(
+        default=4,
+        description="Answers packed into one multi-answer deep evaluation prompt"
+    )
+    DEEP_EVAL_CONCURRENCY: int = Field(
+        default=3,
+        description="Max deep evaluation Gemini calls in flight per session"
+    )
+
+    # ===========================================
+    # LIVE INTERVIEWS
+    # ===========================================
+
+    LIVE_SESSION_CACHE_SIZE: int = Field(
+        default=1000,
+        description="Max live sessions whose state is cached in memory per worker"
+    )
+    LIVE_SESSION_CACHE_TTL_SECONDS: float = Field(
+        default=1800.0,
+        description="Cached session state expires after this long without activity"
+    )
+    LIVE_TURN_LATENCY_BUDGET_MS: int = Field(
+        default=1500,
+        description="Per-turn AI latency target; Groq enrichments whose p95 exceeds it use local fallbacks"
+    )
+    LIVE_TURN_AI_ACK_MIN_WORDS: int = Field(
+        default=15,
+        description="Shorter answers get the local acknowledgment instead of a Groq call"
+    )
+    LIVE_TURN_AI_RELEVANCE_MIN_WORDS: int = Field(
+        default=10,
+        description="Shorter answers get the local relevance heuristic instead of a Groq call"
+    )
+    LIVE_TURN_PROBE_EVERY: int = Field(
+        default=10,
+        description="While an enrichment is over budget, every Nth turn still calls Groq to refresh its p95"
+    )
+    LIVE_PREFETCH_ENABLED: bool = Field(
+        default=True,
+        description="Prefetch the next question's AI content (stress variant, transition) while the candidate answers"
+    )
+    LIVE_PREFETCH_GRACE_MS: int = Field(
+        default=250,
+        description="How long a turn waits on an unfinished prefetch before formatting the question itself"
+    )
+
+    # ===========================================
+    # PLAN STREAMING
+    # ===========================================
+
+    PLAN_STREAMING_ENABLED: bool = Field(
+        default=False,
+        description="Stream Gemini plans: return the plan (status 'generating') once its first questions are parsed"
+    )
+    PLAN_STREAM_MIN_QUESTIONS: int = Field(
+        default=2,
+        description="Questions a streamed plan needs before generate_plan returns and the interview can start"
+    )
+    PLAN_STREAM_WAIT_SECONDS: float = Field(
+        default=30.0,
+        description="How long a live turn waits for a question of a plan still streaming in"
+    )
+    PLAN_STREAM_ORPHAN_SECONDS: float = Field(
+        default=120.0,
+        description="A plan still short of questions with no write for this long lost its stream (worker died) and is topped up from the pool"
+    )
+
+    # Pressure-mode (strict/stress) questions: one Gemini call per round
+    PRESSURE_ROUND_CONCURRENCY: int = Field(
+        default=5,
+        description="Max pressure-mode round generations in flight per plan"
+    )
+
+    # ===========================================
+    # PLAN WARM POOL
+    # ===========================================
+
+    WARM_PLAN_ENABLED: bool = Field(
+        default=False,
+        description="Keep pre-generated Gemini plans for popular plan requests (only when Gemini is configured)"
+    )
+    WARM_PLAN_STOCK_PER_COMBO: int = Field(
+        default=2,
+        description="Pre-generated plans kept per (role, session type, difficulty, company mode, persona, count)"
+    )
+    WARM_PLAN_TOP_COMBOS: int = Field(default=8, description="Most requested combinations kept warm from plan history")
+    WARM_PLAN_MIN_REQUESTS: int = Field(
+        default=3,
+        description="Plans for a combination (in the history window, or misses since startup) before it is kept warm"
+    )
+    WARM_PLAN_HISTORY_DAYS: int = Field(default=7, description="Plan history window for picking popular combinations")
+    WARM_PLAN_MAX_AGE_SECONDS: float = Field(
+        default=21600.0,
+        description="Stocked plans older than this are discarded instead of handed out"
+    )
+    WARM_PLAN_REFRESH_SECONDS: float = Field(
+        default=300.0,
+        description="How often popular combinations are recomputed and their stock topped up"
+    )
+    WARM_PLAN_CONCURRENCY: int = Field(default=1, description="Max warm pool Gemini generations in flight per worker")
+
+    # ===========================================
+    # BACKGROUND JOBS
+    # ===========================================
+
+    JOB_WORKERS: int = Field(
+        default=2,
+        description="Background job workers per process (finalization, deep evaluation, summaries)"
+    )
+    JOB_MAX_ATTEMPTS: int = Field(default=3, description="Attempts before a background job is marked failed")
+    JOB_WAIT_SECONDS: float = Field(
+        default=45.0,
+        description="How long GET /api/reports/{session_id} waits on a running finalization job"
+    )
+    JOB_POLL_INTERVAL_SECONDS: float = Field(
+        default=0.5,
+        description="Poll interval when waiting on a job owned by another process"
+    )
+    JOB_HEARTBEAT_SECONDS: float = Field(
+        default=15.0,
+        description="How often a worker refreshes heartbeat_at on the job it is running"
+    )
+    JOB_STALE_SECONDS: float = Field(
+        default=120.0,
+        description="A 'running' job with no heartbeat for this long is assumed orphaned (worker died) and re-queued"
+    )
+
+    # ===========================================
+    # IDEMPOTENCY KEYS
+    # ===========================================
+
+    IDEMPOTENCY_CACHE_SIZE: int = Field(
+        default=5000,
+        description="Max completed responses kept per worker for Idempotency-Key replays"
+    )
+    IDEMPOTENCY_TTL_SECONDS: float = Field(
+        default=3600.0,
+        description="How long a completed response is replayed for retries with the same key"
+    )
+    IDEMPOTENCY_WAIT_SECONDS: float = Field(
+        default=60.0,
+        description="How long a duplicate request waits on the original before returning 409"
+    )
+
     # ===========================================
     # CORS
     # ===========================================
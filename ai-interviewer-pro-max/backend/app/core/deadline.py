@@ -0,0 +1,62 @@
+"""
+Request Deadlines
+
+A Deadline is created once per request at the route layer and handed to
+the services. Every AI call made while serving that request gets the
+remaining budget (capped by the provider's own per-call timeout), so a
+stalled provider can never hold a request, its DB session and a pool
+connection open indefinitely.
+
+When the budget runs out, the AI gateway raises AITimeoutError and the
+calling service takes its existing mock/fallback branch.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+from app.core.config import settings
+
+
+class AITimeoutError(asyncio.TimeoutError):
+    """An AI call ran past its deadline or per-call timeout."""
+
+
+class Deadline:
+    """
+    Absolute point in time by which a request must be answered.
+
+    Usage:
+        deadline = Deadline.realtime()
+        service = LiveInterviewService(db, deadline=deadline)
+    """
+
+    def __init__(self, budget_seconds: float):
+        self.budget_seconds = budget_seconds
+        self.expires_at = time.monotonic() + budget_seconds
+
+    @classmethod
+    def realtime(cls) -> "Deadline":
+        """Budget for interactive endpoints (live interview turns, quick evaluation)."""
+        return cls(settings.REALTIME_REQUEST_DEADLINE_SECONDS)
+
+    @classmethod
+    def deep(cls) -> "Deadline":
+        """Budget for deep analysis endpoints (ATS, plans, reports, roadmaps)."""
+        return cls(settings.DEEP_REQUEST_DEADLINE_SECONDS)
+
+    def remaining(self) -> float:
+        """Seconds left (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Check if the budget is used up."""
+        return self.remaining() <= 0
+
+    def timeout_for(self, cap: Optional[float] = None) -> float:
+        """Timeout for the next call: the remaining budget, bounded by cap."""
+        remaining = self.remaining()
+        return min(remaining, cap) if cap is not None else remaining
+
+    def __repr__(self) -> str:
+        return f"Deadline(budget={self.budget_seconds}s, remaining={self.remaining():.2f}s)"
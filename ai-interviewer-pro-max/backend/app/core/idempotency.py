@@ -0,0 +1,184 @@
+"""
+Idempotency Keys
+
+Clients retry on network timeouts. Without a key, a retried
+submit_answer double-advances the session (and repeats both Groq calls)
+and a retried plan generation repeats a 10-20 s Gemini call.
+
+Mutating endpoints accept an Idempotency-Key header:
+- The first request with a key runs normally; its response is kept for
+  IDEMPOTENCY_TTL_SECONDS and replayed for any retry with the same key
+- A retry that arrives while the original is still running waits for it
+  (up to IDEMPOTENCY_WAIT_SECONDS) and receives the same response
+  instead of redoing the LLM work
+- Keys are scoped per user and per endpoint; reusing a key with a
+  different request body is rejected (IdempotencyConflictError)
+- Only successful responses are stored: if the original fails, the
+  retry runs the request again
+
+The store is per worker (like live_session_cache). Live turns also
+persist the key on the answer row (unique per session), so a retry that
+reaches another worker, or arrives after a restart or an eviction, is
+rebuilt from that row instead of answering the next question - see
+LiveInterviewService._replay_turn. Plan generation has no such row: a
+retry that misses the store generates again.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+class IdempotencyConflictError(ValueError):
+    """The key was already used for a different request."""
+
+
+class IdempotencyInProgressError(RuntimeError):
+    """The original request is still running after the wait window."""
+
+
+def request_fingerprint(*parts: Any) -> str:
+    """Stable hash of the request inputs a key is bound to."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class IdempotencyStore:
+    """TTL + LRU store of completed responses, plus in-flight markers."""
+
+    def __init__(self, max_size: int = None, ttl_seconds: float = None):
+        self.max_size = max_size or settings.IDEMPOTENCY_CACHE_SIZE
+        self.ttl_seconds = ttl_seconds or settings.IDEMPOTENCY_TTL_SECONDS
+        # (user_id, scope, key) -> (fingerprint, response, stored_at)
+        self._completed: "OrderedDict[Tuple[str, str, str], Tuple[str, Any, float]]" = OrderedDict()
+        # (user_id, scope, key) -> (fingerprint, future resolved when the original finishes)
+        self._in_flight: Dict[Tuple[str, str, str], Tuple[str, asyncio.Future]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"executed": 0, "replayed": 0, "joined": 0, "conflicts": 0}
+
+    def _lookup(self, store_key: Tuple[str, str, str], fingerprint: str) -> Tuple[bool, Any]:
+        """(found, response) for a completed, unexpired entry."""
+        with self._lock:
+            entry = self._completed.get(store_key)
+            if entry is None:
+                return False, None
+
+            stored_fingerprint, response, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._completed[store_key]
+                return False, None
+
+            if stored_fingerprint != fingerprint:
+                self._stats["conflicts"] += 1
+                raise IdempotencyConflictError(
+                    f"{IDEMPOTENCY_HEADER} was already used for a different request"
+                )
+
+            self._completed.move_to_end(store_key)
+            return True, response
+
+    def _store(self, store_key: Tuple[str, str, str], fingerprint: str, response: Any) -> None:
+        with self._lock:
+            self._completed[store_key] = (fingerprint, response, time.monotonic())
+            self._completed.move_to_end(store_key)
+            while len(self._completed) > self.max_size:
+                self._completed.popitem(last=False)
+
+    async def run(
+        self,
+        scope: str,
+        user_id: str,
+        key: Optional[str],
+        fingerprint: str,
+        call: Callable[[], Awaitable[Any]],
+    ) -> Tuple[Any, bool]:
+        """
+        Run a request at most once per (user, scope, key).
+
+        Args:
+            scope: Endpoint name (keys are not shared across endpoints)
+            user_id: Authenticated user
+            key: Idempotency-Key header value (None runs the call directly)
+            fingerprint: request_fingerprint() of the request inputs
+            call: Produces the response
+
+        Returns:
+            (response, replayed) - replayed is True when served from the store
+
+        Raises:
+            IdempotencyConflictError: Key reused with a different request
+            IdempotencyInProgressError: Original still running after IDEMPOTENCY_WAIT_SECONDS
+        """
+        if not key:
+            return await call(), False
+
+        store_key = (user_id, scope, key)
+
+        while True:
+            found, response = self._lookup(store_key, fingerprint)
+            if found:
+                self._stats["replayed"] += 1
+                return response, True
+
+            in_flight = self._in_flight.get(store_key)
+            if in_flight is None:
+                break
+
+            if in_flight[0] != fingerprint:
+                self._stats["conflicts"] += 1
+                raise IdempotencyConflictError(
+                    f"{IDEMPOTENCY_HEADER} is in use by a different request"
+                )
+
+            # Duplicate of a running request: wait for the original, then
+            # replay its response (or take over if it failed)
+            self._stats["joined"] += 1
+            try:
+                await asyncio.wait_for(asyncio.shield(in_flight[1]), timeout=settings.IDEMPOTENCY_WAIT_SECONDS)
+            except asyncio.TimeoutError:
+                raise IdempotencyInProgressError(
+                    "The original request with this Idempotency-Key is still in progress"
+                )
+
+        done = asyncio.get_running_loop().create_future()
+        self._in_flight[store_key] = (fingerprint, done)
+        self._stats["executed"] += 1
+        try:
+            response = await call()
+            self._store(store_key, fingerprint, response)
+            return response, False
+        finally:
+            # Waiters re-check the store: a replay on success, a fresh run on failure
+            self._in_flight.pop(store_key, None)
+            done.set_result(None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._completed.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Store size and executed/replayed/joined counters."""
+        with self._lock:
+            return {
+                "size": len(self._completed),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "in_flight": len(self._in_flight),
+                **self._stats,
+            }
+
+
+# ===========================================
+# STORE INSTANCE
+# ===========================================
+
+idempotency_store = IdempotencyStore()
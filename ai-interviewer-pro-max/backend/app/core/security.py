@@ -205,6 +205,32 @@ async def get_current_user(
     return user.to_dict()
 
 
+def authenticate_token(token: str, db: Session) -> Optional[Dict[str, Any]]:
+    """
+    Resolve a JWT to an active user without raising.
+    
+    Used where there is no HTTP request to attach a 401 to (WebSockets).
+    
+    Args:
+        token: JWT token string
+        db: Database session
+        
+    Returns:
+        User data, or None if the token is invalid or the user is missing/disabled
+    """
+    payload = decode_access_token(token) if token else None
+    if not payload or not payload.get("sub"):
+        return None
+    
+    from app.users.models import User
+    user = db.query(User).filter(User.id == payload["sub"]).first()
+    
+    if not user or not user.is_active:
+        return None
+    
+    return user.to_dict()
+
+
 async def get_current_active_user(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ) -> Dict[str, Any]:
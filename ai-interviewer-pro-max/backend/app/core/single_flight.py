@@ -0,0 +1,82 @@
+"""
+Single-Flight Request Coalescing
+
+Concurrent callers asking for the same expensive result (a report for a
+session, a roadmap for a session) share one in-flight computation
+instead of each running it, Gemini call included.
+
+    report_flight = SingleFlight("generate_report")
+    report_id = await report_flight.do((user_id, session_id), build_report_id)
+    report = db.get(InterviewReport, report_id)
+
+- Per worker, keyed, in-memory: the first caller for a key runs the
+  computation as its own task; callers arriving while it runs await the
+  same task and get its result (or its exception)
+- The task is shielded, so a caller that disconnects does not cancel the
+  computation for the others
+- Nothing is cached: once the task finishes the key is free again
+- Across workers this is only an optimisation; the database stays the
+  backstop (unique constraints on the result rows, see ReportService and
+  RoadmapService)
+
+Share identifiers, not ORM objects: the leader's DB session may already
+be closed (and its instances expired) when a follower resumes, so each
+caller loads the row in its own session.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+# Every group, by name (admin health report)
+_groups: Dict[str, "SingleFlight"] = {}
+
+
+class SingleFlight:
+    """Keyed coalescing of concurrent async computations."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self._stats = {"executed": 0, "shared": 0}
+        _groups[name] = self
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run call() once for all concurrent callers with the same key.
+
+        Returns:
+            The computation's result (shared by every caller for the key)
+
+        Raises:
+            Whatever the computation raised, to every caller
+        """
+        task = self._calls.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            self._stats["executed"] += 1
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self._stats["shared"] += 1
+            print(f"[SingleFlight] {self.name}: joined in-flight call for {key}")
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception retrieved when every caller went away
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """In-flight keys and executed/shared counters."""
+        return {"in_flight": len(self._calls), **self._stats}
+
+
+def single_flight_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every SingleFlight group."""
+    return {name: group.get_stats() for name, group in _groups.items()}
@@ -63,12 +63,13 @@ def init_db() -> None:
     from app.users.models import User, UserSession
     from app.resumes.models import Resume
     from app.ats.models import ATSAnalysis
-    from app.interviews.plan_models import InterviewPlan
+    from app.interviews.plan_models import InterviewPlan, UserSeenQuestions
     from app.interviews.live_models import LiveInterviewSession, InterviewMessage, InterviewAnswer
     from app.evaluations.models import AnswerEvaluation
     from app.simulation.models import AnswerBehavioralInsight, SessionBehavioralSummary
     from app.reports.models import InterviewReport
     from app.roadmap.models import CareerRoadmap
+    from app.jobs.models import BackgroundJob
     # Admin models
     from app.admin.models import ErrorLog, APIRequestLog, SystemSettings, BugReport, APIUsage, ThirdPartyIntegration, Broadcast, AIAPILog
     
@@ -186,6 +187,63 @@ def _run_migrations() -> None:
             for col_name, col_def in live_session_columns:
                 add_column_if_missing(conn, "live_interview_sessions", col_name, col_def)
             
+            # =========================================
+            # INTERVIEW_ANSWERS_LIVE TABLE MIGRATIONS
+            # =========================================
+            add_column_if_missing(conn, "interview_answers_live", "turn_plan", "TEXT")  # JSON as TEXT
+            add_column_if_missing(conn, "interview_answers_live", "idempotency_key", "VARCHAR(255)")
+            try:
+                conn.execute(text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS ux_interview_answers_live_session_idempotency "
+                    "ON interview_answers_live (session_id, idempotency_key)"
+                ))
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.warning(f"  ⚠️ Failed to create ux_interview_answers_live_session_idempotency: {e}")
+            
+            # =========================================
+            # INTERVIEW_MESSAGES TABLE MIGRATIONS
+            # =========================================
+            try:
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_interview_messages_session_created "
+                    "ON interview_messages (session_id, created_at)"
+                ))
+                conn.commit()
+            except Exception as e:
+                logger.warning(f"  ⚠️ Failed to create ix_interview_messages_session_created: {e}")
+            
+            # =========================================
+            # CAREER_ROADMAPS TABLE MIGRATIONS
+            # =========================================
+            try:
+                conn.execute(text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS ux_career_roadmaps_session_version "
+                    "ON career_roadmaps (session_id, version)"
+                ))
+                conn.commit()
+            except Exception as e:
+                # Fails if racing generations already saved duplicate versions
+                conn.rollback()
+                logger.warning(f"  ⚠️ Failed to create ux_career_roadmaps_session_version: {e}")
+            
+            # =========================================
+            # BACKGROUND_JOBS TABLE MIGRATIONS
+            # =========================================
+            add_column_if_missing(conn, "background_jobs", "heartbeat_at", "TIMESTAMP")
+            try:
+                conn.execute(text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS ux_background_jobs_active "
+                    "ON background_jobs (job_type, job_key) "
+                    "WHERE status IN ('queued', 'running')"
+                ))
+                conn.commit()
+            except Exception as e:
+                # Fails if duplicate active jobs were queued before the index existed
+                conn.rollback()
+                logger.warning(f"  ⚠️ Failed to create ux_background_jobs_active: {e}")
+            
             # =========================================
             # API_REQUEST_LOGS TABLE MIGRATIONS
             # =========================================
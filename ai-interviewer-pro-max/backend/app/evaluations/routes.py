@@ -18,8 +18,9 @@ from sqlalchemy.orm import Session
 from typing import Optional
 
 from app.db.session import get_db
+from app.core.deadline import Deadline
 from app.core.security import get_current_active_user
-from app.core.config import settings
+from app.ai.gateway import ai_gateway
 from app.evaluations.service import EvaluationService
 from app.evaluations.schemas import (
     QuickEvaluateRequest,
@@ -70,7 +71,7 @@ async def quick_evaluate(
     - Brief feedback (1-2 lines)
     """
     try:
-        service = EvaluationService(db)
+        service = EvaluationService(db, deadline=Deadline.realtime())
         evaluation = await service.quick_evaluate(
             user_id=current_user["id"],
             session_id=request.session_id,
@@ -89,7 +90,7 @@ async def quick_evaluate(
             source=evaluation.quick_evaluation_source or "mock",
         )
         
-        mode_msg = " (demo mode)" if not settings.is_groq_configured() else ""
+        mode_msg = " (demo mode)" if not ai_gateway.is_groq_configured() else ""
         
         return QuickEvaluateResponse(
             success=True,
@@ -143,7 +144,7 @@ async def deep_evaluate(
     - Detailed feedback
     """
     try:
-        service = EvaluationService(db)
+        service = EvaluationService(db, deadline=Deadline.deep())
         evaluation = await service.deep_evaluate(
             user_id=current_user["id"],
             session_id=request.session_id,
@@ -175,7 +176,7 @@ async def deep_evaluate(
             source=evaluation.deep_evaluation_source or "mock",
         )
         
-        mode_msg = " (demo mode)" if not settings.is_gemini_configured() else ""
+        mode_msg = " (demo mode)" if not ai_gateway.is_gemini_configured() else ""
         
         return DeepEvaluateResponse(
             success=True,
@@ -223,7 +224,7 @@ async def batch_deep_evaluate(
     This is typically called after interview completion.
     """
     try:
-        service = EvaluationService(db)
+        service = EvaluationService(db, deadline=Deadline.deep())
         
         # Get resume context if available
         # TODO: Fetch resume context from session/plan
@@ -446,8 +447,8 @@ async def finalize_evaluations(
 async def get_evaluation_status():
     """Check evaluation API status."""
     return {
-        "groq_configured": settings.is_groq_configured(),
-        "gemini_configured": settings.is_gemini_configured(),
-        "quick_mode": "live" if settings.is_groq_configured() else "demo",
-        "deep_mode": "live" if settings.is_gemini_configured() else "demo",
+        "groq_configured": ai_gateway.is_groq_configured(),
+        "gemini_configured": ai_gateway.is_gemini_configured(),
+        "quick_mode": "live" if ai_gateway.is_groq_configured() else "demo",
+        "deep_mode": "live" if ai_gateway.is_gemini_configured() else "demo",
     }
@@ -11,15 +11,18 @@ Per AI Responsibility Split (Step 4):
 """
 
 import json
-import time
+import asyncio
 import hashlib
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.deadline import Deadline
+from app.ai.gateway import ai_gateway
+from app.ai.prompt_builder import PROMPT_BUDGETS, build_prompt, count_prompt_tokens
 from app.evaluations.models import AnswerEvaluation
-from app.admin.service import AIAPILogService
+from app.utils.token_counter import count_static_tokens, count_tokens, truncate_to_tokens
 
 
 class EvaluationService:
@@ -31,46 +34,16 @@ class EvaluationService:
     2. Deep (Gemini): Detailed analysis, multi-dimensional scoring
     """
     
-    def __init__(self, db: Session):
-        """Initialize service with database session."""
-        self.db = db
-        self._groq_client = None
-        self._gemini_client = None
-    
-    # ===========================================
-    # CLIENT INITIALIZATION
-    # ===========================================
-    
-    def _get_groq_client(self):
-        """Get Groq client if configured."""
-        if not settings.is_groq_configured():
-            return None
-        
-        if self._groq_client is None:
-            try:
-                from groq import Groq
-                self._groq_client = Groq(api_key=settings.GROQ_API_KEY)
-            except Exception as e:
-                print(f"Failed to initialize Groq client: {e}")
-                return None
-        
-        return self._groq_client
-    
-    def _get_gemini_client(self):
-        """Get Gemini client if configured."""
-        if not settings.is_gemini_configured():
-            return None
+    def __init__(self, db: Session, deadline: Optional[Deadline] = None):
+        """
+        Initialize service with database session.
         
-        if self._gemini_client is None:
-            try:
-                import google.generativeai as genai
-                genai.configure(api_key=settings.GEMINI_API_KEY)
-                self._gemini_client = genai.GenerativeModel('gemini-pro')
-            except Exception as e:
-                print(f"Failed to initialize Gemini client: {e}")
-                return None
-        
-        return self._gemini_client
+        Args:
+            db: Database session
+            deadline: Optional request deadline (bounds every AI call)
+        """
+        self.db = db
+        self.deadline = deadline
     
     # ===========================================
     # MOCK EVALUATION (Fallback)
@@ -525,17 +498,17 @@ class EvaluationService:
         answer_text: str,
     ) -> Dict[str, Any]:
         """Perform quick evaluation using Groq."""
-        client = self._get_groq_client()
-        
-        if not client:
+        if not ai_gateway.is_groq_configured():
             return self._generate_mock_quick_evaluation(question_text, answer_text)
         
         try:
-            prompt = f"""Evaluate this interview answer quickly.
+            prompt = build_prompt(
+                "quick_answer_evaluation",
+                lambda sections: f"""Evaluate this interview answer quickly.
 
-Question: {question_text[:500]}
+Question: {sections["question"]}
 
-Answer: {answer_text[:1000]}
+Answer: {sections["answer"]}
 
 Provide a brief evaluation in JSON format:
 {{
@@ -545,44 +518,24 @@ Provide a brief evaluation in JSON format:
     "feedback": "<1-2 sentence feedback>"
 }}
 
-Be concise. Score based on how well the answer addresses the question."""
+Be concise. Score based on how well the answer addresses the question.""",
+                caps={"question": 120},
+                question=question_text,
+                answer=answer_text,
+            )
 
-            # Use currently supported model (mixtral-8x7b-32768 is decommissioned)
-            model = "llama-3.1-8b-instant"
-            start_time = time.time()
-            
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
+            response = await ai_gateway.groq_chat(
+                [
                     {"role": "system", "content": "You are a professional interview evaluator. Provide quick, accurate assessments."},
                     {"role": "user", "content": prompt}
                 ],
+                "quick_answer_evaluation",
                 max_tokens=200,
                 temperature=0.3,
+                db=self.db,
+                deadline=self.deadline,
             )
-            
-            result_text = response.choices[0].message.content.strip()
-            response_time_ms = int((time.time() - start_time) * 1000)
-            
-            # Log successful Groq API call
-            try:
-                prompt_tokens = getattr(response.usage, 'prompt_tokens', None) if hasattr(response, 'usage') else None
-                completion_tokens = getattr(response.usage, 'completion_tokens', None) if hasattr(response, 'usage') else None
-                total_tokens = getattr(response.usage, 'total_tokens', None) if hasattr(response, 'usage') else None
-                
-                AIAPILogService.log_ai_call(
-                    db=self.db,
-                    provider="groq",
-                    operation="quick_answer_evaluation",
-                    model=model,
-                    prompt_tokens=prompt_tokens,
-                    completion_tokens=completion_tokens,
-                    total_tokens=total_tokens,
-                    response_time_ms=response_time_ms,
-                    status="success"
-                )
-            except Exception as log_error:
-                print(f"[AI Log Error] Failed to log Groq call: {log_error}")
+            result_text = response.text
             
             # Parse JSON response
             try:
@@ -604,21 +557,7 @@ Be concise. Score based on how well the answer addresses the question."""
             return self._generate_mock_quick_evaluation(question_text, answer_text)
             
         except Exception as e:
-            error_msg = str(e)
-            print(f"[Groq Evaluation Error] Model: llama-3.1-8b-instant, Error: {error_msg}")
-            
-            # Log failed Groq API call
-            try:
-                AIAPILogService.log_ai_call(
-                    db=self.db,
-                    provider="groq",
-                    operation="quick_answer_evaluation",
-                    model="llama-3.1-8b-instant",
-                    status="error",
-                    error_message=error_msg[:500]
-                )
-            except Exception as log_error:
-                print(f"[AI Log Error] Failed to log Groq error: {log_error}")
+            print(f"[Groq Evaluation Error] Error: {e}")
             
             return self._generate_mock_quick_evaluation(question_text, answer_text)
     
@@ -635,25 +574,24 @@ Be concise. Score based on how well the answer addresses the question."""
         expected_topics: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Perform deep evaluation using Gemini."""
-        client = self._get_gemini_client()
-        
-        if not client:
+        if not ai_gateway.is_gemini_configured():
             return self._generate_mock_deep_evaluation(question_text, answer_text, question_type)
         
         try:
-            context = ""
-            if resume_context:
-                context += f"\nCandidate's Resume Context:\n{resume_context[:1000]}\n"
+            topics = ""
             if expected_topics:
-                context += f"\nExpected Topics: {', '.join(expected_topics[:10])}\n"
+                topics = f"\nExpected Topics: {', '.join(expected_topics[:10])}\n"
             
-            prompt = f"""You are an expert interview evaluator. Perform a detailed evaluation of this interview answer.
+            # Question and answer first, resume context fills what is left
+            prompt = build_prompt(
+                "deep_answer_evaluation",
+                lambda sections: f"""You are an expert interview evaluator. Perform a detailed evaluation of this interview answer.
 
 Question Type: {question_type or 'general'}
-Question: {question_text}
+Question: {sections["question"]}
 
-Candidate's Answer: {answer_text}
-{context}
+Candidate's Answer: {sections["answer"]}
+{self._format_resume_context(sections["resume_context"])}{topics}
 
 Evaluate the answer on these dimensions (score 0-10):
 
@@ -681,85 +619,177 @@ Provide your evaluation in this JSON format:
     "feedback": "<2-3 sentence overall feedback>"
 }}
 
-Be constructive and professional. Provide actionable feedback."""
+Be constructive and professional. Provide actionable feedback.""",
+                caps={"resume_context": 300},
+                question=question_text,
+                answer=answer_text,
+                resume_context=resume_context or "",
+            )
 
-            start_time = time.time()
-            response = client.generate_content(prompt)
+            response = await ai_gateway.gemini_generate(prompt, "deep_answer_evaluation", db=self.db, deadline=self.deadline)
             result_text = response.text
-            response_time_ms = int((time.time() - start_time) * 1000)
-            
-            # Log successful Gemini API call
-            try:
-                AIAPILogService.log_ai_call(
-                    db=self.db,
-                    provider="gemini",
-                    operation="deep_answer_evaluation",
-                    model="gemini-pro",
-                    response_time_ms=response_time_ms,
-                    status="success"
-                )
-            except Exception as log_error:
-                print(f"[AI Log Error] Failed to log Gemini call: {log_error}")
             
             # Parse JSON response
             try:
                 if "{" in result_text:
                     json_str = result_text[result_text.find("{"):result_text.rfind("}")+1]
                     parsed = json.loads(json_str)
-                    
-                    # Calculate overall score
-                    relevance = float(parsed.get("relevance_score", 5))
-                    depth = float(parsed.get("depth_score", 5))
-                    clarity = float(parsed.get("clarity_score", 5))
-                    confidence = float(parsed.get("confidence_score", 5))
-                    overall = relevance * 0.3 + depth * 0.3 + clarity * 0.2 + confidence * 0.2
-                    
-                    explanations = parsed.get("explanations", {})
-                    
-                    return {
-                        "relevance_score": relevance,
-                        "depth_score": depth,
-                        "clarity_score": clarity,
-                        "confidence_score": confidence,
-                        "overall_score": round(overall, 1),
-                        "explanations": {
-                            "relevance": explanations.get("relevance", ""),
-                            "depth": explanations.get("depth", ""),
-                            "clarity": explanations.get("clarity", ""),
-                            "confidence": explanations.get("confidence", ""),
-                        },
-                        "strengths": parsed.get("strengths", [])[:5],
-                        "improvements": parsed.get("improvements", [])[:5],
-                        "key_points_covered": parsed.get("key_points_covered", [])[:5],
-                        "missing_points": parsed.get("missing_points", [])[:5],
-                        "feedback": str(parsed.get("feedback", ""))[:500],
-                        "source": "gemini",
-                    }
-            except json.JSONDecodeError:
+                    return self._normalize_deep_result(parsed)
+            except (json.JSONDecodeError, TypeError, ValueError):
                 pass
             
             # Fallback to mock
             return self._generate_mock_deep_evaluation(question_text, answer_text, question_type)
             
         except Exception as e:
-            error_msg = str(e)
-            print(f"Gemini evaluation error: {error_msg}")
-            
-            # Log failed Gemini API call
-            try:
-                AIAPILogService.log_ai_call(
-                    db=self.db,
-                    provider="gemini",
-                    operation="deep_answer_evaluation",
-                    model="gemini-pro",
-                    status="error",
-                    error_message=error_msg[:500]
-                )
-            except Exception as log_error:
-                print(f"[AI Log Error] Failed to log Gemini error: {log_error}")
+            print(f"Gemini evaluation error: {e}")
             
             return self._generate_mock_deep_evaluation(question_text, answer_text, question_type)
     
+    @staticmethod
+    def _format_resume_context(resume_context: str) -> str:
+        """Resume context block for deep evaluation prompts (empty if none)."""
+        if not resume_context:
+            return ""
+        return f"\nCandidate's Resume Context:\n{resume_context}\n"
+    
+    def _normalize_deep_result(self, parsed: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert one parsed Gemini evaluation object into the deep result shape."""
+        # Calculate overall score
+        relevance = float(parsed.get("relevance_score", 5))
+        depth = float(parsed.get("depth_score", 5))
+        clarity = float(parsed.get("clarity_score", 5))
+        confidence = float(parsed.get("confidence_score", 5))
+        overall = relevance * 0.3 + depth * 0.3 + clarity * 0.2 + confidence * 0.2
+        
+        explanations = parsed.get("explanations", {}) or {}
+        
+        return {
+            "relevance_score": relevance,
+            "depth_score": depth,
+            "clarity_score": clarity,
+            "confidence_score": confidence,
+            "overall_score": round(overall, 1),
+            "explanations": {
+                "relevance": explanations.get("relevance", ""),
+                "depth": explanations.get("depth", ""),
+                "clarity": explanations.get("clarity", ""),
+                "confidence": explanations.get("confidence", ""),
+            },
+            "strengths": (parsed.get("strengths") or [])[:5],
+            "improvements": (parsed.get("improvements") or [])[:5],
+            "key_points_covered": (parsed.get("key_points_covered") or [])[:5],
+            "missing_points": (parsed.get("missing_points") or [])[:5],
+            "feedback": str(parsed.get("feedback", ""))[:500],
+            "source": "gemini",
+        }
+    
+    async def _evaluate_batch_with_gemini(
+        self,
+        evaluations: List[AnswerEvaluation],
+        resume_context: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Deep-evaluate several answers in a single Gemini call.
+        
+        Returns:
+            Results keyed by evaluation id. Items Gemini skipped or returned
+            malformed are simply missing, so the caller can retry only those.
+        """
+        render = lambda sections: f"""You are an expert interview evaluator. Perform a detailed evaluation of EACH of the following interview answers independently.
+{self._format_resume_context(sections["resume_context"])}
+{sections["answers"]}
+
+Evaluate every answer on these dimensions (score 0-10):
+
+1. RELEVANCE: How directly does the answer address the question?
+2. DEPTH: How thorough and detailed is the response?
+3. CLARITY: How well-structured and clear is the communication?
+4. CONFIDENCE: How confidently does the candidate express their ideas?
+
+Return ONLY a JSON array with one object per answer, copying each answer_id exactly:
+[
+    {{
+        "answer_id": "<answer_id>",
+        "relevance_score": <0-10>,
+        "depth_score": <0-10>,
+        "clarity_score": <0-10>,
+        "confidence_score": <0-10>,
+        "explanations": {{
+            "relevance": "<explanation>",
+            "depth": "<explanation>",
+            "clarity": "<explanation>",
+            "confidence": "<explanation>"
+        }},
+        "strengths": ["<strength1>", "<strength2>"],
+        "improvements": ["<improvement1>", "<improvement2>"],
+        "key_points_covered": ["<point1>", "<point2>"],
+        "missing_points": ["<missing1>"],
+        "feedback": "<2-3 sentence overall feedback>"
+    }}
+]
+
+Be constructive and professional. Provide actionable feedback."""
+        
+        # Each answer is fitted to an equal share of what the budget leaves
+        # after the instructions and resume context, so one long answer
+        # cannot crowd out the ones after it in the batch
+        resume_context = truncate_to_tokens(resume_context or "", 300)
+        reserved = (
+            count_prompt_tokens(render({"answers": "", "resume_context": ""}), static=True)
+            + count_tokens(self._format_resume_context(resume_context))
+        )
+        separator = "\n\n"
+        share = (
+            (PROMPT_BUDGETS["batch_deep_answer_evaluation"] - reserved) // len(evaluations)
+            - count_static_tokens(separator)
+        )
+        
+        blocks = []
+        for evaluation in evaluations:
+            block = f"""[answer_id: {evaluation.id}]
+Question Type: {evaluation.question_type or 'general'}
+Question: {evaluation.question_text or ''}
+Candidate's Answer: {evaluation.answer_text}"""
+            fitted = truncate_to_tokens(block, share)
+            if fitted != block:
+                print(f"[Batch Evaluation] Answer {evaluation.id} trimmed to {share} tokens")
+            blocks.append(fitted)
+        
+        prompt = build_prompt(
+            "batch_deep_answer_evaluation",
+            render,
+            answers=separator.join(blocks),
+            resume_context=resume_context,
+        )
+
+        response = await ai_gateway.gemini_generate(prompt, "batch_deep_answer_evaluation", db=self.db, deadline=self.deadline)
+        result_text = response.text
+        
+        if "[" not in result_text:
+            return {}
+        
+        try:
+            items = json.loads(result_text[result_text.find("["):result_text.rfind("]")+1])
+        except json.JSONDecodeError:
+            return {}
+        
+        wanted = {evaluation.id for evaluation in evaluations}
+        results = {}
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict):
+                continue
+            answer_id = str(item.get("answer_id", "")).strip()
+            if answer_id not in wanted:
+                continue
+            try:
+                results[answer_id] = self._normalize_deep_result(item)
+            except (TypeError, ValueError):
+                # Malformed scores - leave for the per-item retry
+                continue
+        
+        return results
+    
     # ===========================================
     # PUBLIC API
     # ===========================================
@@ -876,7 +906,15 @@ Be constructive and professional. Provide actionable feedback."""
             )
             self.db.add(evaluation)
         
-        # Update deep evaluation fields
+        self._apply_deep_result(evaluation, result)
+        
+        self.db.commit()
+        self.db.refresh(evaluation)
+        
+        return evaluation
+    
+    def _apply_deep_result(self, evaluation: AnswerEvaluation, result: Dict[str, Any]) -> None:
+        """Copy a deep evaluation result onto an evaluation row."""
         evaluation.deep_relevance_score = result["relevance_score"]
         evaluation.deep_depth_score = result["depth_score"]
         evaluation.deep_clarity_score = result["clarity_score"]
@@ -899,11 +937,6 @@ Be constructive and professional. Provide actionable feedback."""
         evaluation.deep_evaluation_source = result["source"]
         evaluation.is_deep_complete = True
         evaluation.evaluation_status = "complete" if evaluation.is_quick_complete else "partial"
-        
-        self.db.commit()
-        self.db.refresh(evaluation)
-        
-        return evaluation
     
     async def batch_deep_evaluate(
         self,
@@ -913,31 +946,70 @@ Be constructive and professional. Provide actionable feedback."""
     ) -> List[AnswerEvaluation]:
         """
         Perform deep evaluation on all pending answers in a session.
+        
+        - Answers are packed DEEP_EVAL_BATCH_SIZE at a time into one
+          multi-answer Gemini prompt
+        - Batches run concurrently, bounded by DEEP_EVAL_CONCURRENCY, so a
+          session takes roughly as long as its slowest batch
+        - Answers missing from a batch response are retried one by one;
+          the rest of the batch is kept
         """
         # Get all evaluations for session that need deep evaluation
         evaluations = self.db.query(AnswerEvaluation).filter(
             AnswerEvaluation.session_id == session_id,
             AnswerEvaluation.user_id == user_id,
             AnswerEvaluation.is_deep_complete == False,
+            AnswerEvaluation.is_finalized == False,
         ).all()
         
-        results = []
-        for eval in evaluations:
-            try:
-                updated = await self.deep_evaluate(
-                    user_id=user_id,
-                    session_id=session_id,
-                    question_id=eval.question_id,
-                    question_text=eval.question_text or "",
-                    answer_text=eval.answer_text,
-                    question_type=eval.question_type,
-                    resume_context=resume_context,
+        if not evaluations:
+            return []
+        
+        semaphore = asyncio.Semaphore(max(1, settings.DEEP_EVAL_CONCURRENCY))
+        batch_size = max(1, settings.DEEP_EVAL_BATCH_SIZE)
+        batches = [
+            evaluations[i:i + batch_size]
+            for i in range(0, len(evaluations), batch_size)
+        ]
+        
+        async def run_batch(batch: List[AnswerEvaluation]) -> Dict[str, Dict[str, Any]]:
+            if not ai_gateway.is_gemini_configured():
+                return {}
+            async with semaphore:
+                try:
+                    return await self._evaluate_batch_with_gemini(batch, resume_context)
+                except Exception as e:
+                    print(f"[Batch Evaluation Error] {len(batch)} answers: {e}")
+                    return {}
+        
+        async def run_single(evaluation: AnswerEvaluation) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._evaluate_with_gemini(
+                    evaluation.question_text or "",
+                    evaluation.answer_text,
+                    evaluation.question_type,
+                    resume_context,
                 )
-                results.append(updated)
-            except Exception as e:
-                print(f"Failed to deep evaluate {eval.id}: {e}")
         
-        return results
+        results: Dict[str, Dict[str, Any]] = {}
+        for batch_results in await asyncio.gather(*(run_batch(batch) for batch in batches)):
+            results.update(batch_results)
+        
+        # Retry only the items the batch calls did not return
+        failed = [evaluation for evaluation in evaluations if evaluation.id not in results]
+        if failed:
+            if ai_gateway.is_gemini_configured():
+                print(f"[Batch Evaluation] Retrying {len(failed)} of {len(evaluations)} answers individually")
+            retried = await asyncio.gather(*(run_single(evaluation) for evaluation in failed))
+            for evaluation, result in zip(failed, retried):
+                results[evaluation.id] = result
+        
+        for evaluation in evaluations:
+            self._apply_deep_result(evaluation, results[evaluation.id])
+        
+        self.db.commit()
+        
+        return evaluations
     
     def get_evaluation(
         self,
@@ -980,6 +1052,6 @@ Be constructive and professional. Provide actionable feedback."""
         return count
 
 
-def get_evaluation_service(db: Session) -> EvaluationService:
+def get_evaluation_service(db: Session, deadline: Optional[Deadline] = None) -> EvaluationService:
     """Get evaluation service instance."""
-    return EvaluationService(db)
+    return EvaluationService(db, deadline=deadline)
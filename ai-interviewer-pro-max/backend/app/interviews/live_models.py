@@ -5,7 +5,7 @@ SQLAlchemy models for live interview session tracking.
 Stores interview state, questions asked, and answers received.
 """
 
-from sqlalchemy import Column, String, Text, Integer, DateTime, JSON, Boolean
+from sqlalchemy import Column, String, Text, Integer, DateTime, JSON, Boolean, Index
 from datetime import datetime
 import uuid
 
@@ -97,6 +97,10 @@ class InterviewMessage(Base):
     """
     
     __tablename__ = "interview_messages"
+    __table_args__ = (
+        # Transcript reads: WHERE session_id = ? [AND created_at > cursor] ORDER BY created_at
+        Index("ix_interview_messages_session_created", "session_id", "created_at"),
+    )
     
     # Primary key
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
@@ -120,6 +124,11 @@ class InterviewMessage(Base):
     def __repr__(self):
         return f"<InterviewMessage(id={self.id}, role={self.role})>"
     
+    @property
+    def cursor(self) -> str:
+        """Opaque position in the transcript (see get_session_state ?since=)."""
+        return f"{self.created_at.isoformat()}|{self.id}"
+    
     def to_dict(self) -> dict:
         """Convert to dictionary for API response."""
         return {
@@ -142,6 +151,10 @@ class InterviewAnswer(Base):
     """
     
     __tablename__ = "interview_answers_live"
+    __table_args__ = (
+        # A retried turn (same Idempotency-Key) can never record a second answer
+        Index("ux_interview_answers_live_session_idempotency", "session_id", "idempotency_key", unique=True),
+    )
     
     # Primary key
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
@@ -167,6 +180,12 @@ class InterviewAnswer(Base):
     quick_eval_complete = Column(Boolean, nullable=True)
     quick_eval_flags = Column(JSON, nullable=True)  # ["too_short", "off_topic", etc.]
     
+    # Turn planner decision (which enrichments ran, why, measured AI step ms)
+    turn_plan = Column(JSON, nullable=True)
+    
+    # Idempotency-Key of the request that wrote this turn (NULL without one)
+    idempotency_key = Column(String(255), nullable=True)
+    
     # Timestamps
     submitted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
@@ -183,5 +202,6 @@ class InterviewAnswer(Base):
             "word_count": self.word_count,
             "response_time_seconds": self.response_time_seconds,
             "is_skipped": self.is_skipped,
+            "turn_plan": self.turn_plan,
             "submitted_at": self.submitted_at.isoformat() if self.submitted_at else None,
         }
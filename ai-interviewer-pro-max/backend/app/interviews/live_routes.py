@@ -8,20 +8,32 @@ Endpoints:
 - POST /interviews/live/start - Start interview
 - POST /interviews/live/{session_id}/answer - Submit answer
 - POST /interviews/live/{session_id}/skip - Skip question
+  (start/answer/skip accept an Idempotency-Key header, see app/core/idempotency.py)
 - POST /interviews/live/{session_id}/pause - Pause interview
 - POST /interviews/live/{session_id}/resume - Resume interview
 - POST /interviews/live/{session_id}/end - End interview early
-- GET /interviews/live/{session_id}/state - Get session state
+- GET /interviews/live/{session_id}/state - Get session state (?since= cursor, ?state_only=)
+
+WebSocket equivalent of the turn endpoints: app/interviews/live_ws.py
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Header, Response
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from app.db.session import get_db
+from app.core.deadline import Deadline
 from app.core.security import get_current_active_user
-from app.core.config import settings
+from app.core.idempotency import (
+    idempotency_store,
+    request_fingerprint,
+    IdempotencyInProgressError,
+    IDEMPOTENCY_HEADER,
+    REPLAYED_HEADER,
+)
+from app.ai.gateway import ai_gateway
 from app.interviews.live_service import LiveInterviewService
+from app.interviews.plan_stream import PlanQuestionsPendingError
 from app.interviews.live_schemas import (
     StartInterviewRequest,
     SubmitAnswerRequest,
@@ -57,10 +69,13 @@ router = APIRouter()
         400: {"model": ErrorResponse, "description": "Invalid request"},
         401: {"model": ErrorResponse, "description": "Not authenticated"},
         404: {"model": ErrorResponse, "description": "Plan not found"},
+        409: {"model": ErrorResponse, "description": "Idempotency-Key request still in progress"},
     }
 )
 async def start_interview(
     request: StartInterviewRequest,
+    response: Response,
+    idempotency_key: Optional[str] = Header(default=None, alias=IDEMPOTENCY_HEADER, max_length=255),
     current_user: dict = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -87,23 +102,37 @@ async def start_interview(
             detail="plan_id is required"
         )
     
-    try:
-        service = LiveInterviewService(db)
+    persona = request.persona or "professional"
+    
+    async def start() -> StartInterviewResponse:
+        service = LiveInterviewService(db, deadline=Deadline.realtime())
         result = await service.start_interview(
             plan_id=request.plan_id,
             user_id=current_user["id"],
-            persona=request.persona or "professional",
+            persona=persona,
         )
         
         return StartInterviewResponse(
             success=True,
-            message="Interview started" + (" (demo mode)" if not settings.is_groq_configured() else ""),
+            message="Interview started" + (" (demo mode)" if not ai_gateway.is_groq_configured() else ""),
             session_id=result["session_id"],
             status=result["status"],
             interviewer_message=result["interviewer_message"],
             first_question=result["first_question"],
             progress=ProgressSchema(**result["progress"]),
         )
+    
+    try:
+        started, replayed = await idempotency_store.run(
+            "start_interview", current_user["id"], idempotency_key,
+            request_fingerprint(request.plan_id, persona), start,
+        )
+        if replayed:
+            response.headers[REPLAYED_HEADER] = "true"
+        return started
+        
+    except IdempotencyInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
         
     except ValueError as e:
         error_msg = str(e)
@@ -199,6 +228,8 @@ async def confirm_consent(
 )
 async def get_session_state(
     session_id: str,
+    since: Optional[str] = Query(None, description="Return only messages after this cursor (next_cursor of the previous call)"),
+    state_only: bool = Query(False, description="Skip messages entirely (progress and current question only)"),
     current_user: dict = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -206,13 +237,26 @@ async def get_session_state(
     Get the current state of an interview session.
     
     Use this to resume after a page refresh or reconnection.
-    Returns all messages and current question.
+    Returns the current question and the transcript - all of it on the
+    first call, then only new messages when polled with ?since=<next_cursor>.
+    ?state_only=true skips the transcript (served from memory, no DB read).
     """
+    if since:
+        try:
+            LiveInterviewService.parse_message_cursor(since)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+    
     try:
         service = LiveInterviewService(db)
         result = await service.get_session_state(
             session_id=session_id,
             user_id=current_user["id"],
+            include_messages=not state_only,
+            since=since,
         )
         
         return InterviewStateResponse(
@@ -224,6 +268,7 @@ async def get_session_state(
             progress=ProgressSchema(**result["progress"]),
             current_question=result["current_question"],
             messages=[MessageSchema(**m) for m in result["messages"]],
+            next_cursor=result["next_cursor"],
         )
         
     except ValueError as e:
@@ -254,11 +299,15 @@ async def get_session_state(
         400: {"model": ErrorResponse, "description": "Invalid answer"},
         401: {"model": ErrorResponse, "description": "Not authenticated"},
         404: {"model": ErrorResponse, "description": "Session not found"},
+        409: {"model": ErrorResponse, "description": "Idempotency-Key request still in progress"},
+        503: {"model": ErrorResponse, "description": "Next question still being generated - retry"},
     }
 )
 async def submit_answer(
     session_id: str,
     request: SubmitAnswerRequest,
+    response: Response,
+    idempotency_key: Optional[str] = Header(default=None, alias=IDEMPOTENCY_HEADER, max_length=255),
     current_user: dict = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -267,6 +316,9 @@ async def submit_answer(
     
     Returns the interviewer's acknowledgment and the next question
     (if there is one) or indicates interview completion.
+    
+    A retry with the same Idempotency-Key gets the original response
+    instead of advancing the interview a second time.
     """
     # Validate answer text
     answer_text = request.answer_text.strip()
@@ -276,13 +328,14 @@ async def submit_answer(
             detail="Answer cannot be empty"
         )
     
-    try:
-        service = LiveInterviewService(db)
+    async def submit() -> AnswerResponse:
+        service = LiveInterviewService(db, deadline=Deadline.realtime())
         result = await service.submit_answer(
             session_id=session_id,
             user_id=current_user["id"],
             answer_text=answer_text,
             response_time_seconds=request.response_time_seconds,
+            idempotency_key=idempotency_key,
         )
         
         return AnswerResponse(
@@ -294,8 +347,26 @@ async def submit_answer(
             next_question=result["next_question"],
             progress=ProgressSchema(**result["progress"]),
             is_complete=result["is_complete"],
+            job_id=result["job_id"],
+        )
+    
+    try:
+        answered, replayed = await idempotency_store.run(
+            "submit_answer", current_user["id"], idempotency_key,
+            request_fingerprint(session_id, answer_text, request.response_time_seconds), submit,
         )
+        if replayed:
+            response.headers[REPLAYED_HEADER] = "true"
+        return answered
         
+    except IdempotencyInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except PlanQuestionsPendingError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "2"},
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -324,10 +395,14 @@ async def submit_answer(
         400: {"model": ErrorResponse, "description": "Cannot skip"},
         401: {"model": ErrorResponse, "description": "Not authenticated"},
         404: {"model": ErrorResponse, "description": "Session not found"},
+        409: {"model": ErrorResponse, "description": "Idempotency-Key request still in progress"},
+        503: {"model": ErrorResponse, "description": "Next question still being generated - retry"},
     }
 )
 async def skip_question(
     session_id: str,
+    response: Response,
+    idempotency_key: Optional[str] = Header(default=None, alias=IDEMPOTENCY_HEADER, max_length=255),
     current_user: dict = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -335,12 +410,14 @@ async def skip_question(
     Skip the current question.
     
     Note: Skipped questions will affect your final score.
+    A retry with the same Idempotency-Key does not skip a second question.
     """
-    try:
-        service = LiveInterviewService(db)
+    async def skip() -> SkipResponse:
+        service = LiveInterviewService(db, deadline=Deadline.realtime())
         result = await service.skip_question(
             session_id=session_id,
             user_id=current_user["id"],
+            idempotency_key=idempotency_key,
         )
         
         return SkipResponse(
@@ -349,8 +426,26 @@ async def skip_question(
             next_question=result["next_question"],
             progress=ProgressSchema(**result["progress"]),
             is_complete=result["is_complete"],
+            job_id=result["job_id"],
+        )
+    
+    try:
+        skipped, replayed = await idempotency_store.run(
+            "skip_question", current_user["id"], idempotency_key,
+            request_fingerprint(session_id), skip,
         )
+        if replayed:
+            response.headers[REPLAYED_HEADER] = "true"
+        return skipped
         
+    except IdempotencyInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except PlanQuestionsPendingError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "2"},
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -488,7 +583,7 @@ async def end_interview(
     Your results will be based on the questions answered so far.
     """
     try:
-        service = LiveInterviewService(db)
+        service = LiveInterviewService(db, deadline=Deadline.deep())
         result = await service.end_interview(
             session_id=session_id,
             user_id=current_user["id"],
@@ -522,7 +617,7 @@ async def end_interview(
 async def get_live_status():
     """Check if Groq is configured for live interviews."""
     return {
-        "groq_configured": settings.is_groq_configured(),
-        "mode": "live" if settings.is_groq_configured() else "demo",
-        "message": "Groq API is configured" if settings.is_groq_configured() else "Running in demo mode (mock responses)",
+        "groq_configured": ai_gateway.is_groq_configured(),
+        "mode": "live" if ai_gateway.is_groq_configured() else "demo",
+        "message": "Groq API is configured" if ai_gateway.is_groq_configured() else "Running in demo mode (mock responses)",
     }
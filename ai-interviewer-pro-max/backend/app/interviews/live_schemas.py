@@ -89,7 +89,8 @@ class InterviewStateResponse(BaseModel):
     interviewer_persona: str = Field(..., description="Current persona")
     progress: ProgressSchema = Field(..., description="Interview progress")
     current_question: Optional[dict] = Field(None, description="Current question details")
-    messages: List[MessageSchema] = Field(default=[], description="Chat messages")
+    messages: List[MessageSchema] = Field(default=[], description="Chat messages (only those after `since` when given)")
+    next_cursor: Optional[str] = Field(None, description="Pass as `since` on the next poll to get only new messages")
 
 
 class StartInterviewResponse(BaseModel):
@@ -113,6 +114,7 @@ class AnswerResponse(BaseModel):
     next_question: Optional[dict] = Field(None, description="Next question if applicable")
     progress: ProgressSchema = Field(..., description="Updated progress")
     is_complete: bool = Field(default=False, description="Whether interview is complete")
+    job_id: Optional[str] = Field(None, description="Report finalization job (GET /api/reports/jobs/{job_id}) once complete")
 
 
 class SkipResponse(BaseModel):
@@ -122,6 +124,7 @@ class SkipResponse(BaseModel):
     next_question: Optional[dict] = Field(None, description="Next question")
     progress: ProgressSchema = Field(..., description="Updated progress")
     is_complete: bool = Field(default=False, description="Whether interview is complete")
+    job_id: Optional[str] = Field(None, description="Report finalization job (GET /api/reports/jobs/{job_id}) once complete")
 
 
 class PauseResumeResponse(BaseModel):
@@ -139,6 +142,7 @@ class CompleteInterviewResponse(BaseModel):
     session_id: str = Field(..., description="Session ID")
     status: str = Field(default="completing", description="Status")
     summary: dict = Field(..., description="Interview summary")
+    job_id: Optional[str] = Field(None, description="Report finalization job (GET /api/reports/jobs/{job_id})")
 
 
 class ErrorResponse(BaseModel):
@@ -11,24 +11,82 @@ Per requirements:
 - Personality modes affect tone, not scoring
 """
 
+import asyncio
 import time
 import uuid
 import random
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
-from app.core.config import settings
+from app.core.deadline import Deadline
+from app.core.idempotency import IdempotencyConflictError
+from app.ai.gateway import ai_gateway
+from app.ai.circuit_breaker import CircuitOpenError
+from app.ai.prompt_builder import build_prompt
 from app.interviews.live_models import LiveInterviewSession, InterviewMessage, InterviewAnswer
 from app.interviews.plan_models import InterviewPlan
+from app.interviews.session_cache import LiveSessionState, live_session_cache
+from app.interviews.prefetch import question_prefetcher
+from app.interviews.plan_stream import plan_streams, PlanQuestionsPendingError
+from app.interviews.turn_planner import turn_planner, GROQ
 from app.personalities.modes import get_personality, get_default_personality, PersonalityProfile
-from app.reports.service import ReportService
-from app.admin.service import AIAPILogService
+from app.jobs.queue import job_queue
 
 # TOON (Token-Oriented Object Notation) for 30-60% token savings on LLM calls
 from app.utils.toon_encoder import encode_for_llm, wrap_data_for_prompt, get_toon_instruction, get_toon_stats
 
 
+class _TurnRows:
+    """
+    Rows written by one live turn, built up front with client-side ids.
+    
+    Messages get strictly increasing created_at values so the transcript
+    order (and the ?since= cursor) is exactly the order they were built.
+    """
+    
+    def __init__(self, session_id: str, user_id: str, now: datetime):
+        self.session_id = session_id
+        self.user_id = user_id
+        self.now = now
+        self.messages: List[Dict[str, Any]] = []
+        self.answers: List[Dict[str, Any]] = []
+    
+    def message(
+        self,
+        role: str,
+        content: str,
+        message_type: str,
+        question_id: Optional[str] = None,
+        question_index: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        row = {
+            "id": str(uuid.uuid4()),
+            "session_id": self.session_id,
+            "user_id": self.user_id,
+            "role": role,
+            "content": content,
+            "message_type": message_type,
+            "question_id": question_id,
+            "question_index": question_index,
+            "created_at": self.now + timedelta(microseconds=len(self.messages)),
+        }
+        self.messages.append(row)
+        return row
+    
+    def answer(self, **fields: Any) -> Dict[str, Any]:
+        row = {
+            "id": str(uuid.uuid4()),
+            "session_id": self.session_id,
+            "user_id": self.user_id,
+            "submitted_at": self.now,
+            **fields,
+        }
+        self.answers.append(row)
+        return row
+
+
 class LiveInterviewService:
     """
     Service class for live interview operations.
@@ -40,25 +98,16 @@ class LiveInterviewService:
     - Conversational flow with Groq
     """
     
-    def __init__(self, db: Session):
-        """Initialize service with database session."""
-        self.db = db
-        self._groq_client = None
-    
-    def _get_groq_client(self):
-        """Get Groq client if configured."""
-        if not settings.is_groq_configured():
-            return None
-        
-        if self._groq_client is None:
-            try:
-                from groq import Groq
-                self._groq_client = Groq(api_key=settings.GROQ_API_KEY)
-            except Exception as e:
-                print(f"Failed to initialize Groq client: {e}")
-                return None
+    def __init__(self, db: Session, deadline: Optional[Deadline] = None):
+        """
+        Initialize service with database session.
         
-        return self._groq_client
+        Args:
+            db: Database session
+            deadline: Optional request deadline (bounds every AI call)
+        """
+        self.db = db
+        self.deadline = deadline
     
     def _get_personality_profile(self, persona: str) -> PersonalityProfile:
         """Get personality profile from persona ID."""
@@ -253,74 +302,36 @@ class LiveInterviewService:
         max_tokens: int = 150,
         operation: str = "groq_chat",
         user_id: str = None,
-        session_id: str = None
+        session_id: str = None,
+        hedge: bool = False
     ) -> str:
-        """Make a Groq API call with robust error handling and logging."""
-        client = self._get_groq_client()
+        """
+        Make a Groq API call through the async gateway (never blocks the loop).
         
-        if not client:
+        Returns None on error, timeout or open circuit - caller uses its fallback.
+        """
+        if not ai_gateway.is_groq_configured():
             # Return mock response if Groq not configured
             return None
         
-        # Use currently supported model (mixtral-8x7b-32768 is decommissioned)
-        model = "llama-3.1-8b-instant"
-        start_time = time.time()
-        
         try:
-            response = client.chat.completions.create(
-                model=model,
-                messages=messages,
+            response = await ai_gateway.groq_chat(
+                messages,
+                operation,
                 max_tokens=max_tokens,
                 temperature=0.7,
+                db=self.db,
+                deadline=self.deadline,
+                user_id=user_id,
+                session_id=session_id,
+                hedge=hedge,
             )
-            
-            result = response.choices[0].message.content.strip()
-            response_time_ms = int((time.time() - start_time) * 1000)
-            
-            # Log successful AI API call
-            try:
-                # Get token usage if available
-                prompt_tokens = getattr(response.usage, 'prompt_tokens', None) if hasattr(response, 'usage') else None
-                completion_tokens = getattr(response.usage, 'completion_tokens', None) if hasattr(response, 'usage') else None
-                total_tokens = getattr(response.usage, 'total_tokens', None) if hasattr(response, 'usage') else None
-                
-                AIAPILogService.log_ai_call(
-                    db=self.db,
-                    provider="groq",
-                    operation=operation,
-                    model=model,
-                    prompt_tokens=prompt_tokens,
-                    completion_tokens=completion_tokens,
-                    total_tokens=total_tokens,
-                    response_time_ms=response_time_ms,
-                    status="success",
-                    user_id=user_id,
-                    session_id=session_id
-                )
-            except Exception as log_error:
-                print(f"[AI Log Error] Failed to log Groq call: {log_error}")
-            
-            return result
+            return response.text
+        except CircuitOpenError:
+            # Provider degraded - fall back immediately, no log spam
+            return None
         except Exception as e:
-            error_msg = str(e)
-            response_time_ms = int((time.time() - start_time) * 1000)
-            print(f"[Groq API Error] Model: {model}, Error: {error_msg}")
-            
-            # Log failed AI API call
-            try:
-                AIAPILogService.log_ai_call(
-                    db=self.db,
-                    provider="groq",
-                    operation=operation,
-                    model=model,
-                    response_time_ms=response_time_ms,
-                    status="error",
-                    error_message=error_msg[:500],  # Truncate error message
-                    user_id=user_id,
-                    session_id=session_id
-                )
-            except Exception as log_error:
-                print(f"[AI Log Error] Failed to log Groq error: {log_error}")
+            print(f"[Groq API Error] Operation: {operation}, Error: {e}")
             
             # Return None instead of crashing - caller will use fallback
             return None
@@ -376,10 +387,12 @@ Do NOT include any evaluation or scoring language."""
         else:
             quality = "comprehensive"
         
-        messages = [
-            {
-                "role": "system",
-                "content": f"""You are a {profile.name} interviewer providing a brief acknowledgment.
+        messages = build_prompt(
+            "generate_acknowledgment",
+            lambda sections: [
+                {
+                    "role": "system",
+                    "content": f"""You are a {profile.name} interviewer providing a brief acknowledgment.
 
 CRITICAL RULES:
 1. ONE sentence only - a simple acknowledgment
@@ -412,14 +425,18 @@ Examples of BAD acknowledgments (NEVER use):
 - "Can you expand on that point?"
 - "What was the outcome of that project?"
 - "How did you handle the challenges?"""
-            },
-            {
-                "role": "user",
-                "content": f"[DATA:TOON]\n{encode_for_llm({'q': question[:200], 'a': answer[:600]})}\n[/DATA]\n\nGenerate ONE acknowledgment sentence (NO QUESTIONS):"
-            }
-        ]
+                },
+                {
+                    "role": "user",
+                    "content": f"[DATA:TOON]\n{encode_for_llm({'q': sections['question'], 'a': sections['answer']})}\n[/DATA]\n\nGenerate ONE acknowledgment sentence (NO QUESTIONS):"
+                }
+            ],
+            caps={"question": 60},
+            question=question,
+            answer=answer,
+        )
         
-        result = await self._ask_groq(messages, max_tokens=60, operation="generate_acknowledgment", session_id=session_id)
+        result = await self._ask_groq(messages, max_tokens=60, operation="generate_acknowledgment", session_id=session_id, hedge=True)
         
         # Filter out any accidental questions or generic phrases
         if result:
@@ -447,26 +464,27 @@ Examples of BAD acknowledgments (NEVER use):
         """Quick relevance check using Groq with TOON-encoded data."""
         
         # TOON: Encode the data payload for 30-60% token savings
-        data_payload = {
-            "q": question[:300],  # Shortened key for more savings
-            "a": answer[:500],
-        }
-        toon_data = encode_for_llm(data_payload)
-        
-        messages = [
-            {
-                "role": "system",
-                "content": f"""Evaluate if the answer is relevant to the question.
+        # (shortened keys, sections fitted to the token budget)
+        messages = build_prompt(
+            "check_answer_relevance",
+            lambda sections: [
+                {
+                    "role": "system",
+                    "content": f"""Evaluate if the answer is relevant to the question.
 {get_toon_instruction()}
 Return ONLY a JSON object with: relevance (1-10), complete (true/false), flags (array of issues like 'too_short', 'off_topic', 'unclear')"""
-            },
-            {
-                "role": "user",
-                "content": f"[DATA:TOON]\n{toon_data}\n[/DATA]\n\nEvaluate:"
-            }
-        ]
+                },
+                {
+                    "role": "user",
+                    "content": f"[DATA:TOON]\n{encode_for_llm({'q': sections['question'], 'a': sections['answer']})}\n[/DATA]\n\nEvaluate:"
+                }
+            ],
+            caps={"question": 80},
+            question=question,
+            answer=answer,
+        )
         
-        result = await self._ask_groq(messages, max_tokens=100, operation="check_answer_relevance")
+        result = await self._ask_groq(messages, max_tokens=100, operation="check_answer_relevance", hedge=True)
         
         # Parse result or use fallback
         word_count = len(answer.split())
@@ -568,10 +586,12 @@ Tone: STRICT PROFESSIONAL
         }
         type_instruction = type_instructions.get(question_type, "Probe for more specific details.")
         
-        messages = [
-            {
-                "role": "system",
-                "content": f"""You are a {profile.name} conducting a high-stakes interview.
+        messages = build_prompt(
+            "pressure_follow_up",
+            lambda sections: [
+                {
+                    "role": "system",
+                    "content": f"""You are a {profile.name} conducting a high-stakes interview.
 
 TASK: Generate ONE challenging follow-up question based on the candidate's answer.
 
@@ -597,16 +617,20 @@ FORBIDDEN:
 - Generic "can you elaborate" without specifics
 - Multiple questions in one
 - Overly long follow-ups"""
-            },
-            {
-                "role": "user",
-                "content": f"""Original Question: {question[:300]}
+                },
+                {
+                    "role": "user",
+                    "content": f"""Original Question: {sections['question']}
 
-Candidate's Answer: {answer[:600]}
+Candidate's Answer: {sections['answer']}
 
 Generate ONE challenging follow-up question:"""
-            }
-        ]
+                }
+            ],
+            caps={"question": 80},
+            question=question,
+            answer=answer,
+        )
         
         result = await self._ask_groq(messages, max_tokens=80, operation="pressure_follow_up")
         
@@ -690,10 +714,432 @@ Generate the challenging variant:"""
         result = await self._ask_groq(messages, max_tokens=150, operation="stress_mode_question")
         return result if result else original_question
     
+    # ===========================================
+    # TURN HELPERS (run concurrently in submit_answer)
+    # ===========================================
+    
+    async def _quick_evaluate_answer(self, question: str, answer: str, use_ai: bool = True) -> Dict[str, Any]:
+        """Quick relevance check via Groq, or the local heuristic (not configured, or planned out)."""
+        if use_ai and ai_gateway.is_groq_configured():
+            return await self._check_answer_relevance(question, answer)
+        
+        # Mock evaluation
+        word_count = len(answer.split())
+        flags = []
+        if word_count < 10:
+            flags.append("too_short")
+        return {
+            "relevance": 7 if word_count >= 10 else 4,
+            "is_complete": word_count >= 20,
+            "flags": flags,
+        }
+    
+    async def _acknowledge_answer(
+        self,
+        persona: str,
+        question: str,
+        answer: str,
+        session_id: str,
+        use_ai: bool = True,
+    ) -> str:
+        """Acknowledgment via Groq, or the local varied acknowledgment (not configured, or planned out)."""
+        if use_ai and ai_gateway.is_groq_configured():
+            return await self._generate_groq_acknowledgment(persona, question, answer, session_id)
+        return self._get_acknowledgment(persona, len(answer.split()), session_id)
+    
+    async def _prepare_next_question(
+        self,
+        persona: str,
+        questions: List[Dict[str, Any]],
+        next_index: int,
+        default_difficulty: str = "medium",
+        state: Optional[LiveSessionState] = None,
+    ) -> Optional[tuple]:
+        """
+        Build the next question turn.
+        
+        Uses the prefetched content for the question when it is ready
+        (see app/interviews/prefetch.py), otherwise formats it here.
+        
+        Returns:
+            (message content, next_question payload), or None when the
+            interview is complete.
+        """
+        total = len(questions)
+        if state is not None:
+            await self._await_streamed_question(state, next_index)
+            questions, total = state.questions, state.total_questions
+        
+        if next_index >= len(questions):
+            return None
+        
+        next_q = questions[next_index]
+        prefetched = await question_prefetcher.take(state, next_index) if state is not None else None
+        if prefetched:
+            transition = prefetched["transition"]
+            question_text = prefetched["question_text"]
+            if prefetched["source"] != "plan":
+                state.served_question_text[next_index] = question_text
+        else:
+            transition = self._get_transition(persona, next_index + 1, total)
+            question_text = self._format_question(next_q, persona)
+        
+        next_question = {
+            "id": next_q.get("id"),
+            "text": question_text,
+            "type": next_q.get("type", "general"),
+            "category": next_q.get("category", "General"),
+            "round_name": next_q.get("round_name", next_q.get("category", "Technical Round")),  # NEW
+            "difficulty": next_q.get("difficulty", default_difficulty),  # NEW
+            "company_style": next_q.get("company_style"),  # NEW
+            "index": next_index,
+        }
+        return f"{transition} {question_text}", next_question
+    
+    async def _await_streamed_question(self, state: LiveSessionState, index: int) -> bool:
+        """
+        Make sure question `index` is loaded when the plan is still
+        streaming in (see app/interviews/plan_stream.py).
+        
+        Only waits when the question is due but has not arrived yet.
+        
+        Returns:
+            True if the question is available, False if the plan has no
+            question `index` (the interview is complete)
+        
+        Raises:
+            PlanQuestionsPendingError: The question is due but still
+                missing after the wait - the turn must be retried, not
+                treated as the end of the interview
+        """
+        if index < len(state.questions):
+            return True
+        if index >= state.total_questions:
+            return False
+        
+        print(f"[PlanStream] Session {state.session_id} waiting for question {index + 1}/{state.total_questions}")
+        questions = await plan_streams.wait_for_questions(state.plan_id, index + 1)
+        if len(questions) > len(state.questions):
+            state.questions = questions
+        if index >= len(state.questions):
+            raise PlanQuestionsPendingError(
+                "The next question is still being generated, please try again in a moment"
+            )
+        return True
+    
+    # ===========================================
+    # NEXT-QUESTION PREFETCH
+    # ===========================================
+    
+    async def _build_question_content(
+        self,
+        persona: str,
+        question: Dict[str, Any],
+        index: int,
+        total: int,
+        default_difficulty: str = "medium",
+    ) -> Dict[str, Any]:
+        """
+        AI-derived content for an upcoming question: the persona
+        transition and the question text - a harder variant for
+        high-pressure personas (strict, stress) when Groq is available.
+        """
+        profile = self._get_personality_profile(persona)
+        source = "plan"
+        
+        if profile.follow_up_config.pressure_level == "high" and ai_gateway.is_groq_configured():
+            variant = await self._generate_stress_mode_question_variant(
+                question.get("text", ""),
+                question.get("type", "general"),
+                question.get("difficulty", default_difficulty),
+            )
+            if variant and variant != question.get("text"):
+                question = {**question, "text": variant.strip()}
+                source = "pressure_variant"
+        
+        return {
+            "transition": self._get_transition(persona, index + 1, total),
+            "question_text": self._format_question(question, persona),
+            "source": source,
+        }
+    
+    def _schedule_prefetch(self, state: LiveSessionState) -> None:
+        """
+        Prefetch the question after the one the candidate is answering.
+        
+        Only worth a background task when there is AI work to hide; the
+        plain persona formatting is instant and done at submit time.
+        """
+        profile = state.profile or self._get_personality_profile(state.interviewer_persona)
+        if profile.follow_up_config.pressure_level != "high" or not ai_gateway.is_groq_configured():
+            return
+        
+        index = state.current_question_index + 1
+        if index >= len(state.questions):
+            return
+        
+        persona = state.interviewer_persona
+        question = state.questions[index]
+        total = state.total_questions
+        difficulty = state.plan_difficulty
+        
+        async def build() -> Dict[str, Any]:
+            # Runs after the request's DB session is closed - the AI call
+            # log is write-behind, so the prefetch needs no session of its own
+            service = LiveInterviewService(None, deadline=Deadline.realtime())
+            return await service._build_question_content(persona, question, index, total, difficulty)
+        
+        question_prefetcher.schedule(state, index, build)
+    
+    # ===========================================
+    # SESSION STATE (write-through cache)
+    # ===========================================
+    
+    def _load_state(self, session_id: str, user_id: str) -> LiveSessionState:
+        """
+        Session state for the hot path - no database read on a cache hit.
+        
+        Raises:
+            ValueError: Session or plan not found
+        """
+        state = live_session_cache.get(session_id)
+        if state is not None:
+            if state.user_id != user_id:
+                raise ValueError("Session not found")
+            return state
+        
+        session = self.db.query(LiveInterviewSession).filter(
+            LiveInterviewSession.id == session_id,
+            LiveInterviewSession.user_id == user_id,
+        ).first()
+        
+        if not session:
+            raise ValueError("Session not found")
+        
+        plan = self.db.query(InterviewPlan).filter(
+            InterviewPlan.id == session.plan_id,
+        ).first()
+        
+        if not plan:
+            raise ValueError("Interview plan not found")
+        
+        state = LiveSessionState.from_rows(
+            session, plan, self._get_personality_profile(session.interviewer_persona)
+        )
+        live_session_cache.put(state)
+        return state
+    
+    def _require_status(self, state: LiveSessionState, status: str, action: str) -> LiveSessionState:
+        """
+        Check the session is in `status` before `action`.
+        
+        A cached entry goes stale when another worker pauses, resumes or
+        ends the session. On a mismatch the entry is dropped and the row
+        re-read before rejecting, so only the error path costs a read.
+        
+        Returns:
+            The state to continue with (reloaded on a mismatch)
+        
+        Raises:
+            ValueError: The session is not in `status`
+        """
+        if state.status != status:
+            live_session_cache.invalidate(state.session_id)
+            state = self._load_state(state.session_id, state.user_id)
+            if state.status != status:
+                raise ValueError(f"Cannot {action}: session is {state.status}")
+        return state
+    
+    def _write_session(self, state: LiveSessionState, **fields: Any) -> None:
+        """
+        UPDATE the session row (no read), guarded by the status and question
+        index the caller's turn was computed from. Not committed.
+        
+        Raises:
+            ValueError: The session moved on since it was read (another
+                request or worker) - the cached entry is dropped
+        """
+        updated = self.db.query(LiveInterviewSession).filter(
+            LiveInterviewSession.id == state.session_id,
+            LiveInterviewSession.status == state.status,
+            LiveInterviewSession.current_question_index == state.current_question_index,
+        ).update(fields)
+        
+        if not updated:
+            self.db.rollback()
+            live_session_cache.invalidate(state.session_id)
+            raise ValueError("Session state changed, please refresh and try again")
+    
+    def _commit_turn(self, state: LiveSessionState, turn: "_TurnRows", **fields: Any) -> None:
+        """
+        Write a whole turn in one short transaction: the guarded session
+        UPDATE, one multi-row INSERT per table, COMMIT.
+        
+        Every row is fully built (ids included) before this is called, so
+        the write lock - the whole database on SQLite - is held only for
+        these statements, not for ORM flush bookkeeping or AI calls.
+        """
+        self._write_session(state, **fields)
+        try:
+            # Core inserts on the tables: one executemany per table (the
+            # ORM bulk path splits rows whose None columns differ)
+            if turn.messages:
+                self.db.execute(InterviewMessage.__table__.insert(), turn.messages)
+            if turn.answers:
+                self.db.execute(InterviewAnswer.__table__.insert(), turn.answers)
+        except Exception:
+            self.db.rollback()
+            live_session_cache.invalidate(state.session_id)
+            raise
+        self._commit_state(state, **fields)
+    
+    def _commit_state(self, state: LiveSessionState, **fields: Any) -> None:
+        """Commit the turn, then apply the written fields to the cached state."""
+        try:
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            live_session_cache.invalidate(state.session_id)
+            raise
+        live_session_cache.update(state, **fields)
+    
+    # ===========================================
+    # IDEMPOTENT TURNS
+    # ===========================================
+    
+    def _find_turn(self, session_id: str, idempotency_key: Optional[str]) -> Optional[InterviewAnswer]:
+        """Answer row already written by a request with this Idempotency-Key."""
+        if not idempotency_key:
+            return None
+        return self.db.query(InterviewAnswer).filter(
+            InterviewAnswer.session_id == session_id,
+            InterviewAnswer.idempotency_key == idempotency_key,
+        ).first()
+    
+    def _replay_turn(
+        self,
+        state: LiveSessionState,
+        answer: InterviewAnswer,
+        answer_text: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Rebuild the response of a turn that was already written.
+        
+        Serves retries whose Idempotency-Key is not in this worker's
+        response store (another worker, a restart, an evicted entry) from
+        the turn's own rows, so the retry never records a second answer.
+        
+        Args:
+            answer_text: The retried answer (None for a skip)
+        
+        Raises:
+            IdempotencyConflictError: The key was used for a different turn
+        """
+        is_skip = answer_text is None
+        if bool(answer.is_skipped) != is_skip or (not is_skip and answer.answer_text != answer_text):
+            raise IdempotencyConflictError("Idempotency-Key was already used for a different request")
+        
+        # A turn's messages share its timestamp, offset by a microsecond each (see _TurnRows)
+        messages = self.db.query(InterviewMessage).filter(
+            InterviewMessage.session_id == state.session_id,
+            InterviewMessage.created_at >= answer.submitted_at,
+            InterviewMessage.created_at < answer.submitted_at + timedelta(milliseconds=1),
+        ).order_by(InterviewMessage.created_at).all()
+        by_type = {m.message_type: m for m in messages}
+        
+        answer_msg = next((m for m in messages if m.id == answer.message_id), None)
+        next_index = (answer_msg.question_index if answer_msg and answer_msg.question_index is not None else 0) + 1
+        
+        next_question = None
+        question_msg = by_type.get("question")
+        if question_msg is not None and question_msg.question_index is not None and question_msg.question_index < len(state.questions):
+            q = state.questions[question_msg.question_index]
+            next_question = {
+                "id": q.get("id"),
+                "text": (
+                    state.served_question_text.get(question_msg.question_index)
+                    or self._format_question(q, state.interviewer_persona)
+                ),
+                "type": q.get("type", "general"),
+                "category": q.get("category", "General"),
+                "round_name": q.get("round_name", q.get("category", "Technical Round")),
+                "difficulty": q.get("difficulty", state.plan_difficulty),
+                "index": question_msg.question_index,
+            }
+        is_complete = next_question is None
+        
+        # Progress as it was right after this turn
+        turns = self.db.query(InterviewAnswer.is_skipped).filter(
+            InterviewAnswer.session_id == state.session_id,
+            InterviewAnswer.submitted_at <= answer.submitted_at,
+        ).all()
+        questions_skipped = sum(1 for (skipped,) in turns if skipped)
+        questions_answered = len(turns) - questions_skipped
+        done = questions_answered if not is_skip else questions_answered + questions_skipped
+        progress_percent = (done / state.total_questions * 100) if state.total_questions > 0 else 0
+        
+        job_id = None
+        if is_complete:
+            job = job_queue.find_active(self.db, "finalize_interview", state.session_id)
+            job_id = job.id if job else None
+        
+        result = {
+            "success": True,
+            "next_question": next_question,
+            "progress": {
+                "current_question": next_index + 1,
+                "total_questions": state.total_questions,
+                "questions_answered": questions_answered,
+                "questions_skipped": questions_skipped,
+                "progress_percent": round(progress_percent, 1),
+            },
+            "is_complete": is_complete,
+            "job_id": job_id,
+        }
+        if is_skip:
+            result["message"] = "Question skipped"
+        else:
+            if next_question is not None:
+                next_question["company_style"] = state.questions[next_question["index"]].get("company_style")
+            acknowledgment = by_type.get("acknowledgment")
+            result.update({
+                "acknowledgment": acknowledgment.content if acknowledgment else "",
+                "quick_eval": {
+                    "relevance": answer.quick_eval_relevance if answer.quick_eval_relevance is not None else 7,
+                    "is_complete": answer.quick_eval_complete if answer.quick_eval_complete is not None else True,
+                    "flags": answer.quick_eval_flags or [],
+                },
+                "next_action": "complete" if is_complete else "next_question",
+            })
+        return result
+    
     # ===========================================
     # SESSION MANAGEMENT
     # ===========================================
     
+    def _queue_finalization(self, session_id: str, user_id: str) -> Optional[str]:
+        """
+        Queue report finalization for a completed session.
+        
+        Never fails the turn that completed the interview - if queueing
+        fails, GET /api/reports/{session_id} queues it on first view.
+        
+        Returns:
+            Job id, or None if it could not be queued
+        """
+        try:
+            job = job_queue.enqueue(
+                self.db,
+                job_type="finalize_interview",
+                job_key=session_id,
+                user_id=user_id,
+            )
+            return job.id
+        except Exception as e:
+            self.db.rollback()
+            print(f"[FINALIZE] Warning: Could not queue finalization for session {session_id}: {e}")
+            return None
+    
     async def start_interview(
         self,
         plan_id: str,
@@ -796,9 +1242,14 @@ Generate the challenging variant:"""
         if not questions:
             raise ValueError("Interview plan has no questions. Please regenerate the plan.")
         
+        # A plan still streaming in already has its total; the rest arrive during the interview
+        total_questions = len(questions)
+        if plan.status == "generating":
+            total_questions = max(total_questions, plan.total_questions or 0)
+        
         # CRITICAL: Log plan structure for debugging
         print(f"[PLAN_INTEGRITY] Plan ID: {plan_id}")
-        print(f"[PLAN_INTEGRITY] Total questions: {len(questions)}")
+        print(f"[PLAN_INTEGRITY] Total questions: {len(questions)}/{total_questions}")
         print(f"[PLAN_INTEGRITY] First question ID: {questions[0].get('id', 'N/A')}")
         print(f"[PLAN_INTEGRITY] Question types: {[q.get('type', 'unknown') for q in questions[:5]]}...")
         
@@ -809,7 +1260,19 @@ Generate the challenging variant:"""
         
         
         # ===========================================
-        # STEP 4: Create session (with rollback protection)
+        # STEP 4: Generate greeting ONLY
+        # CRITICAL: Do NOT send first question yet
+        # Frontend will request first question after consent
+        # Runs before the INSERT below: a flushed write holds the SQLite
+        # write lock, which must not stay open across the Groq call
+        # ===========================================
+        if ai_gateway.is_groq_configured():
+            greeting = await self._generate_groq_greeting(persona, plan.target_role)
+        else:
+            greeting = self._get_persona_greeting(persona, plan.target_role)
+        
+        # ===========================================
+        # STEP 5: Create session (with rollback protection)
         # ===========================================
         try:
             session = LiveInterviewSession(
@@ -820,7 +1283,7 @@ Generate the challenging variant:"""
                 session_type=plan.session_type,
                 difficulty_level=plan.difficulty_level,
                 interviewer_persona=persona,
-                total_questions=len(questions),
+                total_questions=total_questions,
                 current_question_index=0,
                 status="in_progress",
                 questions_answered=0,
@@ -833,22 +1296,12 @@ Generate the challenging variant:"""
             self.db.flush()  # Get session ID without committing
             
             # ===========================================
-            # STEP 5: Mark plan as used
+            # STEP 6: Mark plan as used
             # ===========================================
             plan.is_used = True
             plan.used_for_session_id = session.id
             plan.status = "used"
             
-            # ===========================================
-            # STEP 6: Generate greeting ONLY
-            # CRITICAL: Do NOT send first question yet
-            # Frontend will request first question after consent
-            # ===========================================
-            if settings.is_groq_configured():
-                greeting = await self._generate_groq_greeting(persona, plan.target_role)
-            else:
-                greeting = self._get_persona_greeting(persona, plan.target_role)
-            
             # Add greeting message (ONLY greeting, not question)
             greeting_msg = InterviewMessage(
                 session_id=session.id,
@@ -876,6 +1329,11 @@ Generate the challenging variant:"""
             self.db.commit()
             self.db.refresh(session)
             
+            # Prime the hot-path cache with the parsed plan
+            live_session_cache.put(
+                LiveSessionState.from_rows(session, plan, self._get_personality_profile(persona))
+            )
+            
             return {
                 "session_id": session.id,
                 "status": session.status,
@@ -893,7 +1351,7 @@ Generate the challenging variant:"""
                 },
                 "progress": {
                     "current_question": 1,
-                    "total_questions": len(questions),
+                    "total_questions": total_questions,
                     "questions_answered": 0,
                     "questions_skipped": 0,
                     "progress_percent": 0,
@@ -926,38 +1384,22 @@ Generate the challenging variant:"""
         
         This completes the greeting -> consent -> interview flow.
         """
-        # Get session
-        session = self.db.query(LiveInterviewSession).filter(
-            LiveInterviewSession.id == session_id,
-            LiveInterviewSession.user_id == user_id,
-        ).first()
-        
-        if not session:
-            raise ValueError("Session not found")
-        
-        if session.status != "in_progress":
-            raise ValueError(f"Cannot confirm consent: session is {session.status}")
-        
-        # Get plan
-        plan = self.db.query(InterviewPlan).filter(
-            InterviewPlan.id == session.plan_id,
-        ).first()
+        state = self._load_state(session_id, user_id)
         
-        if not plan:
-            raise ValueError("Interview plan not found")
+        state = self._require_status(state, "in_progress", "confirm consent")
         
-        questions = plan.questions or []
+        questions = state.questions
         if not questions:
             raise ValueError("No questions in plan")
         
         # Get first question
         first_question = questions[0]
-        persona = session.interviewer_persona or "professional"
+        persona = state.interviewer_persona
         question_text = self._format_question(first_question, persona)
         
         # NOW add the first question message to database
         question_msg = InterviewMessage(
-            session_id=session.id,
+            session_id=state.session_id,
             user_id=user_id,
             role="interviewer",
             content=question_text,
@@ -968,9 +1410,10 @@ Generate the challenging variant:"""
         self.db.add(question_msg)
         
         # Update session last activity
-        session.last_activity_at = datetime.utcnow()
-        
-        self.db.commit()
+        changes = {"last_activity_at": datetime.utcnow()}
+        self._write_session(state, **changes)
+        self._commit_state(state, **changes)
+        self._schedule_prefetch(state)
         
         return {
             "success": True,
@@ -980,81 +1423,112 @@ Generate the challenging variant:"""
                 "type": first_question.get("type", "general"),
                 "category": first_question.get("category", "General"),
                 "round_name": first_question.get("round_name", first_question.get("category", "Technical Round")),
-                "difficulty": first_question.get("difficulty", plan.difficulty_level),
-                "company_style": first_question.get("company_style", plan.company_mode),
+                "difficulty": first_question.get("difficulty", state.plan_difficulty),
+                "company_style": first_question.get("company_style", state.plan_company_mode),
                 "index": 0,
             },
             "progress": {
                 "current_question": 1,
-                "total_questions": len(questions),
+                "total_questions": state.total_questions,
                 "questions_answered": 0,
                 "questions_skipped": 0,
                 "progress_percent": 0,
             },
         }
     
+    @staticmethod
+    def parse_message_cursor(since: str) -> Tuple[datetime, Optional[str]]:
+        """
+        Parse a transcript cursor: "<created_at ISO>|<message id>" as
+        returned in next_cursor, or a bare ISO timestamp.
+        
+        Raises:
+            ValueError: Malformed cursor
+        """
+        created_at, _, message_id = since.partition("|")
+        try:
+            timestamp = datetime.fromisoformat(created_at.strip().rstrip("Z"))
+        except ValueError:
+            raise ValueError(f"Invalid since cursor: {since}")
+        return timestamp, message_id or None
+    
     async def get_session_state(
         self,
         session_id: str,
         user_id: str,
+        include_messages: bool = True,
+        since: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Get current session state.
         
         Used for resuming after refresh.
-        """
-        # Get session
-        session = self.db.query(LiveInterviewSession).filter(
-            LiveInterviewSession.id == session_id,
-            LiveInterviewSession.user_id == user_id,
-        ).first()
         
-        if not session:
-            raise ValueError("Session not found")
-        
-        # Get plan
-        plan = self.db.query(InterviewPlan).filter(
-            InterviewPlan.id == session.plan_id,
-        ).first()
-        
-        if not plan:
-            raise ValueError("Interview plan not found")
-        
-        questions = plan.questions or []
+        Args:
+            include_messages: Also load the chat history (one DB query);
+                without it the state is served from memory
+            since: Transcript cursor (next_cursor of the previous call) -
+                only messages after it are returned. Keyset read on the
+                (session_id, created_at) index, so a poll costs the same
+                at question 2 and question 20
+        """
+        state = self._load_state(session_id, user_id)
+        questions = state.questions
         
         # Get messages
-        messages = self.db.query(InterviewMessage).filter(
-            InterviewMessage.session_id == session_id,
-        ).order_by(InterviewMessage.created_at).all()
+        messages = []
+        next_cursor = since
+        if include_messages:
+            query = self.db.query(InterviewMessage).filter(
+                InterviewMessage.session_id == session_id,
+            )
+            if since:
+                after, after_id = self.parse_message_cursor(since)
+                if after_id:
+                    query = query.filter(or_(
+                        InterviewMessage.created_at > after,
+                        and_(InterviewMessage.created_at == after, InterviewMessage.id > after_id),
+                    ))
+                else:
+                    query = query.filter(InterviewMessage.created_at > after)
+            messages = query.order_by(InterviewMessage.created_at, InterviewMessage.id).all()
+            if messages:
+                next_cursor = messages[-1].cursor
         
         # Get current question
         current_question = None
-        if session.status == "in_progress" and session.current_question_index < len(questions):
-            q = questions[session.current_question_index]
+        if state.status == "in_progress" and state.current_question_index < len(questions):
+            q = questions[state.current_question_index]
             current_question = {
                 "id": q.get("id"),
-                "text": self._format_question(q, session.interviewer_persona),
+                "text": (
+                    state.served_question_text.get(state.current_question_index)
+                    or self._format_question(q, state.interviewer_persona)
+                ),
                 "type": q.get("type", "general"),
                 "category": q.get("category", "General"),
-                "index": session.current_question_index,
+                "index": state.current_question_index,
             }
         
-        progress_percent = (session.questions_answered / session.total_questions * 100) if session.total_questions > 0 else 0
+            self._schedule_prefetch(state)
+        
+        progress_percent = (state.questions_answered / state.total_questions * 100) if state.total_questions > 0 else 0
         
         return {
-            "session_id": session.id,
-            "status": session.status,
-            "target_role": session.target_role,
-            "interviewer_persona": session.interviewer_persona,
+            "session_id": state.session_id,
+            "status": state.status,
+            "target_role": state.target_role,
+            "interviewer_persona": state.interviewer_persona,
             "progress": {
-                "current_question": session.current_question_index + 1,
-                "total_questions": session.total_questions,
-                "questions_answered": session.questions_answered,
-                "questions_skipped": session.questions_skipped,
+                "current_question": state.current_question_index + 1,
+                "total_questions": state.total_questions,
+                "questions_answered": state.questions_answered,
+                "questions_skipped": state.questions_skipped,
                 "progress_percent": round(progress_percent, 1),
             },
             "current_question": current_question,
             "messages": [m.to_dict() for m in messages],
+            "next_cursor": next_cursor,
         }
     
     async def submit_answer(
@@ -1063,40 +1537,38 @@ Generate the challenging variant:"""
         user_id: str,
         answer_text: str,
         response_time_seconds: Optional[int] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Submit an answer to the current question.
         
+        Args:
+            idempotency_key: Stored on the answer row; a retry with the
+                same key gets the original turn back instead of answering
+                the next question
+        
         Returns:
             Acknowledgment and next action
         """
-        # Get session
-        session = self.db.query(LiveInterviewSession).filter(
-            LiveInterviewSession.id == session_id,
-            LiveInterviewSession.user_id == user_id,
-        ).first()
+        state = self._load_state(session_id, user_id)
         
-        if not session:
-            raise ValueError("Session not found")
+        written = self._find_turn(session_id, idempotency_key)
+        if written is not None:
+            return self._replay_turn(state, written, answer_text)
         
-        if session.status != "in_progress":
-            raise ValueError(f"Cannot submit answer: session is {session.status}")
+        state = self._require_status(state, "in_progress", "submit answer")
         
-        # Get plan
-        plan = self.db.query(InterviewPlan).filter(
-            InterviewPlan.id == session.plan_id,
-        ).first()
-        
-        questions = plan.questions or []
+        questions = state.questions
+        current_index = state.current_question_index
         
-        if session.current_question_index >= len(questions):
+        if current_index >= len(questions):
             raise ValueError("No more questions to answer")
         
-        current_question = questions[session.current_question_index]
+        current_question = questions[current_index]
         
         # CRITICAL: Log question serving for debugging
         print(f"[QUESTION_SERVE] Session: {session_id}")
-        print(f"[QUESTION_SERVE] Current index: {session.current_question_index}/{len(questions)}")
+        print(f"[QUESTION_SERVE] Current index: {current_index}/{len(questions)}")
         print(f"[QUESTION_SERVE] Question ID: {current_question.get('id', 'N/A')}")
         print(f"[QUESTION_SERVE] Question type: {current_question.get('type', 'unknown')}")
         
@@ -1105,152 +1577,112 @@ Generate the challenging variant:"""
             raise ValueError("Answer cannot be empty")
         
         word_count = len(answer_text.split())
+        persona = state.interviewer_persona
+        next_index = current_index + 1
         
-        # Save answer message
-        answer_msg = InterviewMessage(
-            session_id=session.id,
-            user_id=user_id,
+        # ===========================================
+        # CONCURRENT AI STEP
+        # Relevance check, acknowledgment and next-question formatting
+        # are independent of each other - run them together so a turn
+        # costs one Groq round trip instead of two back to back.
+        # ACKNOWLEDGMENT ONLY - NO FOLLOW-UP QUESTIONS
+        # The next question comes from the pre-defined list
+        # This prevents "biased" continuation questions
+        # ===========================================
+        # The turn planner picks Groq or the local fallback per enrichment
+        # from the answer length and rolling Groq latency
+        turn_plan = turn_planner.plan(word_count)
+        asked_text = state.served_question_text.get(current_index) or current_question.get("text", "")
+        ai_started = time.perf_counter()
+        quick_eval, acknowledgment, next_turn = await asyncio.gather(
+            self._quick_evaluate_answer(asked_text, answer_text, use_ai=turn_plan.relevance == GROQ),
+            self._acknowledge_answer(
+                persona, asked_text, answer_text, session_id,
+                use_ai=turn_plan.acknowledgment == GROQ,
+            ),
+            self._prepare_next_question(persona, questions, next_index, state.plan_difficulty, state=state),
+        )
+        turn_plan.elapsed_ms = int((time.perf_counter() - ai_started) * 1000)
+        
+        # ===========================================
+        # WRITE TURN RESULTS IN ONE GO
+        # All rows are built first (ids assigned here), then written in
+        # one short transaction - see _commit_turn
+        # ===========================================
+        
+        is_complete = next_turn is None
+        next_question = None
+        
+        now = datetime.utcnow()
+        turn = _TurnRows(session_id, user_id, now)
+        
+        # Answer message + answer record
+        answer_msg = turn.message(
             role="candidate",
             content=answer_text,
             message_type="answer",
             question_id=current_question.get("id"),
-            question_index=session.current_question_index,
+            question_index=current_index,
         )
-        self.db.add(answer_msg)
-        
-        # Save answer record
-        answer = InterviewAnswer(
-            session_id=session.id,
-            user_id=user_id,
+        turn.answer(
             question_id=current_question.get("id"),
-            message_id=answer_msg.id,
+            message_id=answer_msg["id"],
             answer_text=answer_text,
             word_count=word_count,
             response_time_seconds=response_time_seconds,
+            is_skipped=False,
+            quick_eval_relevance=quick_eval.get("relevance", 7),
+            quick_eval_complete=quick_eval.get("is_complete", True),
+            quick_eval_flags=quick_eval.get("flags", []),
+            turn_plan=turn_plan.to_dict(),
+            idempotency_key=idempotency_key,
         )
         
-        # Quick evaluation
-        if settings.is_groq_configured():
-            quick_eval = await self._check_answer_relevance(
-                current_question.get("text", ""),
-                answer_text
-            )
-        else:
-            # Mock evaluation
-            flags = []
-            if word_count < 10:
-                flags.append("too_short")
-            quick_eval = {
-                "relevance": 7 if word_count >= 10 else 4,
-                "is_complete": word_count >= 20,
-                "flags": flags,
-            }
-        
-        answer.quick_eval_relevance = quick_eval.get("relevance", 7)
-        answer.quick_eval_complete = quick_eval.get("is_complete", True)
-        answer.quick_eval_flags = quick_eval.get("flags", [])
-        
-        self.db.add(answer)
-        
-        # ===========================================
-        # ACKNOWLEDGMENT ONLY - NO FOLLOW-UP QUESTIONS
-        # The next question comes from the pre-defined list
-        # This prevents "biased" continuation questions
-        # ===========================================
-        
-        # Generate acknowledgment (summarizes user's answer only)
-        if settings.is_groq_configured():
-            acknowledgment = await self._generate_groq_acknowledgment(
-                session.interviewer_persona,
-                current_question.get("text", ""),
-                answer_text,
-                session.id
-            )
-        else:
-            acknowledgment = self._get_acknowledgment(session.interviewer_persona, word_count, session.id)
-        
-        # Add acknowledgment message
-        ack_msg = InterviewMessage(
-            session_id=session.id,
-            user_id=user_id,
-            role="interviewer",
-            content=acknowledgment,
-            message_type="acknowledgment",
-        )
-        self.db.add(ack_msg)
-        
-        # Update session state
-        session.questions_answered += 1
-        session.current_question_index += 1
-        session.last_activity_at = datetime.utcnow()
-        
-        # Check if interview is complete
-        is_complete = session.current_question_index >= len(questions)
-        next_question = None
+        # Acknowledgment message
+        turn.message(role="interviewer", content=acknowledgment, message_type="acknowledgment")
         
         if is_complete:
-            session.status = "completed"  # FIXED: Was "completing", caused analytics to show 0 interviews
-            session.completed_at = datetime.utcnow()
-            
-            # Add completion message
-            completion_msg = InterviewMessage(
-                session_id=session.id,
-                user_id=user_id,
+            # Completion message
+            turn.message(
                 role="interviewer",
                 content="That concludes our interview. Thank you for your time and thoughtful responses. We'll have your results ready shortly.",
                 message_type="transition",
             )
-            self.db.add(completion_msg)
-            
-            # CRITICAL: Trigger automatic report finalization
-            # This ensures report is ALWAYS saved, not relying on frontend
-            try:
-                report_service = ReportService(self.db)
-                await report_service.finalize_interview(
-                    session_id=session.id,
-                    user_id=user_id,
-                )
-                print(f"[SUBMIT_ANSWER] Report finalized automatically for session: {session.id}")
-            except Exception as e:
-                # Log but don't fail the answer submission
-                print(f"[SUBMIT_ANSWER] Warning: Auto-finalization failed: {e}")
-                # Report will still be generated later when user views results
         else:
-            # Get next question
-            next_q = questions[session.current_question_index]
-            transition = self._get_transition(
-                session.interviewer_persona,
-                session.current_question_index + 1,
-                len(questions)
-            )
-            question_text = self._format_question(next_q, session.interviewer_persona)
+            next_msg_content, next_question = next_turn
             
-            # Add next question message
-            next_msg = InterviewMessage(
-                session_id=session.id,
-                user_id=user_id,
+            # Next question message
+            turn.message(
                 role="interviewer",
-                content=f"{transition} {question_text}",
+                content=next_msg_content,
                 message_type="question",
-                question_id=next_q.get("id"),
-                question_index=session.current_question_index,
+                question_id=next_question["id"],
+                question_index=next_index,
             )
-            self.db.add(next_msg)
-            
-            next_question = {
-                "id": next_q.get("id"),
-                "text": question_text,
-                "type": next_q.get("type", "general"),
-                "category": next_q.get("category", "General"),
-                "round_name": next_q.get("round_name", next_q.get("category", "Technical Round")),  # NEW
-                "difficulty": next_q.get("difficulty", plan.difficulty_level if plan else "medium"),  # NEW
-                "company_style": next_q.get("company_style"),  # NEW
-                "index": session.current_question_index,
-            }
         
-        self.db.commit()
+        # Session state
+        changes = {
+            "questions_answered": state.questions_answered + 1,
+            "current_question_index": next_index,
+            "last_activity_at": now,
+        }
+        if is_complete:
+            changes["status"] = "completed"  # FIXED: Was "completing", caused analytics to show 0 interviews
+            changes["completed_at"] = now
+        
+        self._commit_turn(state, turn, **changes)
+        
+        # CRITICAL: Trigger automatic report finalization
+        # Queued, not awaited - the final answer returns right away and
+        # GET /api/reports/{session_id} joins the same job
+        if is_complete:
+            job_id = self._queue_finalization(session_id, user_id)
+        else:
+            job_id = None
+            self._schedule_prefetch(state)
         
-        progress_percent = (session.questions_answered / session.total_questions * 100) if session.total_questions > 0 else 0
+        questions_answered = changes["questions_answered"]
+        progress_percent = (questions_answered / state.total_questions * 100) if state.total_questions > 0 else 0
         
         return {
             "success": True,
@@ -1259,106 +1691,54 @@ Generate the challenging variant:"""
             "next_action": "complete" if is_complete else "next_question",
             "next_question": next_question,
             "progress": {
-                "current_question": session.current_question_index + 1,
-                "total_questions": session.total_questions,
-                "questions_answered": session.questions_answered,
-                "questions_skipped": session.questions_skipped,
+                "current_question": next_index + 1,
+                "total_questions": state.total_questions,
+                "questions_answered": questions_answered,
+                "questions_skipped": state.questions_skipped,
                 "progress_percent": round(progress_percent, 1),
             },
             "is_complete": is_complete,
+            "job_id": job_id,
         }
     
     async def skip_question(
         self,
         session_id: str,
         user_id: str,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Skip the current question."""
-        # Get session
-        session = self.db.query(LiveInterviewSession).filter(
-            LiveInterviewSession.id == session_id,
-            LiveInterviewSession.user_id == user_id,
-        ).first()
+        """Skip the current question (a retried idempotency_key does not skip a second one)."""
+        state = self._load_state(session_id, user_id)
         
-        if not session:
-            raise ValueError("Session not found")
-        
-        if session.status != "in_progress":
-            raise ValueError(f"Cannot skip: session is {session.status}")
+        written = self._find_turn(session_id, idempotency_key)
+        if written is not None:
+            return self._replay_turn(state, written)
         
-        # Get plan
-        plan = self.db.query(InterviewPlan).filter(
-            InterviewPlan.id == session.plan_id,
-        ).first()
+        state = self._require_status(state, "in_progress", "skip")
         
-        questions = plan.questions or []
+        questions = state.questions
+        current_index = state.current_question_index
         
-        if session.current_question_index >= len(questions):
+        if current_index >= len(questions):
             raise ValueError("No more questions")
         
-        current_question = questions[session.current_question_index]
-        
-        # Record skipped answer
-        answer = InterviewAnswer(
-            session_id=session.id,
-            user_id=user_id,
-            question_id=current_question.get("id"),
-            answer_text="[SKIPPED]",
-            word_count=0,
-            is_skipped=True,
-        )
-        self.db.add(answer)
-        
-        # Add skip message
-        skip_msg = InterviewMessage(
-            session_id=session.id,
-            user_id=user_id,
-            role="system",
-            content="Question skipped",
-            message_type="system",
-            question_id=current_question.get("id"),
-            question_index=session.current_question_index,
-        )
-        self.db.add(skip_msg)
-        
-        # Update session
-        session.questions_skipped += 1
-        session.current_question_index += 1
-        session.last_activity_at = datetime.utcnow()
-        
-        # Check if complete
-        is_complete = session.current_question_index >= len(questions)
+        current_question = questions[current_index]
+        next_index = current_index + 1
+        await self._await_streamed_question(state, next_index)
+        questions = state.questions
+        is_complete = next_index >= len(questions)
         next_question = None
         
-        if is_complete:
-            session.status = "completed"  # FIXED: Was "completing", caused analytics to show 0 interviews
-            session.completed_at = datetime.utcnow()
-            
-            # CRITICAL: Trigger automatic report finalization
-            try:
-                report_service = ReportService(self.db)
-                await report_service.finalize_interview(
-                    session_id=session.id,
-                    user_id=user_id,
-                )
-                print(f"[SKIP_QUESTION] Report finalized automatically for session: {session.id}")
-            except Exception as e:
-                print(f"[SKIP_QUESTION] Warning: Auto-finalization failed: {e}")
-        else:
-            next_q = questions[session.current_question_index]
-            question_text = self._format_question(next_q, session.interviewer_persona)
-            
-            # Add next question message
-            next_msg = InterviewMessage(
-                session_id=session.id,
-                user_id=user_id,
-                role="interviewer",
-                content=f"Understood. {question_text}",
-                message_type="question",
-                question_id=next_q.get("id"),
-                question_index=session.current_question_index,
-            )
-            self.db.add(next_msg)
+        # Resolve the next question before the write transaction opens
+        if not is_complete:
+            next_q = questions[next_index]
+            prefetched = await question_prefetcher.take(state, next_index)
+            if prefetched:
+                question_text = prefetched["question_text"]
+                if prefetched["source"] != "plan":
+                    state.served_question_text[next_index] = question_text
+            else:
+                question_text = self._format_question(next_q, state.interviewer_persona)
             
             next_question = {
                 "id": next_q.get("id"),
@@ -1367,25 +1747,79 @@ Generate the challenging variant:"""
                 "category": next_q.get("category", "General"),
                 "round_name": next_q.get("round_name", next_q.get("category", "Technical Round")),  # Added for multi-round
                 "difficulty": next_q.get("difficulty", "medium"),  # Added for multi-round
-                "index": session.current_question_index,
+                "index": next_index,
             }
         
-        self.db.commit()
+        now = datetime.utcnow()
+        turn = _TurnRows(session_id, user_id, now)
         
-        progress_percent = ((session.questions_answered + session.questions_skipped) / session.total_questions * 100) if session.total_questions > 0 else 0
+        # Skip message + skipped answer record
+        skip_msg = turn.message(
+            role="system",
+            content="Question skipped",
+            message_type="system",
+            question_id=current_question.get("id"),
+            question_index=current_index,
+        )
+        turn.answer(
+            question_id=current_question.get("id"),
+            message_id=skip_msg["id"],
+            answer_text="[SKIPPED]",
+            word_count=0,
+            response_time_seconds=None,
+            is_skipped=True,
+            quick_eval_relevance=None,
+            quick_eval_complete=None,
+            quick_eval_flags=None,
+            turn_plan=None,
+            idempotency_key=idempotency_key,
+        )
+        
+        if not is_complete:
+            # Next question message
+            turn.message(
+                role="interviewer",
+                content=f"Understood. {next_question['text']}",
+                message_type="question",
+                question_id=next_question["id"],
+                question_index=next_index,
+            )
+        
+        # Session state
+        changes = {
+            "questions_skipped": state.questions_skipped + 1,
+            "current_question_index": next_index,
+            "last_activity_at": now,
+        }
+        if is_complete:
+            changes["status"] = "completed"  # FIXED: Was "completing", caused analytics to show 0 interviews
+            changes["completed_at"] = now
+        
+        self._commit_turn(state, turn, **changes)
+        
+        # CRITICAL: Trigger automatic report finalization
+        if is_complete:
+            job_id = self._queue_finalization(session_id, user_id)
+        else:
+            job_id = None
+            self._schedule_prefetch(state)
+        
+        questions_skipped = changes["questions_skipped"]
+        progress_percent = ((state.questions_answered + questions_skipped) / state.total_questions * 100) if state.total_questions > 0 else 0
         
         return {
             "success": True,
             "message": "Question skipped",
             "next_question": next_question,
             "progress": {
-                "current_question": session.current_question_index + 1,
-                "total_questions": session.total_questions,
-                "questions_answered": session.questions_answered,
-                "questions_skipped": session.questions_skipped,
+                "current_question": next_index + 1,
+                "total_questions": state.total_questions,
+                "questions_answered": state.questions_answered,
+                "questions_skipped": questions_skipped,
                 "progress_percent": round(progress_percent, 1),
             },
             "is_complete": is_complete,
+            "job_id": job_id,
         }
     
     async def pause_interview(
@@ -1394,37 +1828,34 @@ Generate the challenging variant:"""
         user_id: str,
     ) -> Dict[str, Any]:
         """Pause the interview."""
-        session = self.db.query(LiveInterviewSession).filter(
-            LiveInterviewSession.id == session_id,
-            LiveInterviewSession.user_id == user_id,
-        ).first()
+        state = self._load_state(session_id, user_id)
         
-        if not session:
-            raise ValueError("Session not found")
+        state = self._require_status(state, "in_progress", "pause")
         
-        if session.status != "in_progress":
-            raise ValueError(f"Cannot pause: session is {session.status}")
-        
-        session.status = "paused"
-        session.pause_start_at = datetime.utcnow()
-        session.last_activity_at = datetime.utcnow()
+        now = datetime.utcnow()
+        changes = {
+            "status": "paused",
+            "pause_start_at": now,
+            "last_activity_at": now,
+        }
+        self._write_session(state, **changes)
         
         # Add pause message
         pause_msg = InterviewMessage(
-            session_id=session.id,
+            session_id=session_id,
             user_id=user_id,
             role="system",
             content="Interview paused",
             message_type="system",
         )
         self.db.add(pause_msg)
-        self.db.commit()
+        self._commit_state(state, **changes)
         
         return {
             "success": True,
             "message": "Interview paused",
             "status": "paused",
-            "session_id": session.id,
+            "session_id": session_id,
         }
     
     async def resume_interview(
@@ -1463,6 +1894,7 @@ Generate the challenging variant:"""
         )
         self.db.add(resume_msg)
         self.db.commit()
+        live_session_cache.invalidate(session.id)
         
         return {
             "success": True,
@@ -1502,23 +1934,18 @@ Generate the challenging variant:"""
         )
         self.db.add(end_msg)
         self.db.commit()
+        live_session_cache.invalidate(session.id)
+        question_prefetcher.discard(session.id)
         
         # CRITICAL: Trigger automatic report finalization
-        try:
-            report_service = ReportService(self.db)
-            await report_service.finalize_interview(
-                session_id=session.id,
-                user_id=user_id,
-            )
-            print(f"[END_INTERVIEW] Report finalized automatically for session: {session.id}")
-        except Exception as e:
-            print(f"[END_INTERVIEW] Warning: Auto-finalization failed: {e}")
+        job_id = self._queue_finalization(session.id, user_id)
         
         return {
             "success": True,
             "message": "Interview ended",
             "session_id": session.id,
             "status": "completed",
+            "job_id": job_id,
             "summary": {
                 "questions_answered": session.questions_answered,
                 "questions_skipped": session.questions_skipped,
@@ -1537,6 +1964,6 @@ Generate the challenging variant:"""
         ).order_by(LiveInterviewSession.created_at.desc()).limit(limit).all()
 
 
-def get_live_interview_service(db: Session) -> LiveInterviewService:
+def get_live_interview_service(db: Session, deadline: Optional[Deadline] = None) -> LiveInterviewService:
     """Get live interview service instance."""
-    return LiveInterviewService(db)
+    return LiveInterviewService(db, deadline=deadline)
@@ -0,0 +1,231 @@
+"""
+Live Interview WebSocket
+
+One socket per live session: authenticate once, then every turn is a
+single frame exchange instead of a REST round trip (JWT decode, user
+lookup and request logging per call).
+
+Endpoint:
+- WS /interviews/{session_id}/ws?token=<jwt>
+  (or send {"type": "auth", "token": "<jwt>"} as the first frame)
+
+Client frames:
+- {"type": "answer", "answer_text": "...", "response_time_seconds": 42}
+- {"type": "skip"}
+- {"type": "pause"}
+- {"type": "resume"}
+- {"type": "state"}
+- {"type": "ping"}
+
+Server messages:
+- {"type": "ready", "session_id", "status", "current_question", "progress"}
+- {"type": "acknowledgment", "text", "quick_eval"}
+- {"type": "next_question", "question", "progress"}
+- {"type": "complete", "progress", "job_id"}
+- {"type": "paused" | "resumed", "status"}
+- {"type": "error", "detail", "frame"} ("retryable": true when the next
+  question is still streaming in - resend the frame)
+- {"type": "pong"}
+
+LiveInterviewService stays the business logic; each frame gets its own
+short-lived DB session so an idle socket holds no connection.
+"""
+
+from typing import Dict, Any, Optional
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError
+
+from app.db.session import SessionLocal
+from app.core.deadline import Deadline
+from app.core.security import authenticate_token
+from app.interviews.live_service import LiveInterviewService
+from app.interviews.plan_stream import PlanQuestionsPendingError
+from app.interviews.live_schemas import SubmitAnswerRequest
+
+router = APIRouter()
+
+# Application close codes (4000-4999)
+WS_CLOSE_UNAUTHORIZED = 4401
+WS_CLOSE_NOT_FOUND = 4404
+
+
+async def _authenticate(websocket: WebSocket) -> Optional[Dict[str, Any]]:
+    """Resolve the user from ?token= or an initial auth frame."""
+    token = websocket.query_params.get("token")
+    if not token:
+        try:
+            frame = await websocket.receive_json()
+        except (ValueError, WebSocketDisconnect):
+            return None
+        if not isinstance(frame, dict) or frame.get("type") != "auth":
+            return None
+        token = frame.get("token")
+
+    db = SessionLocal()
+    try:
+        return authenticate_token(token, db)
+    finally:
+        db.close()
+
+
+async def _handle_frame(
+    websocket: WebSocket,
+    session_id: str,
+    user_id: str,
+    frame: Dict[str, Any],
+) -> bool:
+    """
+    Run one client frame through LiveInterviewService.
+
+    Returns:
+        True when the interview is complete (socket should close)
+    """
+    frame_type = frame.get("type")
+
+    if frame_type == "ping":
+        await websocket.send_json({"type": "pong"})
+        return False
+
+    db = SessionLocal()
+    try:
+        if frame_type == "answer":
+            request = SubmitAnswerRequest(
+                answer_text=(frame.get("answer_text") or "").strip(),
+                response_time_seconds=frame.get("response_time_seconds"),
+            )
+            service = LiveInterviewService(db, deadline=Deadline.realtime())
+            result = await service.submit_answer(
+                session_id=session_id,
+                user_id=user_id,
+                answer_text=request.answer_text,
+                response_time_seconds=request.response_time_seconds,
+            )
+            await websocket.send_json({
+                "type": "acknowledgment",
+                "text": result["acknowledgment"],
+                "quick_eval": result["quick_eval"],
+            })
+            return await _send_next(websocket, result)
+
+        if frame_type == "skip":
+            service = LiveInterviewService(db, deadline=Deadline.realtime())
+            result = await service.skip_question(session_id=session_id, user_id=user_id)
+            return await _send_next(websocket, result)
+
+        if frame_type == "pause":
+            result = await LiveInterviewService(db).pause_interview(session_id=session_id, user_id=user_id)
+            await websocket.send_json({"type": "paused", "status": result["status"]})
+            return False
+
+        if frame_type == "resume":
+            result = await LiveInterviewService(db).resume_interview(session_id=session_id, user_id=user_id)
+            await websocket.send_json({"type": "resumed", "status": result["status"]})
+            return False
+
+        if frame_type == "state":
+            await websocket.send_json(await _ready_message(db, session_id, user_id))
+            return False
+
+        await websocket.send_json({
+            "type": "error",
+            "detail": f"Unknown frame type: {frame_type}",
+            "frame": frame_type,
+        })
+        return False
+
+    except ValidationError as e:
+        await websocket.send_json({
+            "type": "error",
+            "detail": e.errors()[0].get("msg", "Invalid frame"),
+            "frame": frame_type,
+        })
+    except PlanQuestionsPendingError as e:
+        await websocket.send_json({"type": "error", "detail": str(e), "frame": frame_type, "retryable": True})
+    except ValueError as e:
+        await websocket.send_json({"type": "error", "detail": str(e), "frame": frame_type})
+    except Exception as e:
+        print(f"[LiveWS] {frame_type} error for session {session_id}: {e}")
+        await websocket.send_json({"type": "error", "detail": f"Failed to process {frame_type}", "frame": frame_type})
+    finally:
+        db.close()
+
+    return False
+
+
+async def _send_next(websocket: WebSocket, result: Dict[str, Any]) -> bool:
+    """Push the next question, or completion."""
+    if result["is_complete"]:
+        await websocket.send_json({"type": "complete", "progress": result["progress"], "job_id": result["job_id"]})
+        return True
+
+    await websocket.send_json({
+        "type": "next_question",
+        "question": result["next_question"],
+        "progress": result["progress"],
+    })
+    return False
+
+
+async def _ready_message(db, session_id: str, user_id: str) -> Dict[str, Any]:
+    """Current question and progress (no message history - use GET /state)."""
+    state = await LiveInterviewService(db).get_session_state(
+        session_id=session_id,
+        user_id=user_id,
+        include_messages=False,
+    )
+    return {
+        "type": "ready",
+        "session_id": state["session_id"],
+        "status": state["status"],
+        "current_question": state["current_question"],
+        "progress": state["progress"],
+    }
+
+
+@router.websocket("/{session_id}/ws")
+async def live_interview_socket(websocket: WebSocket, session_id: str):
+    """
+    Live interview channel for one session.
+
+    Authenticates once, verifies the session belongs to the user, then
+    processes answer/skip/pause frames in order until the interview
+    completes or the client disconnects.
+    """
+    await websocket.accept()
+
+    user = await _authenticate(websocket)
+    if not user:
+        await websocket.close(code=WS_CLOSE_UNAUTHORIZED, reason="Invalid or expired token")
+        return
+    user_id = user["id"]
+
+    db = SessionLocal()
+    try:
+        ready = await _ready_message(db, session_id, user_id)
+    except ValueError as e:
+        await websocket.close(code=WS_CLOSE_NOT_FOUND, reason=str(e))
+        return
+    finally:
+        db.close()
+
+    await websocket.send_json(ready)
+    print(f"[LiveWS] Connected: session {session_id}")
+
+    try:
+        while True:
+            try:
+                frame = await websocket.receive_json()
+            except ValueError:
+                await websocket.send_json({"type": "error", "detail": "Frames must be JSON objects", "frame": None})
+                continue
+
+            if not isinstance(frame, dict):
+                await websocket.send_json({"type": "error", "detail": "Frames must be JSON objects", "frame": None})
+                continue
+
+            if await _handle_frame(websocket, session_id, user_id, frame):
+                await websocket.close(code=status.WS_1000_NORMAL_CLOSURE)
+                break
+    except WebSocketDisconnect:
+        print(f"[LiveWS] Disconnected: session {session_id}")
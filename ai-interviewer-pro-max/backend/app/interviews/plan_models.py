@@ -5,7 +5,7 @@ SQLAlchemy models for interview plan storage.
 Plans are generated from resume + ATS analysis and linked to interview sessions.
 """
 
-from sqlalchemy import Column, String, Text, Integer, DateTime, JSON, ForeignKey, Boolean
+from sqlalchemy import Column, String, Text, Integer, DateTime, JSON, ForeignKey, Boolean, LargeBinary
 from datetime import datetime
 import uuid
 
@@ -206,3 +206,26 @@ class InterviewPlan(Base):
     def get_questions_list(self) -> list:
         """Get the list of questions."""
         return self.questions or []
+
+
+class UserSeenQuestions(Base):
+    """
+    Pool questions a user has already been asked, across all sessions.
+    
+    One row per user: a bitmap over question_pool_index ordinals (bit i set
+    = question i seen), so plan generation loads a user's whole history in
+    one query and excludes with a bit test per candidate question.
+    The bitmap is only valid for the pool layout it was written against
+    (pool_version); a pool change starts the history over.
+    """
+    
+    __tablename__ = "user_seen_questions"
+    
+    user_id = Column(String(36), primary_key=True)
+    pool_version = Column(String(16), nullable=False)
+    seen_bitmap = Column(LargeBinary, nullable=False, default=b"")  # little-endian int bytes
+    seen_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<UserSeenQuestions(user_id={self.user_id}, seen={self.seen_count})>"
@@ -8,6 +8,7 @@ CRITICAL: Plan generation NEVER fails - always returns a valid plan.
 
 Endpoints:
 - POST /interviews/plan/{resume_id} - Generate plan for resume
+  (accepts an Idempotency-Key header, see app/core/idempotency.py)
 - GET /interviews/plan/{plan_id} - Get plan by ID
 - GET /interviews/plans/resume/{resume_id} - Get latest plan for resume
 - GET /interviews/plans/me - Get all user's plans
@@ -16,12 +17,20 @@ Endpoints:
 import logging
 import uuid
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Response
 from sqlalchemy.orm import Session
 from typing import Optional, Dict, Any, List
 
 from app.db.session import get_db
+from app.core.deadline import Deadline
 from app.core.security import get_current_active_user
+from app.core.idempotency import (
+    idempotency_store,
+    request_fingerprint,
+    IdempotencyInProgressError,
+    IDEMPOTENCY_HEADER,
+    REPLAYED_HEADER,
+)
 from app.interviews.plan_service import InterviewPlanService
 from app.interviews.plan_models import InterviewPlan
 from app.interviews.plan_schemas import (
@@ -342,13 +351,17 @@ def plan_to_preview(plan) -> PlanPreviewResponse:
     description="Generate a personalized interview plan based on resume and ATS analysis.",
     responses={
         200: {"description": "Plan generated successfully"},
+        400: {"model": PlanErrorResponse, "description": "Idempotency-Key reused for a different request"},
         401: {"model": PlanErrorResponse, "description": "Not authenticated"},
         404: {"model": PlanErrorResponse, "description": "Resume not found"},
+        409: {"model": PlanErrorResponse, "description": "Idempotency-Key request still in progress"},
     }
 )
 async def generate_plan(
     resume_id: str,
     request: PlanGenerateRequest,
+    response: Response,
+    idempotency_key: Optional[str] = Header(default=None, alias=IDEMPOTENCY_HEADER, max_length=255),
     current_user: dict = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -363,7 +376,33 @@ async def generate_plan(
     - Always includes HR and behavioral questions
     
     If anything fails, returns a static fallback plan.
+    
+    A retry with the same Idempotency-Key (e.g. after a client timeout)
+    waits for or replays the original plan instead of calling Gemini again.
     """
+    try:
+        generated, replayed = await idempotency_store.run(
+            "generate_plan", current_user["id"], idempotency_key,
+            request_fingerprint(resume_id, request.model_dump()),
+            lambda: _generate_plan(resume_id, request, current_user, db),
+        )
+    except IdempotencyInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    if replayed:
+        response.headers[REPLAYED_HEADER] = "true"
+    return generated
+
+
+async def _generate_plan(
+    resume_id: str,
+    request: PlanGenerateRequest,
+    current_user: dict,
+    db: Session,
+) -> PlanGenerateResponse:
+    """Resume lookup, service generation and fallbacks (see generate_plan)."""
     logger.info(f"=== PLAN GENERATION REQUEST ===")
     logger.info(f"resume_id: {resume_id}")
     logger.info(f"user_id: {current_user.get('id')}")
@@ -409,7 +448,7 @@ async def generate_plan(
     try:
         logger.info("Attempting plan generation via InterviewPlanService...")
         
-        service = InterviewPlanService(db)
+        service = InterviewPlanService(db, deadline=Deadline.deep())
         
         # Extract round_config if provided
         round_config_dict = None
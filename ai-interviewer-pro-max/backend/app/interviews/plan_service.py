@@ -13,26 +13,43 @@ Per requirements:
 - NEVER fails - always returns a valid plan
 """
 
+import asyncio
 import logging
 import time
 import json
 import hashlib
 import uuid
-from typing import Dict, Any, List, Optional
+import copy
+from typing import Dict, Any, List, Optional, Tuple
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.deadline import Deadline
+from app.ai.gateway import ai_gateway
+from app.ai.prompt_builder import build_prompt
 from app.interviews.plan_models import InterviewPlan
 from app.interviews.question_pools import get_question_pool, QuestionPoolManager, CompanyStyle, Difficulty, QuestionRound
+from app.interviews.seen_questions import get_seen_question_store
+from app.interviews.plan_warmer import plan_warm_pool, PRESSURE_PERSONAS
+from app.interviews.plan_stream import plan_streams, PlanStream
 from app.resumes.models import Resume
 from app.ats.models import ATSAnalysis
 from app.companies.modes import get_company_profile, CompanyProfile
-from app.admin.service import AIAPILogService
 
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Pressure-mode (strict/stress) rounds: (type, label, share of the questions, focus).
+# Each round is its own Gemini call; results are merged in this order.
+PRESSURE_ROUNDS = (
+    ("technical", "technical deep-dive", 0.20, "Internals, debugging and performance of the candidate's stack, with constraints"),
+    ("system_design", "system design", 0.20, "Architecture under explicit scale and latency constraints; trade-offs"),
+    ("dsa", "problem-solving", 0.20, "Algorithms, data structures and prioritization; complexity and edge cases"),
+    ("behavioral", "behavioral", 0.25, "Specific STAR scenarios with personal accountability"),
+    ("situational", "situational", 0.15, "Pressure scenarios: incidents, deadlines, conflicting priorities"),
+)
+
 
 class InterviewPlanService:
     """
@@ -46,28 +63,18 @@ class InterviewPlanService:
     GUARANTEED: Always returns a valid plan, never throws.
     """
     
-    def __init__(self, db: Session):
-        """Initialize plan service with database session."""
-        self.db = db
-        self._gemini_client = None
-    
-    def _get_gemini_client(self):
-        """Get Gemini client if configured."""
-        if not settings.is_gemini_configured():
-            logger.info("Gemini not configured, will use fallback")
-            return None
-        
-        if self._gemini_client is None:
-            try:
-                import google.generativeai as genai
-                genai.configure(api_key=settings.GEMINI_API_KEY)
-                self._gemini_client = genai.GenerativeModel('gemini-pro')
-                logger.info("Gemini client initialized successfully")
-            except Exception as e:
-                logger.error(f"Failed to initialize Gemini client: {e}")
-                return None
+    def __init__(self, db: Session, deadline: Optional[Deadline] = None):
+        """
+        Initialize plan service with database session.
         
-        return self._gemini_client
+        Args:
+            db: Database session
+            deadline: Optional request deadline (bounds every AI call)
+        """
+        self.db = db
+        self.deadline = deadline
+        # Pool questions the user saw in past sessions (set by generate_plan)
+        self.seen_question_mask = 0
     
     # ===========================================
     # DEFAULT SAFE FALLBACK PLAN
@@ -239,7 +246,8 @@ class InterviewPlanService:
         CRITICAL CHANGES:
         - Uses QuestionPoolManager for randomized selection
         - Each session gets unique questions via session seed
-        - Questions are NEVER repeated across sessions
+        - Questions are NEVER repeated across sessions (seen_question_mask,
+          until the user has seen the whole pool)
         - Supports round structure for big-company style interviews
         - NEW: Respects round_config if provided for per-round counts
         
@@ -251,8 +259,8 @@ class InterviewPlanService:
             session_seed = f"{target_role}:{difficulty}:{company_mode}:{uuid.uuid4()}"
             logger.info(f"Generating randomized plan: role={target_role}, seed={session_seed[:50]}")
             
-            # Initialize question pool manager with unique seed
-            pool_manager = get_question_pool(session_seed=session_seed)
+            # Initialize question pool manager with unique seed and the user's history
+            pool_manager = get_question_pool(session_seed=session_seed, asked_mask=self.seen_question_mask)
             
             # Get company profile if specified
             company_profile = get_company_profile(company_mode) if company_mode else None
@@ -616,7 +624,7 @@ class InterviewPlanService:
     # GEMINI PLAN GENERATION
     # ===========================================
     
-    async def _generate_with_gemini(
+    def _build_plan_prompt(
         self,
         resume_text: str,
         ats_analysis: Optional[ATSAnalysis],
@@ -624,39 +632,20 @@ class InterviewPlanService:
         session_type: str,
         difficulty: str,
         question_count: int,
-        company_mode: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """
-        Generate interview plan using Gemini API.
-        
-        Incorporates company mode for tailored questions.
-        ALWAYS falls back to mock if anything fails.
-        """
-        client = self._get_gemini_client()
-        
-        if not client:
-            logger.info("No Gemini client available, using mock plan")
-            result = self._generate_mock_plan(
-                resume_text, ats_analysis, target_role,
-                session_type, difficulty, question_count, company_mode
-            )
-            result["plan_generated_via"] = "mock"
-            return result
-        
-        try:
-            logger.info(f"Attempting Gemini plan generation for role: {target_role}")
-            
-            # Build prompt
-            ats_summary = ""
-            if ats_analysis:
-                ats_summary = f"""
+    ) -> str:
+        """Gemini interview plan prompt (shared by the blocking and streaming paths)."""
+        ats_summary = ""
+        if ats_analysis:
+            ats_summary = f"""
                 ATS Score: {ats_analysis.overall_score}/100
                 Skills: {', '.join([s.get('name', str(s)) if isinstance(s, dict) else str(s) for s in (ats_analysis.skills_extracted or [])[:10]])}
                 Strengths: {json.dumps(ats_analysis.strength_areas or [])}
                 Weaknesses: {json.dumps(ats_analysis.weak_areas or [])}
                 """
-            
-            prompt = f"""
+        
+        return build_prompt(
+            "generate_interview_plan",
+            lambda sections: f"""
             Generate a personalized interview plan based on the candidate's resume and analysis.
             
             Target Role: {target_role}
@@ -664,8 +653,8 @@ class InterviewPlanService:
             Difficulty: {difficulty}
             Question Count: {question_count}
             
-            Resume Summary (first 2000 chars):
-            {resume_text[:2000]}
+            Resume Summary:
+            {sections["resume_text"]}
             
             {ats_summary}
             
@@ -707,71 +696,109 @@ class InterviewPlanService:
                 "summary": "plan summary",
                 "rationale": "why this plan"
             }}
-            """
+            """,
+            resume_text=resume_text,
+        )
+    
+    @staticmethod
+    def _parse_plan_json(response_text: str) -> Dict[str, Any]:
+        """
+        Parse the plan JSON out of a Gemini response (code fences allowed).
+        
+        Raises:
+            json.JSONDecodeError: Not valid JSON
+        """
+        if "```json" in response_text:
+            json_start = response_text.find("```json") + 7
+            json_end = response_text.find("```", json_start)
+            response_text = response_text[json_start:json_end].strip()
+        elif "```" in response_text:
+            json_start = response_text.find("```") + 3
+            json_end = response_text.find("```", json_start)
+            response_text = response_text[json_start:json_end].strip()
+        
+        return json.loads(response_text)
+    
+    @staticmethod
+    def _gemini_plan_data(
+        result: Dict[str, Any],
+        questions: List[Dict[str, Any]],
+        session_type: str,
+        difficulty: str,
+        company_mode: Optional[str],
+    ) -> Dict[str, Any]:
+        """Plan data from a parsed Gemini plan, counts calculated from the questions."""
+        tech_count = sum(1 for q in questions if q.get("type") == "technical")
+        behav_count = sum(1 for q in questions if q.get("type") == "behavioral")
+        hr_count = sum(1 for q in questions if q.get("type") == "hr")
+        sit_count = sum(1 for q in questions if q.get("type") == "situational")
+        
+        return {
+            "session_type": session_type,
+            "difficulty_level": difficulty,
+            "total_questions": len(questions),
+            "estimated_duration_minutes": len(questions) * 3,
+            "technical_question_count": tech_count,
+            "behavioral_question_count": behav_count,
+            "hr_question_count": hr_count,
+            "situational_question_count": sit_count,
+            "question_categories": result.get("question_categories", []),
+            "strength_focus_areas": result.get("strength_focus_areas", []),
+            "weakness_focus_areas": result.get("weakness_focus_areas", []),
+            "skills_to_test": result.get("skills_to_test", []),
+            "questions": questions,
+            "summary": result.get("summary", "Interview plan generated."),
+            "rationale": result.get("rationale", ""),
+            "company_mode": company_mode,
+            "company_info": None,
+            "plan_generated_via": "gemini",
+        }
+    
+    async def _generate_with_gemini(
+        self,
+        resume_text: str,
+        ats_analysis: Optional[ATSAnalysis],
+        target_role: str,
+        session_type: str,
+        difficulty: str,
+        question_count: int,
+        company_mode: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Generate interview plan using Gemini API.
+        
+        Incorporates company mode for tailored questions.
+        ALWAYS falls back to mock if anything fails.
+        """
+        if not ai_gateway.is_gemini_configured():
+            logger.info("No Gemini client available, using mock plan")
+            result = self._generate_mock_plan(
+                resume_text, ats_analysis, target_role,
+                session_type, difficulty, question_count, company_mode
+            )
+            result["plan_generated_via"] = "mock"
+            return result
+        
+        try:
+            logger.info(f"Attempting Gemini plan generation for role: {target_role}")
             
-            start_time = time.time()
-            response = client.generate_content(prompt)
-            response_text = response.text
-            response_time_ms = int((time.time() - start_time) * 1000)
+            prompt = self._build_plan_prompt(
+                resume_text, ats_analysis, target_role,
+                session_type, difficulty, question_count
+            )
             
-            # Log successful Gemini API call
-            try:
-                AIAPILogService.log_ai_call(
-                    db=self.db,
-                    provider="gemini",
-                    operation="generate_interview_plan",
-                    model="gemini-pro",
-                    response_time_ms=response_time_ms,
-                    status="success"
-                )
-            except Exception as log_error:
-                logger.warning(f"Failed to log Gemini call: {log_error}")
+            response = await ai_gateway.gemini_generate(prompt, "generate_interview_plan", db=self.db, deadline=self.deadline)
+            response_text = response.text
             
             # Log raw response (first 500 chars)
             logger.info(f"Gemini raw response (first 500 chars): {response_text[:500]}")
             
             # Parse JSON
             try:
-                if "```json" in response_text:
-                    json_start = response_text.find("```json") + 7
-                    json_end = response_text.find("```", json_start)
-                    response_text = response_text[json_start:json_end].strip()
-                elif "```" in response_text:
-                    json_start = response_text.find("```") + 3
-                    json_end = response_text.find("```", json_start)
-                    response_text = response_text[json_start:json_end].strip()
-                
-                result = json.loads(response_text)
-                
-                # Calculate counts from questions
+                result = self._parse_plan_json(response_text)
                 questions = result.get("questions", [])
-                tech_count = sum(1 for q in questions if q.get("type") == "technical")
-                behav_count = sum(1 for q in questions if q.get("type") == "behavioral")
-                hr_count = sum(1 for q in questions if q.get("type") == "hr")
-                sit_count = sum(1 for q in questions if q.get("type") == "situational")
-                
                 logger.info(f"Gemini plan generated successfully: {len(questions)} questions")
-                
-                return {
-                    "session_type": session_type,
-                    "difficulty_level": difficulty,
-                    "total_questions": len(questions),
-                    "estimated_duration_minutes": len(questions) * 3,
-                    "technical_question_count": tech_count,
-                    "behavioral_question_count": behav_count,
-                    "hr_question_count": hr_count,
-                    "situational_question_count": sit_count,
-                    "question_categories": result.get("question_categories", []),
-                    "strength_focus_areas": result.get("strength_focus_areas", []),
-                    "weakness_focus_areas": result.get("weakness_focus_areas", []),
-                    "skills_to_test": result.get("skills_to_test", []),
-                    "questions": questions,
-                    "summary": result.get("summary", "Interview plan generated."),
-                    "rationale": result.get("rationale", ""),
-                    "company_mode": company_mode,
-                    "company_info": None,
-                    "plan_generated_via": "gemini",
-                }
+                return self._gemini_plan_data(result, questions, session_type, difficulty, company_mode)
                 
             except json.JSONDecodeError as e:
                 logger.warning(f"Gemini JSON parsing failed: {e}, falling back to mock")
@@ -791,6 +818,51 @@ class InterviewPlanService:
             result["plan_generated_via"] = "fallback"
             return result
     
+    async def _start_streaming_plan(
+        self,
+        resume_text: str,
+        ats_analysis: Optional[ATSAnalysis],
+        target_role: str,
+        session_type: str,
+        difficulty: str,
+        question_count: int,
+        company_mode: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> Tuple[Optional[PlanStream], Dict[str, Any]]:
+        """
+        Start a streamed Gemini plan and wait only for its first questions.
+        
+        The pool plan is built up front (no AI call): it supplies the
+        skills/focus areas until the full Gemini plan is in, and the
+        top-up questions if the stream fails or comes up short.
+        
+        Returns:
+            (stream still running or None, plan data to save now)
+        """
+        base = self._generate_mock_plan(
+            resume_text, ats_analysis, target_role,
+            session_type, difficulty, question_count, company_mode
+        )
+        prompt = self._build_plan_prompt(
+            resume_text, ats_analysis, target_role,
+            session_type, difficulty, question_count
+        )
+        
+        stream = plan_streams.start(prompt, question_count, base["questions"], user_id=user_id)
+        first = min(settings.PLAN_STREAM_MIN_QUESTIONS, question_count)
+        timeout = self.deadline.remaining() if self.deadline is not None else settings.GEMINI_TIMEOUT_SECONDS
+        await stream.wait_for(first, timeout)
+        
+        if not stream.streamed:
+            # Nothing from Gemini within the budget (or the stream failed) - use the pool plan
+            stream.cancel()
+            base["plan_generated_via"] = "fallback"
+            return None, base
+        
+        logger.info(f"Streamed plan ready to start: {len(stream.questions)}/{question_count} questions")
+        plan_data = stream.plan_data(base)
+        return (None if stream.finished else stream), plan_data
+    
     # ===========================================
     # STRICT/STRESS MODE: ENHANCED QUESTION GENERATION
     # ===========================================
@@ -803,6 +875,7 @@ class InterviewPlanService:
         difficulty: str,
         persona: str,
         resume_summary: str = "",
+        use_pool_fallback: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Generate high-pressure interview questions using Gemini API.
@@ -813,20 +886,25 @@ class InterviewPlanService:
         - Time-constrained scenarios
         - Trade-off analysis questions
         
+        The questions are split across PRESSURE_ROUNDS (technical, system
+        design, problem-solving, behavioral, situational) and each round is
+        generated by its own concurrent Gemini call; rounds are merged in
+        order with duplicates dropped, and failed rounds are filled from
+        the enhanced pool.
+        
         Args:
             target_role: Target job role
             skills: Extracted skills from resume
             question_count: Number of questions to generate
             difficulty: Difficulty level
             persona: "strict" or "stress"
-            resume_summary: Brief resume summary for personalization
+            resume_summary: Resume text for personalization (fitted to the prompt budget by build_prompt)
+            use_pool_fallback: Fall back to enhanced pool questions on failure (False re-raises)
             
         Returns:
             List of challenging questions
         """
-        client = self._get_gemini_client()
-        
-        if not client:
+        if not ai_gateway.is_gemini_configured():
             logger.info("No Gemini client for pressure questions, using enhanced pool")
             return self._generate_enhanced_pool_questions(
                 target_role, skills, question_count, difficulty, persona
@@ -868,8 +946,105 @@ Example question styles:
 - "Describe a technical decision you made that failed. What was wrong with your reasoning?"
 """
         
-        prompt = f"""
-Generate {question_count} challenging interview questions for a {target_role} position.
+        semaphore = asyncio.Semaphore(max(1, settings.PRESSURE_ROUND_CONCURRENCY))
+        
+        async def run_round(round_spec: Tuple[str, str, float, str], count: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._generate_pressure_round(
+                    round_spec, count, target_role, skills, difficulty,
+                    pressure_instruction, resume_summary,
+                )
+        
+        # One call per round, all in flight at once: the plan waits for the
+        # slowest round instead of one response covering every question
+        allocation = self._allocate_pressure_rounds(question_count)
+        results = await asyncio.gather(
+            *(run_round(round_spec, count) for round_spec, count in allocation),
+            return_exceptions=True,
+        )
+        
+        questions = []
+        seen_texts = set()
+        errors = []
+        for (round_spec, count), result in zip(allocation, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Gemini pressure question generation failed for {round_spec[0]} round: {result}")
+                errors.append(result)
+                continue
+            for q in result[:count]:
+                key = " ".join(str(q.get("text", "")).lower().split())
+                if not key or key in seen_texts:
+                    continue
+                seen_texts.add(key)
+                questions.append(q)
+        
+        if not use_pool_fallback:
+            if errors:
+                raise errors[0]
+            if not questions:
+                raise ValueError("Gemini returned no pressure questions")
+        
+        generated = len(questions)
+        if generated < question_count and use_pool_fallback:
+            # Failed rounds (and duplicates) are filled from the enhanced pool
+            for q in self._generate_enhanced_pool_questions(
+                target_role, skills, question_count, difficulty, persona
+            ):
+                if len(questions) >= question_count:
+                    break
+                key = " ".join(q["text"].lower().split())
+                if key not in seen_texts:
+                    seen_texts.add(key)
+                    questions.append(q)
+        
+        for index, q in enumerate(questions, start=1):
+            q["id"] = f"q-{index}"
+            q["persona_mode"] = persona
+            q["pressure_level"] = "high" if persona == "stress" else "medium"
+        
+        logger.info(
+            f"Generated {generated} pressure-mode questions via Gemini in {len(allocation)} rounds"
+            f" ({len(questions) - generated} from pool)"
+        )
+        return questions
+    
+    @staticmethod
+    def _allocate_pressure_rounds(question_count: int) -> List[Tuple[Tuple[str, str, float, str], int]]:
+        """
+        Split question_count across PRESSURE_ROUNDS by share (largest remainder).
+        
+        Returns:
+            (round, count) pairs in round order, rounds with no questions left out
+        """
+        exact = [share * question_count for _, _, share, _ in PRESSURE_ROUNDS]
+        counts = [int(value) for value in exact]
+        by_remainder = sorted(range(len(exact)), key=lambda i: exact[i] - counts[i], reverse=True)
+        for i in by_remainder[:question_count - sum(counts)]:
+            counts[i] += 1
+        return [(round_spec, count) for round_spec, count in zip(PRESSURE_ROUNDS, counts) if count > 0]
+    
+    async def _generate_pressure_round(
+        self,
+        round_spec: Tuple[str, str, float, str],
+        count: int,
+        target_role: str,
+        skills: List[str],
+        difficulty: str,
+        pressure_instruction: str,
+        resume_summary: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate one round's pressure-mode questions with Gemini.
+        
+        Raises:
+            Gateway errors and json.JSONDecodeError (the caller handles them)
+        """
+        question_type, label, _, focus = round_spec
+        
+        prompt = build_prompt(
+            "generate_pressure_questions",
+            lambda sections: f"""
+Generate {count} challenging {label} interview questions for a {target_role} position.
 
 {pressure_instruction}
 
@@ -877,17 +1052,15 @@ CANDIDATE SKILLS: {', '.join(skills[:10]) if skills else 'General software devel
 
 DIFFICULTY: {difficulty.upper()}
 
-RESUME CONTEXT: {resume_summary[:500] if resume_summary else 'No specific resume context'}
+RESUME CONTEXT: {sections['resume_summary'] or 'No specific resume context'}
 
-QUESTION MIX REQUIREMENTS:
-- 40% Technical/System Design (challenging, with constraints)
-- 25% Behavioral (specific STAR scenarios with accountability)
-- 20% Problem Solving (trade-offs, prioritization)
-- 15% Situational (pressure scenarios)
+ROUND: {label.upper()}
+FOCUS: {focus}
+Every question in this round has type "{question_type}".
 
 For EACH question, provide:
 1. The question text (challenging, specific)
-2. Type (technical, behavioral, dsa, system_design, situational)
+2. Type ({question_type})
 3. Expected answer key points
 4. Red flags to watch for
 5. A follow-up probe question
@@ -897,7 +1070,7 @@ Return JSON array:
     {{
         "id": "q-1",
         "text": "challenging question text",
-        "type": "technical|behavioral|dsa|system_design|situational",
+        "type": "{question_type}",
         "category": "category name",
         "difficulty": "{difficulty}",
         "time_limit_seconds": 180,
@@ -909,54 +1082,30 @@ Return JSON array:
         "follow_up_probe": "challenging follow-up question"
     }}
 ]
-"""
+""",
+            caps={"resume_summary": 150},
+            resume_summary=resume_summary or "",
+        )
         
-        try:
-            start_time = time.time()
-            response = client.generate_content(prompt)
-            response_text = response.text
-            response_time_ms = int((time.time() - start_time) * 1000)
-            
-            # Log successful Gemini API call
-            try:
-                AIAPILogService.log_ai_call(
-                    db=self.db,
-                    provider="gemini",
-                    operation="generate_pressure_questions",
-                    model="gemini-pro",
-                    response_time_ms=response_time_ms,
-                    status="success"
-                )
-            except Exception as log_error:
-                logger.warning(f"Failed to log Gemini call: {log_error}")
-            
-            logger.info(f"Gemini pressure questions response (first 300 chars): {response_text[:300]}")
-            
-            # Parse JSON
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-            
-            questions = json.loads(response_text)
-            
-            # Add persona tag to each question
-            for q in questions:
-                q["persona_mode"] = persona
-                q["pressure_level"] = "high" if persona == "stress" else "medium"
-            
-            logger.info(f"Generated {len(questions)} pressure-mode questions via Gemini")
-            return questions
-            
-        except Exception as e:
-            logger.error(f"Gemini pressure question generation failed: {e}")
-            return self._generate_enhanced_pool_questions(
-                target_role, skills, question_count, difficulty, persona
-            )
+        response = await ai_gateway.gemini_generate(prompt, "generate_pressure_questions", db=self.db, deadline=self.deadline)
+        response_text = response.text
+        
+        logger.info(f"Gemini pressure questions response ({question_type}, first 300 chars): {response_text[:300]}")
+        
+        # Parse JSON
+        if "```json" in response_text:
+            json_start = response_text.find("```json") + 7
+            json_end = response_text.find("```", json_start)
+            response_text = response_text[json_start:json_end].strip()
+        elif "```" in response_text:
+            json_start = response_text.find("```") + 3
+            json_end = response_text.find("```", json_start)
+            response_text = response_text[json_start:json_end].strip()
+        
+        questions = [q for q in json.loads(response_text) if isinstance(q, dict)]
+        for q in questions:
+            q["type"] = question_type
+        return questions
     
     def _generate_enhanced_pool_questions(
         self,
@@ -1155,10 +1304,109 @@ Return JSON array:
             "rationale": f"{pressure_label} interview mode with API-generated challenging questions.",
             "company_mode": company_mode,
             "company_info": None,
-            "plan_generated_via": "gemini_pressure" if settings.is_gemini_configured() else "pool_pressure",
+            "plan_generated_via": "gemini_pressure" if ai_gateway.is_gemini_configured() else "pool_pressure",
             "persona_mode": persona,
         }
     
+    # ===========================================
+    # WARM POOL (see app/interviews/plan_warmer.py)
+    # ===========================================
+    
+    async def generate_warm_plan_data(
+        self,
+        target_role: str,
+        session_type: str,
+        difficulty: str,
+        question_count: int,
+        company_mode: Optional[str] = None,
+        persona: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Generate resume-independent plan data to stock in the warm pool.
+        
+        Returns:
+            Plan data, or None if Gemini was unavailable (fallbacks are not stocked)
+        """
+        if persona in PRESSURE_PERSONAS:
+            try:
+                questions = await self._generate_pressure_mode_questions(
+                    target_role=target_role,
+                    skills=[],
+                    question_count=question_count,
+                    difficulty=difficulty,
+                    persona=persona,
+                    use_pool_fallback=False,
+                )
+            except Exception:
+                return None
+            return self._build_pressure_mode_plan(
+                questions=questions,
+                target_role=target_role,
+                session_type=session_type,
+                difficulty=difficulty,
+                question_count=question_count,
+                company_mode=company_mode,
+                skills=[],
+                persona=persona,
+            )
+        
+        plan_data = await self._generate_with_gemini(
+            "", None, target_role,
+            session_type, difficulty, question_count,
+            company_mode
+        )
+        return plan_data if plan_data.get("plan_generated_via") == "gemini" else None
+    
+    def _personalize_warm_plan(
+        self,
+        plan_data: Dict[str, Any],
+        target_role: str,
+        skills: List[str],
+        ats_analysis: Optional[ATSAnalysis],
+    ) -> Dict[str, Any]:
+        """
+        Fit a stocked plan to this candidate (no AI calls).
+        
+        The questions stay as generated; skills and focus areas come from
+        the resume's ATS analysis (or extracted skills).
+        """
+        plan_data = copy.deepcopy(plan_data)
+        persona = plan_data.get("persona_mode")
+        
+        if persona in PRESSURE_PERSONAS:
+            return self._build_pressure_mode_plan(
+                questions=plan_data["questions"],
+                target_role=target_role,
+                session_type=plan_data["session_type"],
+                difficulty=plan_data["difficulty_level"],
+                question_count=plan_data["total_questions"],
+                company_mode=plan_data.get("company_mode"),
+                skills=skills,
+                persona=persona,
+            )
+        
+        if skills:
+            plan_data["skills_to_test"] = skills[:10]
+        if ats_analysis and ats_analysis.strength_areas:
+            plan_data["strength_focus_areas"] = [
+                {
+                    "area": s.get("area", str(s)) if isinstance(s, dict) else str(s),
+                    "reason": "Strong area - will probe for depth",
+                    "question_count": 1,
+                }
+                for s in ats_analysis.strength_areas[:3]
+            ]
+        if ats_analysis and ats_analysis.weak_areas:
+            plan_data["weakness_focus_areas"] = [
+                {
+                    "area": w.get("area", str(w)) if isinstance(w, dict) else str(w),
+                    "reason": "Gap identified - need to assess capability",
+                    "question_count": 2,
+                }
+                for w in ats_analysis.weak_areas[:3]
+            ]
+        return plan_data
+    
     # ===========================================
     # PUBLIC API
     # ===========================================
@@ -1227,6 +1475,12 @@ Return JSON array:
         except Exception as e:
             logger.warning(f"Failed to fetch ATS analysis: {e}")
         
+        # Pool questions from the user's past sessions (one query)
+        try:
+            self.seen_question_mask = get_seen_question_store(self.db).load_mask(user_id)
+        except Exception as e:
+            logger.warning(f"Failed to load seen questions: {e}")
+        
         # Extract skills for pressure mode
         skills = []
         if ats_analysis:
@@ -1236,14 +1490,26 @@ Return JSON array:
             skills = self._extract_mock_skills(resume_text)
         
         # Determine generation source and generate plan
+        stream = None  # Set when the plan's questions are still streaming in
         try:
-            use_gemini = settings.is_gemini_configured()
+            use_gemini = ai_gateway.is_gemini_configured()
             logger.info(f"Gemini configured: {use_gemini}")
             
+            # A pre-generated plan for this combination skips the 10-20 s Gemini call
+            warm_plan = None
+            if use_gemini and not round_config:
+                warm_plan = plan_warm_pool.take(
+                    target_role, session_type, difficulty, company_mode, persona, question_count
+                )
+            
+            if warm_plan:
+                logger.info(f"Using warm pool plan for: {target_role}")
+                plan_data = self._personalize_warm_plan(warm_plan, target_role, skills, ats_analysis)
+            
             # ===========================================
             # STRICT/STRESS MODE: Use pressure questions
             # ===========================================
-            if persona in ["strict", "stress"] and use_gemini:
+            elif persona in PRESSURE_PERSONAS and use_gemini:
                 logger.info(f"Using PRESSURE MODE question generation for persona: {persona}")
                 
                 # Generate pressure-mode questions via API
@@ -1253,7 +1519,7 @@ Return JSON array:
                     question_count=question_count,
                     difficulty=difficulty,
                     persona=persona,
-                    resume_summary=resume_text[:500],
+                    resume_summary=resume_text or "",
                 )
                 
                 # Build plan data with pressure questions
@@ -1277,6 +1543,12 @@ Return JSON array:
                     session_type, difficulty, question_count,
                     company_mode, round_config
                 )
+            elif use_gemini and settings.PLAN_STREAMING_ENABLED:
+                stream, plan_data = await self._start_streaming_plan(
+                    resume_text, ats_analysis, target_role,
+                    session_type, difficulty, question_count,
+                    company_mode, user_id=user_id
+                )
             elif use_gemini:
                 plan_data = await self._generate_with_gemini(
                     resume_text, ats_analysis, target_role,
@@ -1299,7 +1571,7 @@ Return JSON array:
         generation_via = plan_data.get("plan_generated_via", "fallback")
         if generation_via == "gemini":
             generation_source = "gemini"
-            generation_model = "gemini-pro"
+            generation_model = ai_gateway.router.current_model("gemini", "generate_interview_plan")
         elif generation_via == "mock":
             generation_source = "mock"
             generation_model = None
@@ -1350,13 +1622,17 @@ Return JSON array:
                 generation_source=generation_source,
                 generation_model=generation_model,
                 processing_time_ms=processing_time,
-                status="ready",
+                status="generating" if stream is not None else "ready",
             )
             
             self.db.add(plan)
             self.db.commit()
             self.db.refresh(plan)
             
+            # The rest of the questions are written to the plan as they arrive
+            if stream is not None:
+                plan_streams.register(plan.id, stream)
+            
             logger.info(f"=== PLAN GENERATION COMPLETE ===")
             logger.info(f"plan_id: {plan.id}")
             logger.info(f"generation_source: {generation_source}")
@@ -1367,6 +1643,8 @@ Return JSON array:
         except Exception as e:
             logger.error(f"Failed to save plan to database: {e}")
             self.db.rollback()
+            if stream is not None:
+                stream.cancel()
             raise
     
     def get_plan_by_id(
@@ -1420,6 +1698,6 @@ Return JSON array:
         return True
 
 
-def get_plan_service(db: Session) -> InterviewPlanService:
+def get_plan_service(db: Session, deadline: Optional[Deadline] = None) -> InterviewPlanService:
     """Get plan service instance."""
-    return InterviewPlanService(db)
+    return InterviewPlanService(db, deadline=deadline)
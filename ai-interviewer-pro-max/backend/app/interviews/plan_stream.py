@@ -0,0 +1,407 @@
+"""
+Streaming Plan Generation
+
+A Gemini plan takes 10-20 s, but the interview only needs its first
+question to begin. In streaming mode (PLAN_STREAMING_ENABLED) the plan
+is generated with ai_gateway.gemini_stream and its questions are parsed
+out of the stream as they arrive (see app/ai/json_stream.py):
+
+- generate_plan returns as soon as PLAN_STREAM_MIN_QUESTIONS questions
+  are in; the plan row is saved with status "generating" and
+  total_questions set to the requested count
+- The stream keeps running in the background after the request ends;
+  every new question is written to the plan row, and the full plan JSON
+  (summary, categories, focus areas) is applied when the stream ends
+- start_interview works on a generating plan; submit_answer/skip_question
+  wait (PLAN_STREAM_WAIT_SECONDS) only when they reach a question that
+  has not arrived yet (wait_for_questions)
+- A stream that fails or comes up short is topped up with pool
+  questions, extra questions are dropped
+- Waiting in another worker polls the plan row instead
+- A stream lives in one worker's memory. If that worker dies mid-stream,
+  the plan row is left short; repair_orphans() tops it up from the pool
+  and marks it ready once it has had no write for
+  PLAN_STREAM_ORPHAN_SECONDS (at startup, and when a wait runs out)
+- A turn that reaches a question that is still missing after the wait
+  raises PlanQuestionsPendingError (retryable) - it never ends the
+  interview early
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.deadline import Deadline
+from app.ai.gateway import ai_gateway
+from app.ai.json_stream import JSONArrayStreamParser
+from app.db.session import SessionLocal
+from app.interviews.plan_models import InterviewPlan
+
+
+class PlanQuestionsPendingError(RuntimeError):
+    """A question the interview has reached is still streaming in - retry the turn."""
+
+
+def _append_question(questions: List[Dict[str, Any]], question: Dict[str, Any]) -> None:
+    """Append a copy of `question`, renumbering a missing or duplicate id."""
+    ids = {q.get("id") for q in questions}
+    question = dict(question)
+    if not question.get("id") or question["id"] in ids:
+        question["id"] = f"q-{len(questions) + 1}"
+    questions.append(question)
+
+
+def _top_up(questions: List[Dict[str, Any]], count: int, top_up_questions: List[Dict[str, Any]]) -> None:
+    """Fill `questions` up to `count` with top-up questions not asked yet."""
+    asked = {q.get("text") for q in questions}
+    for question in top_up_questions:
+        if len(questions) >= count:
+            break
+        if question.get("text") not in asked:
+            _append_question(questions, question)
+
+
+class PlanStream:
+    """One plan's questions arriving from a Gemini stream."""
+
+    def __init__(
+        self,
+        prompt: str,
+        question_count: int,
+        top_up_questions: List[Dict[str, Any]],
+        user_id: Optional[str] = None,
+    ):
+        self.prompt = prompt
+        self.question_count = question_count
+        self.user_id = user_id
+        self.questions: List[Dict[str, Any]] = []
+        self.result: Optional[Dict[str, Any]] = None  # Full plan JSON, once the stream ended cleanly
+        self.streamed = 0  # Questions that came from Gemini (the rest are top-ups)
+        self.finished = False
+        self.error: Optional[str] = None
+        self.plan_id: Optional[str] = None
+
+        self._top_up_questions = top_up_questions
+        self._persisted = 0
+        self._started_at = time.time()
+        self._changed = asyncio.Condition()
+        self._task: Optional[asyncio.Task] = None
+
+    # ===========================================
+    # STREAM CONSUMER
+    # ===========================================
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="plan-stream")
+
+    async def _run(self) -> None:
+        parser = JSONArrayStreamParser("questions")
+        try:
+            # Outlives the request that started it: its own deadline, no request DB session
+            async for text in ai_gateway.gemini_stream(
+                self.prompt,
+                "generate_interview_plan",
+                user_id=self.user_id,
+                deadline=Deadline.deep(),
+            ):
+                for item in parser.feed(text):
+                    await self._add(item)
+
+            from app.interviews.plan_service import InterviewPlanService
+            try:
+                self.result = InterviewPlanService._parse_plan_json(parser.text)
+            except json.JSONDecodeError as e:
+                print(f"[PlanStream] Full plan JSON did not parse ({e}); keeping streamed questions")
+        except asyncio.CancelledError:
+            self.error = "cancelled"
+            raise
+        except Exception as e:
+            self.error = str(e)[:500]
+            print(f"[PlanStream] Stream failed after {len(self.questions)} question(s): {e}")
+        finally:
+            self._top_up()
+            self.finished = True
+            async with self._changed:
+                self._changed.notify_all()
+            if self.plan_id:
+                self._persist(final=True)
+            plan_streams.finished(self)
+
+    async def _add(self, item: Any) -> None:
+        """Append a streamed question (invalid or surplus items are dropped)."""
+        if not isinstance(item, dict) or not item.get("text"):
+            return
+        if len(self.questions) >= self.question_count:
+            return
+
+        self._append(item)
+        self.streamed += 1
+        async with self._changed:
+            self._changed.notify_all()
+        if self.plan_id:
+            self._persist()
+
+    def _append(self, question: Dict[str, Any]) -> None:
+        _append_question(self.questions, question)
+
+    def _top_up(self) -> None:
+        """Fill the plan up to question_count with pool questions."""
+        missing = self.question_count - len(self.questions)
+        if missing <= 0:
+            return
+
+        _top_up(self.questions, self.question_count, self._top_up_questions)
+        print(f"[PlanStream] Topped up {len(self.questions) - self.streamed} of {self.question_count} question(s) from the pool")
+
+    def cancel(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    # ===========================================
+    # WAITERS
+    # ===========================================
+
+    async def wait_for(self, count: int, timeout: float) -> bool:
+        """
+        Wait until `count` questions are in (or the stream ended).
+
+        Returns:
+            True if at least `count` questions are available
+        """
+        try:
+            async with self._changed:
+                await asyncio.wait_for(
+                    self._changed.wait_for(lambda: len(self.questions) >= count or self.finished),
+                    timeout=max(0.0, timeout),
+                )
+        except asyncio.TimeoutError:
+            pass
+        return len(self.questions) >= count
+
+    # ===========================================
+    # PLAN DATA & PERSISTENCE
+    # ===========================================
+
+    def plan_data(self, base: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Plan data for the plan row: the full Gemini plan once the stream
+        ended cleanly, else `base` (the pool plan) with the questions so far.
+        """
+        from app.interviews.plan_service import InterviewPlanService
+
+        if self.finished and self.result is not None and self.streamed:
+            plan_data = InterviewPlanService._gemini_plan_data(
+                self.result, list(self.questions),
+                base["session_type"], base["difficulty_level"], base.get("company_mode"),
+            )
+        else:
+            plan_data = {**base, "questions": list(self.questions), "plan_generated_via": "gemini"}
+            plan_data["total_questions"] = self.question_count
+            plan_data["estimated_duration_minutes"] = self.question_count * 3
+        return plan_data
+
+    def attach(self, plan_id: str) -> None:
+        """Bind to the saved plan row; later questions are written to it."""
+        self.plan_id = plan_id
+        if self.finished:
+            self._persist(final=True)
+        elif len(self.questions) > self._persisted:
+            self._persist()
+
+    def _persist(self, final: bool = False) -> None:
+        """Write the questions (and, at the end, the full plan fields) to the plan row."""
+        db = SessionLocal()
+        try:
+            fields: Dict[str, Any] = {"questions": list(self.questions)}
+            if final:
+                plan = db.get(InterviewPlan, self.plan_id)
+                base = {
+                    "session_type": plan.session_type,
+                    "difficulty_level": plan.difficulty_level,
+                    "company_mode": plan.company_mode,
+                } if plan else {"session_type": "mixed", "difficulty_level": "medium"}
+                plan_data = self.plan_data(base)
+                fields.update({
+                    "total_questions": len(self.questions),
+                    "technical_question_count": sum(1 for q in self.questions if q.get("type") == "technical"),
+                    "behavioral_question_count": sum(1 for q in self.questions if q.get("type") == "behavioral"),
+                    "hr_question_count": sum(1 for q in self.questions if q.get("type") == "hr"),
+                    "situational_question_count": sum(1 for q in self.questions if q.get("type") == "situational"),
+                    "processing_time_ms": int((time.time() - self._started_at) * 1000),
+                })
+                if self.result is not None:
+                    for name in ("question_categories", "strength_focus_areas", "weakness_focus_areas",
+                                 "skills_to_test", "summary", "rationale"):
+                        if plan_data.get(name):
+                            fields[name] = plan_data[name]
+
+            db.query(InterviewPlan).filter(
+                InterviewPlan.id == self.plan_id,
+            ).update(fields, synchronize_session=False)
+
+            if final:
+                # A plan already started keeps its "used" status
+                db.query(InterviewPlan).filter(
+                    InterviewPlan.id == self.plan_id,
+                    InterviewPlan.status == "generating",
+                ).update({"status": "ready"}, synchronize_session=False)
+            db.commit()
+            self._persisted = len(self.questions)
+        except Exception as e:
+            db.rollback()
+            print(f"[PlanStream] Failed to save questions for plan {self.plan_id}: {e}")
+        finally:
+            db.close()
+
+
+class PlanStreamRegistry:
+    """Plans still streaming in this worker, by plan id."""
+
+    def __init__(self):
+        self._streams: Dict[str, PlanStream] = {}
+        self._stats = {
+            "started": 0, "completed": 0, "topped_up": 0, "waits": 0, "wait_timeouts": 0, "orphans_repaired": 0,
+        }
+
+    def start(
+        self,
+        prompt: str,
+        question_count: int,
+        top_up_questions: List[Dict[str, Any]],
+        user_id: Optional[str] = None,
+    ) -> PlanStream:
+        """Start streaming a plan in the background."""
+        stream = PlanStream(prompt, question_count, top_up_questions, user_id=user_id)
+        stream.start()
+        self._stats["started"] += 1
+        return stream
+
+    def register(self, plan_id: str, stream: PlanStream) -> None:
+        """Attach a running stream to its saved plan."""
+        if not stream.finished:
+            self._streams[plan_id] = stream
+        stream.attach(plan_id)
+
+    def finished(self, stream: PlanStream) -> None:
+        """Drop a stream whose plan is complete (waiters read the row from now on)."""
+        if stream.plan_id:
+            self._streams.pop(stream.plan_id, None)
+        self._stats["completed"] += 1
+        if stream.streamed < len(stream.questions):
+            self._stats["topped_up"] += 1
+
+    async def wait_for_questions(self, plan_id: str, count: int, timeout: float = None) -> List[Dict[str, Any]]:
+        """
+        The plan's questions once at least `count` are in (or the wait ran out).
+
+        Returns:
+            Current question list (may still be shorter than `count`)
+        """
+        timeout = settings.PLAN_STREAM_WAIT_SECONDS if timeout is None else timeout
+        self._stats["waits"] += 1
+        stream = self._streams.get(plan_id)
+
+        if stream is not None:
+            if not await stream.wait_for(count, timeout):
+                self._stats["wait_timeouts"] += 1
+            return list(stream.questions)
+
+        # Streaming in another worker (or already done, or orphaned): poll the plan row
+        self.repair_orphans(plan_id)
+        deadline = time.monotonic() + timeout
+        while True:
+            questions = self._read_questions(plan_id)
+            if len(questions) >= count or time.monotonic() >= deadline:
+                break
+            await asyncio.sleep(settings.JOB_POLL_INTERVAL_SECONDS)
+
+        if len(questions) < count:
+            self._stats["wait_timeouts"] += 1
+            if self.repair_orphans(plan_id):
+                questions = self._read_questions(plan_id)
+        return questions
+
+    @staticmethod
+    def _read_questions(plan_id: str) -> List[Dict[str, Any]]:
+        db = SessionLocal()
+        try:
+            row = db.query(InterviewPlan.questions).filter(InterviewPlan.id == plan_id).first()
+            return list(row.questions or []) if row else []
+        finally:
+            db.close()
+
+    def repair_orphans(self, plan_id: Optional[str] = None) -> int:
+        """
+        Finish plans whose stream died with its worker.
+
+        A plan still short of total_questions, with no stream in this
+        worker and no write for PLAN_STREAM_ORPHAN_SECONDS, is topped up
+        with pool questions; a 'generating' plan is marked ready.
+
+        Args:
+            plan_id: Check this plan only (any status). Without it, every
+                plan still 'generating' is checked (run at startup)
+
+        Returns:
+            Number of plans repaired
+        """
+        from app.interviews.plan_service import InterviewPlanService
+        from app.interviews.seen_questions import get_seen_question_store
+
+        stale_before = datetime.utcnow() - timedelta(seconds=settings.PLAN_STREAM_ORPHAN_SECONDS)
+        db = SessionLocal()
+        try:
+            query = db.query(InterviewPlan).filter(InterviewPlan.updated_at < stale_before)
+            if plan_id:
+                query = query.filter(InterviewPlan.id == plan_id)
+            else:
+                query = query.filter(InterviewPlan.status == "generating")
+
+            repaired = 0
+            for plan in query.all():
+                if plan.id in self._streams:
+                    continue
+
+                questions = list(plan.questions or [])
+                count = plan.total_questions or 0
+                if len(questions) < count:
+                    service = InterviewPlanService(db)
+                    service.seen_question_mask = get_seen_question_store(db).load_mask(plan.user_id)
+                    pool_plan = service._generate_mock_plan(
+                        "", None, plan.target_role,
+                        plan.session_type or "mixed", plan.difficulty_level or "medium",
+                        count, plan.company_mode,
+                    )
+                    _top_up(questions, count, pool_plan["questions"])
+                elif plan.status != "generating":
+                    continue
+
+                plan.questions = questions
+                if plan.status == "generating":
+                    plan.status = "ready"
+                repaired += 1
+                print(f"[PlanStream] Repaired orphaned plan {plan.id}: {len(questions)}/{count} question(s)")
+
+            db.commit()
+            self._stats["orphans_repaired"] += repaired
+            return repaired
+        except Exception as e:
+            db.rollback()
+            print(f"[PlanStream] Orphaned plan repair failed: {e}")
+            return 0
+        finally:
+            db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Streams in flight and wait counters."""
+        return {"streaming": len(self._streams), **self._stats}
+
+
+# ===========================================
+# REGISTRY INSTANCE
+# ===========================================
+
+plan_streams = PlanStreamRegistry()
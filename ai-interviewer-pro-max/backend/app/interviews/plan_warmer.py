@@ -0,0 +1,303 @@
+"""
+Plan Warm Pool
+
+Gemini plan generation (and strict/stress pressure questions) takes
+10-20 s while the user waits on the plan screen, yet most requests fall
+into a handful of (target role, session type, difficulty, company mode,
+persona, question count) combinations. The warm pool keeps a small stock
+of pre-generated, resume-independent plans for those combinations.
+
+- take() hands out a stocked plan instantly (each plan is handed out
+  once); InterviewPlanService personalizes it with the resume's skills
+  and ATS focus areas, with no AI call
+- Taking a plan refills that combination in the background; a
+  combination that keeps missing (WARM_PLAN_MIN_REQUESTS since startup)
+  starts being stocked too
+- A refresh loop picks the WARM_PLAN_TOP_COMBOS most requested
+  combinations from plan history every WARM_PLAN_REFRESH_SECONDS (the
+  query runs in a worker thread) and tops them up to
+  WARM_PLAN_STOCK_PER_COMBO
+- Plans older than WARM_PLAN_MAX_AGE_SECONDS are discarded, never served
+- Only Gemini results are stocked: when Gemini is not configured or
+  fails, requests take the normal path
+
+The stock is per worker and in memory (like live_session_cache). Off by
+default: stocking spends Gemini quota on plans that may never be used.
+"""
+
+import asyncio
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+
+from app.core.config import settings
+
+PRESSURE_PERSONAS = ("strict", "stress")
+
+# (target_role, session_type, difficulty, company_mode, persona, question_count)
+WarmKey = Tuple[str, str, str, str, str, int]
+
+
+def warm_key(
+    target_role: str,
+    session_type: Optional[str],
+    difficulty: Optional[str],
+    company_mode: Optional[str],
+    persona: Optional[str],
+    question_count: int,
+) -> WarmKey:
+    """
+    Normalized combination key.
+
+    Persona only matters for strict/stress (pressure questions); every
+    other persona gets the same Gemini plan.
+    """
+    return (
+        (target_role or "").strip().lower(),
+        session_type or "mixed",
+        difficulty or "medium",
+        (company_mode or "").lower(),
+        persona if persona in PRESSURE_PERSONAS else "",
+        int(question_count or 10),
+    )
+
+
+class PlanWarmPool:
+    """Per-worker stock of pre-generated plans, refilled in the background."""
+
+    def __init__(self):
+        self._stock: Dict[WarmKey, Deque[Tuple[float, Dict[str, Any]]]] = {}
+        # Request values to generate with (display role, company mode) per key
+        self._requests: Dict[WarmKey, Dict[str, Any]] = {}
+        self._misses: Dict[WarmKey, int] = {}
+        self._filling: Dict[WarmKey, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._refresher: Optional[asyncio.Task] = None
+        self._stats = {"hits": 0, "misses": 0, "generated": 0, "failed": 0, "expired": 0}
+
+    # ===========================================
+    # LIFECYCLE
+    # ===========================================
+
+    def start(self) -> None:
+        """Start the refresh loop on the running event loop."""
+        if not settings.WARM_PLAN_ENABLED or self._refresher is not None:
+            return
+        self._refresher = asyncio.get_running_loop().create_task(self._refresh_loop(), name="plan-warmer")
+        print(f"[Plan Warmer] Started (stock {settings.WARM_PLAN_STOCK_PER_COMBO} x top {settings.WARM_PLAN_TOP_COMBOS} combinations)")
+
+    async def stop(self) -> None:
+        """Stop the refresh loop and any refill in flight."""
+        tasks = list(self._filling.values())
+        if self._refresher is not None:
+            tasks.append(self._refresher)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refresher = None
+        self._filling.clear()
+        self._semaphore = None
+
+    # ===========================================
+    # CONSUMER SIDE
+    # ===========================================
+
+    def take(
+        self,
+        target_role: str,
+        session_type: Optional[str],
+        difficulty: Optional[str],
+        company_mode: Optional[str],
+        persona: Optional[str],
+        question_count: int,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Hand out a stocked plan for this combination.
+
+        Returns:
+            Resume-independent plan data, or None (generate it normally)
+        """
+        if not settings.WARM_PLAN_ENABLED:
+            return None
+
+        key = warm_key(target_role, session_type, difficulty, company_mode, persona, question_count)
+        self._remember(key, target_role, company_mode)
+
+        plan_data = self._pop_fresh(key)
+        if plan_data is not None:
+            self._stats["hits"] += 1
+            self._schedule_fill(key)
+            return plan_data
+
+        self._stats["misses"] += 1
+        self._misses[key] = self._misses.get(key, 0) + 1
+        if self._misses[key] >= settings.WARM_PLAN_MIN_REQUESTS:
+            self._schedule_fill(key)
+        return None
+
+    def _remember(self, key: WarmKey, target_role: str, company_mode: Optional[str]) -> None:
+        self._requests.setdefault(key, {
+            "target_role": (target_role or "").strip(),
+            "company_mode": company_mode or None,
+        })
+
+    def _pop_fresh(self, key: WarmKey) -> Optional[Dict[str, Any]]:
+        """Oldest unexpired plan for the key (expired ones are dropped)."""
+        stock = self._stock.get(key)
+        while stock:
+            created_at, plan_data = stock.popleft()
+            if time.monotonic() - created_at <= settings.WARM_PLAN_MAX_AGE_SECONDS:
+                return plan_data
+            self._stats["expired"] += 1
+        return None
+
+    def _fresh_count(self, key: WarmKey) -> int:
+        stock = self._stock.get(key)
+        if not stock:
+            return 0
+        cutoff = time.monotonic() - settings.WARM_PLAN_MAX_AGE_SECONDS
+        while stock and stock[0][0] < cutoff:
+            stock.popleft()
+            self._stats["expired"] += 1
+        return len(stock)
+
+    # ===========================================
+    # PRODUCER SIDE
+    # ===========================================
+
+    def _schedule_fill(self, key: WarmKey) -> None:
+        """Top the key's stock up in the background (one refill per key at a time)."""
+        from app.ai.gateway import ai_gateway
+
+        if key in self._filling or not ai_gateway.is_gemini_configured():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._filling[key] = loop.create_task(self._fill(key))
+
+    async def _fill(self, key: WarmKey) -> None:
+        try:
+            while self._fresh_count(key) < settings.WARM_PLAN_STOCK_PER_COMBO:
+                if self._semaphore is None:
+                    self._semaphore = asyncio.Semaphore(max(1, settings.WARM_PLAN_CONCURRENCY))
+                async with self._semaphore:
+                    plan_data = await self._generate(key)
+                if plan_data is None:
+                    self._stats["failed"] += 1
+                    break
+                self._stock.setdefault(key, deque()).append((time.monotonic(), plan_data))
+                self._stats["generated"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._stats["failed"] += 1
+            print(f"[Plan Warmer] Refill failed for {key}: {e}")
+        finally:
+            self._filling.pop(key, None)
+
+    async def _generate(self, key: WarmKey) -> Optional[Dict[str, Any]]:
+        """One resume-independent plan, on its own DB session and deep deadline."""
+        from app.core.deadline import Deadline
+        from app.db.session import SessionLocal
+        from app.interviews.plan_service import InterviewPlanService
+
+        _, session_type, difficulty, _, persona, question_count = key
+        request = self._requests[key]
+
+        db = SessionLocal()
+        try:
+            service = InterviewPlanService(db, deadline=Deadline.deep())
+            return await service.generate_warm_plan_data(
+                target_role=request["target_role"],
+                session_type=session_type,
+                difficulty=difficulty,
+                question_count=question_count,
+                company_mode=request["company_mode"],
+                persona=persona or None,
+            )
+        finally:
+            db.close()
+
+    # ===========================================
+    # POPULAR COMBINATIONS
+    # ===========================================
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                for key in await asyncio.to_thread(self._popular_combinations):
+                    self._schedule_fill(key)
+            except Exception as e:
+                print(f"[Plan Warmer] Refresh failed: {e}")
+            await asyncio.sleep(settings.WARM_PLAN_REFRESH_SECONDS)
+
+    def _popular_combinations(self) -> List[WarmKey]:
+        """
+        Most requested combinations in recent plan history.
+
+        Persona is not stored on plans, so it comes from the session the
+        plan was used for (unused plans count as non-pressure).
+        """
+        from app.db.session import SessionLocal
+        from app.interviews.plan_models import InterviewPlan
+        from app.interviews.live_models import LiveInterviewSession
+
+        since = datetime.utcnow() - timedelta(days=settings.WARM_PLAN_HISTORY_DAYS)
+        requests = func.count(InterviewPlan.id)
+
+        db = SessionLocal()
+        try:
+            rows = db.query(
+                InterviewPlan.target_role,
+                InterviewPlan.session_type,
+                InterviewPlan.difficulty_level,
+                InterviewPlan.company_mode,
+                LiveInterviewSession.interviewer_persona,
+                InterviewPlan.total_questions,
+                requests,
+            ).outerjoin(
+                LiveInterviewSession, LiveInterviewSession.id == InterviewPlan.used_for_session_id,
+            ).filter(
+                InterviewPlan.created_at >= since,
+            ).group_by(
+                InterviewPlan.target_role,
+                InterviewPlan.session_type,
+                InterviewPlan.difficulty_level,
+                InterviewPlan.company_mode,
+                LiveInterviewSession.interviewer_persona,
+                InterviewPlan.total_questions,
+            ).having(
+                requests >= settings.WARM_PLAN_MIN_REQUESTS,
+            ).order_by(requests.desc()).limit(settings.WARM_PLAN_TOP_COMBOS).all()
+        finally:
+            db.close()
+
+        keys = []
+        for target_role, session_type, difficulty, company_mode, persona, question_count, _ in rows:
+            key = warm_key(target_role, session_type, difficulty, company_mode, persona, question_count)
+            self._remember(key, target_role, company_mode)
+            if key not in keys:
+                keys.append(key)
+        return keys
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Stocked plans, combinations and hit/miss counters."""
+        return {
+            "enabled": settings.WARM_PLAN_ENABLED,
+            "combinations": len(self._stock),
+            "stocked": sum(len(stock) for stock in self._stock.values()),
+            "refilling": len(self._filling),
+            **self._stats,
+        }
+
+
+# ===========================================
+# WARM POOL INSTANCE
+# ===========================================
+
+plan_warm_pool = PlanWarmPool()
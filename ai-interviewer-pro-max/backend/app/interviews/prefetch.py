@@ -0,0 +1,116 @@
+"""
+Next-Question Prefetch
+
+While the candidate is answering question N, the content for question
+N+1 is already known from the plan - only the AI-derived parts (the
+high-pressure question variant, the persona transition) are left to
+compute. Prefetching them while the candidate types takes that Groq
+round trip off the next turn's critical path.
+
+- schedule() starts one background task per (session, question index);
+  the result is stored on the cached LiveSessionState (state.prefetched)
+- take() hands the result to submit_answer / skip_question. A prefetch
+  still in flight gets LIVE_PREFETCH_GRACE_MS to finish (it runs next to
+  the acknowledgment call, so the wait is usually free); after that the
+  caller falls back to formatting the plan question itself
+- A prefetch never fails a turn: errors just mean no prefetched content
+"""
+
+import asyncio
+from typing import Dict, Any, Awaitable, Callable, Optional, Tuple
+
+from app.core.config import settings
+from app.interviews.session_cache import LiveSessionState
+
+
+PrefetchBuilder = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class QuestionPrefetcher:
+    """Background prefetch of next-question content, keyed by session and index."""
+
+    def __init__(self, grace_ms: int = None):
+        self.grace_ms = settings.LIVE_PREFETCH_GRACE_MS if grace_ms is None else grace_ms
+        self._tasks: Dict[Tuple[str, int], asyncio.Task] = {}
+        self._stats = {"scheduled": 0, "ready": 0, "joined": 0, "missed": 0, "failed": 0}
+
+    def schedule(self, state: LiveSessionState, index: int, build: PrefetchBuilder) -> None:
+        """Start prefetching question `index` unless it is done or already running."""
+        if not settings.LIVE_PREFETCH_ENABLED:
+            return
+        if index >= len(state.questions) or index in state.prefetched:
+            return
+
+        key = (state.session_id, index)
+        if key in self._tasks:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._tasks[key] = loop.create_task(self._run(state, key, build))
+        self._stats["scheduled"] += 1
+
+    async def _run(self, state: LiveSessionState, key: Tuple[str, int], build: PrefetchBuilder) -> Optional[Dict[str, Any]]:
+        try:
+            content = await build()
+            state.prefetched[key[1]] = content
+            return content
+        except Exception as e:
+            self._stats["failed"] += 1
+            print(f"[Prefetch] Question {key[1]} for session {key[0]} failed: {e}")
+            return None
+        finally:
+            self._tasks.pop(key, None)
+
+    async def take(self, state: LiveSessionState, index: int) -> Optional[Dict[str, Any]]:
+        """
+        Prefetched content for question `index`, or None to fall back.
+
+        Waits at most LIVE_PREFETCH_GRACE_MS for a prefetch in flight.
+        """
+        content = state.prefetched.pop(index, None)
+        if content is not None:
+            self._stats["ready"] += 1
+            return content
+
+        task = self._tasks.get((state.session_id, index))
+        if task is not None:
+            try:
+                # shield: a late prefetch keeps running for the next caller
+                content = await asyncio.wait_for(asyncio.shield(task), timeout=self.grace_ms / 1000)
+            except asyncio.TimeoutError:
+                content = None
+            if content is not None:
+                state.prefetched.pop(index, None)
+                self._stats["joined"] += 1
+                return content
+
+        self._stats["missed"] += 1
+        return None
+
+    def discard(self, session_id: str) -> None:
+        """Cancel prefetches for a session that has ended."""
+        for key in [k for k in self._tasks if k[0] == session_id]:
+            task = self._tasks.pop(key, None)
+            if task is not None:
+                task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        served = self._stats["ready"] + self._stats["joined"]
+        lookups = served + self._stats["missed"]
+        return {
+            "in_flight": len(self._tasks),
+            "grace_ms": self.grace_ms,
+            **self._stats,
+            "hit_rate_percent": round(served / lookups * 100, 1) if lookups else 0,
+        }
+
+
+# ===========================================
+# PREFETCHER INSTANCE
+# ===========================================
+
+question_prefetcher = QuestionPrefetcher()
@@ -17,7 +17,7 @@ DESIGN PRINCIPLES:
 
 import random
 import hashlib
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
 
 
@@ -278,6 +278,122 @@ SITUATIONAL_QUESTIONS = {
 }
 
 
+# All pools organized by round
+MASTER_POOLS = {
+    QuestionRound.DSA: DSA_QUESTIONS,
+    QuestionRound.TECHNICAL: TECHNICAL_QUESTIONS,
+    QuestionRound.BEHAVIORAL: BEHAVIORAL_QUESTIONS,
+    QuestionRound.HR: HR_QUESTIONS,
+    QuestionRound.SYSTEM_DESIGN: SYSTEM_DESIGN_QUESTIONS,
+    QuestionRound.SITUATIONAL: SITUATIONAL_QUESTIONS,
+}
+
+
+# ===========================================
+# COMPILED POOL INDEX
+# ===========================================
+
+def _question_id(round_type: str, difficulty: str, question_text: str) -> str:
+    """Stable ID for a question based on its content."""
+    content = f"{round_type}:{difficulty}:{question_text[:50]}"
+    return f"q-{hashlib.md5(content.encode()).hexdigest()[:12]}"
+
+
+class QuestionPoolIndex:
+    """
+    The master pools compiled once at import into an immutable index.
+    
+    - Every question gets an ordinal: its position in flat, parallel
+      tuples of ids, texts, topics and difficulties (IDs hashed here,
+      never per request)
+    - (round, difficulty) buckets are ranges of ordinals
+    - Exclusion sets are int bitmasks over ordinals, so filtering a bucket
+      is a shift-and-test per question instead of string hashing and
+      dict copies
+    """
+    
+    def __init__(self, pools: Dict[str, Dict[str, List[Dict[str, Any]]]]):
+        ids: List[str] = []
+        texts: List[str] = []
+        topics: List[Tuple[str, ...]] = []
+        difficulties: List[str] = []
+        self._buckets: Dict[Tuple[str, str], range] = {}
+        # Questions sharing the first 50 characters share an ID, so an ID maps to a mask
+        self._id_masks: Dict[str, int] = {}
+        
+        for round_type, by_difficulty in pools.items():
+            for difficulty, questions in by_difficulty.items():
+                start = len(ids)
+                for question in questions:
+                    question_id = _question_id(round_type, difficulty, question["text"])
+                    self._id_masks[question_id] = self._id_masks.get(question_id, 0) | (1 << len(ids))
+                    ids.append(question_id)
+                    texts.append(question["text"])
+                    topics.append(tuple(question.get("topics", [])))
+                    difficulties.append(difficulty)
+                self._buckets[(round_type, difficulty)] = range(start, len(ids))
+        
+        self.ids: Tuple[str, ...] = tuple(ids)
+        self.texts: Tuple[str, ...] = tuple(texts)
+        self.topics: Tuple[Tuple[str, ...], ...] = tuple(topics)
+        self.difficulties: Tuple[str, ...] = tuple(difficulties)
+        
+        # Identifies the ordinal layout: persisted bitmaps are only valid for the same version
+        self.version = hashlib.sha256("\n".join(ids).encode()).hexdigest()[:16]
+        
+        # A difficulty a round has no questions for falls back to the round's
+        # medium pool, served under IDs hashed with the requested difficulty
+        # (see question_id); those IDs resolve to the same ordinals
+        self._fallback_ids: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        for round_type in pools:
+            medium = self.bucket(round_type, Difficulty.MEDIUM)
+            for difficulty in (Difficulty.EASY, Difficulty.MEDIUM, Difficulty.HARD, Difficulty.EXPERT):
+                if self.bucket(round_type, difficulty) or not medium:
+                    continue
+                fallback_ids = tuple(_question_id(round_type, difficulty, texts[o]) for o in medium)
+                self._fallback_ids[(round_type, difficulty)] = fallback_ids
+                for ordinal, question_id in zip(medium, fallback_ids):
+                    self._id_masks[question_id] = self._id_masks.get(question_id, 0) | self._id_masks[ids[ordinal]]
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def bucket(self, round_type: str, difficulty: str) -> range:
+        """Ordinals of one round/difficulty pool (empty range if none)."""
+        return self._buckets.get((round_type, difficulty), range(0))
+    
+    def mask(self, question_ids: Iterable[str]) -> int:
+        """Bitmask of the given question IDs (IDs not in the pools are ignored)."""
+        mask = 0
+        for question_id in question_ids:
+            mask |= self._id_masks.get(question_id, 0)
+        return mask
+    
+    def id_mask(self, ordinal: int) -> int:
+        """Bitmask of every question sharing this ordinal's ID."""
+        return self._id_masks[self.ids[ordinal]]
+    
+    def question_id(self, ordinal: int, round_type: str, difficulty: str) -> str:
+        """
+        ID of a question served for a round/difficulty request.
+        
+        The ordinal's own ID, except for the medium-pool fallback of an
+        empty difficulty, whose IDs are hashed with the requested difficulty.
+        """
+        if self.bucket(round_type, difficulty):
+            return self.ids[ordinal]
+        medium = self.bucket(round_type, Difficulty.MEDIUM)
+        if ordinal not in medium:
+            return self.ids[ordinal]
+        fallback_ids = self._fallback_ids.get((round_type, difficulty))
+        if fallback_ids is not None:
+            return fallback_ids[ordinal - medium.start]
+        return _question_id(round_type, difficulty, self.texts[ordinal])
+
+
+question_pool_index = QuestionPoolIndex(MASTER_POOLS)
+
+
 # ===========================================
 # QUESTION POOL MANAGER
 # ===========================================
@@ -289,30 +405,35 @@ class QuestionPoolManager:
     - Memory to prevent repetition
     - Difficulty adaptation
     - Company-specific filtering
+    
+    Selection runs over question_pool_index (precomputed IDs, bitmask
+    exclusions, seeded partial shuffle of ordinals).
     """
     
-    # All pools organized by round
-    POOLS = {
-        QuestionRound.DSA: DSA_QUESTIONS,
-        QuestionRound.TECHNICAL: TECHNICAL_QUESTIONS,
-        QuestionRound.BEHAVIORAL: BEHAVIORAL_QUESTIONS,
-        QuestionRound.HR: HR_QUESTIONS,
-        QuestionRound.SYSTEM_DESIGN: SYSTEM_DESIGN_QUESTIONS,
-        QuestionRound.SITUATIONAL: SITUATIONAL_QUESTIONS,
-    }
+    POOLS = MASTER_POOLS
     
-    def __init__(self, session_seed: Optional[str] = None, asked_question_ids: Optional[Set[str]] = None):
+    def __init__(
+        self,
+        session_seed: Optional[str] = None,
+        asked_question_ids: Optional[Set[str]] = None,
+        asked_mask: int = 0,
+    ):
         """
         Initialize pool manager with session-specific seed.
         
         Args:
             session_seed: Unique seed for this session (ensures different questions per session)
             asked_question_ids: Set of question IDs already asked (for persistence across sessions)
+            asked_mask: Same, as a bitmask over question_pool_index (see SeenQuestionStore)
         """
         self.session_seed = session_seed or str(datetime.utcnow().timestamp())
         self.asked_question_ids = asked_question_ids or set()
         self.session_asked = set()  # Questions asked in THIS session
         
+        # Same exclusions as ordinal bitmasks over question_pool_index
+        self._asked_mask = asked_mask | question_pool_index.mask(self.asked_question_ids)
+        self._session_mask = 0
+        
         # Initialize random with session seed for reproducible but unique selection
         self.rng = random.Random(self._hash_seed(self.session_seed))
     
@@ -322,8 +443,7 @@ class QuestionPoolManager:
     
     def _generate_question_id(self, round_type: str, difficulty: str, question_text: str) -> str:
         """Generate unique ID for a question based on its content."""
-        content = f"{round_type}:{difficulty}:{question_text[:50]}"
-        return f"q-{hashlib.md5(content.encode()).hexdigest()[:12]}"
+        return _question_id(round_type, difficulty, question_text)
     
     def get_questions_for_round(
         self,
@@ -348,49 +468,50 @@ class QuestionPoolManager:
         Returns:
             List of question objects with unique IDs
         """
-        pool = self.POOLS.get(round_type, {})
-        difficulty_pool = pool.get(difficulty, [])
+        index = question_pool_index
+        primary = index.bucket(round_type, difficulty)
         
         # Fallback to medium if difficulty pool is empty
-        if not difficulty_pool:
-            difficulty_pool = pool.get(Difficulty.MEDIUM, [])
+        if not primary:
+            primary = index.bucket(round_type, Difficulty.MEDIUM)
         
         # Combine all exclusions
-        excluded = self.asked_question_ids | self.session_asked
+        excluded = self._session_mask
         if exclude_ids:
-            excluded |= exclude_ids
-        
-        # Filter and shuffle available questions
-        available = []
-        for q in difficulty_pool:
-            q_id = self._generate_question_id(round_type, difficulty, q["text"])
-            if q_id not in excluded:
-                available.append({**q, "_id": q_id})
+            excluded |= index.mask(exclude_ids)
         
-        # If not enough questions, include from adjacent difficulties
-        if len(available) < count:
-            adjacent_difficulties = self._get_adjacent_difficulties(difficulty)
-            for adj_diff in adjacent_difficulties:
-                adj_pool = pool.get(adj_diff, [])
-                for q in adj_pool:
-                    q_id = self._generate_question_id(round_type, adj_diff, q["text"])
-                    if q_id not in excluded and q_id not in [a["_id"] for a in available]:
-                        available.append({**q, "_id": q_id, "difficulty": adj_diff})
+        buckets = [primary]
+        buckets.extend(index.bucket(round_type, adj_diff) for adj_diff in self._get_adjacent_difficulties(difficulty))
         
-        # Shuffle using session RNG
-        self.rng.shuffle(available)
-        
-        # Select the required count
-        selected = available[:count]
+        # Unseen questions first (adjacent difficulties only if short), then - for a
+        # user who has seen the whole pool - questions from past sessions
+        selected: List[int] = []
+        for history_mask in (self._asked_mask, 0):
+            for bucket in buckets:
+                if len(selected) >= count:
+                    break
+                available = [ordinal for ordinal in bucket if not ((excluded | history_mask) >> ordinal) & 1]
+                while available and len(selected) < count:
+                    for ordinal in self._sample(available, count - len(selected)):
+                        if (excluded >> ordinal) & 1:
+                            continue  # Same-ID twin of a question picked in this draw
+                        selected.append(ordinal)
+                        excluded |= index.id_mask(ordinal)
+                    available = [ordinal for ordinal in available if not (excluded >> ordinal) & 1]
+            if len(selected) >= count or not self._asked_mask:
+                break
         
         # Build final question objects
         questions = []
-        for i, q in enumerate(selected):
-            q_id = q["_id"]
+        for ordinal in selected:
+            q_id = index.question_id(ordinal, round_type, difficulty)
             self.session_asked.add(q_id)
+            self._session_mask |= index.id_mask(ordinal)
             
             # Replace {role} placeholder if present
-            text = q["text"].replace("{role}", target_role) if target_role else q["text"]
+            text = index.texts[ordinal]
+            if target_role:
+                text = text.replace("{role}", target_role)
             
             questions.append({
                 "id": q_id,
@@ -398,15 +519,23 @@ class QuestionPoolManager:
                 "type": round_type,
                 "round_name": self._get_round_display_name(round_type),
                 "category": self._get_category_from_round(round_type),
-                "difficulty": q.get("difficulty", difficulty),
+                "difficulty": difficulty if ordinal in primary else index.difficulties[ordinal],
                 "company_style": company_style,
                 "time_limit_seconds": self._get_time_limit(round_type, difficulty),
-                "expected_topics": q.get("topics", []),
+                "expected_topics": list(index.topics[ordinal]),
                 "scoring_rubric": self._get_scoring_rubric(round_type),
             })
         
         return questions
     
+    def _sample(self, ordinals: List[int], count: int) -> List[int]:
+        """Seeded partial Fisher-Yates: only the first `count` slots are shuffled."""
+        count = min(count, len(ordinals))
+        for i in range(count):
+            j = self.rng.randrange(i, len(ordinals))
+            ordinals[i], ordinals[j] = ordinals[j], ordinals[i]
+        return ordinals[:count]
+    
     def _get_adjacent_difficulties(self, difficulty: str) -> List[str]:
         """Get adjacent difficulty levels for fallback."""
         order = [Difficulty.EASY, Difficulty.MEDIUM, Difficulty.HARD, Difficulty.EXPERT]
@@ -664,6 +793,6 @@ class QuestionPoolManager:
 # SINGLETON INSTANCE (for import)
 # ===========================================
 
-def get_question_pool(session_seed: Optional[str] = None) -> QuestionPoolManager:
+def get_question_pool(session_seed: Optional[str] = None, asked_mask: int = 0) -> QuestionPoolManager:
     """Get a new question pool manager instance."""
-    return QuestionPoolManager(session_seed=session_seed)
+    return QuestionPoolManager(session_seed=session_seed, asked_mask=asked_mask)
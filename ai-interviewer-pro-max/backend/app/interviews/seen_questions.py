@@ -0,0 +1,107 @@
+"""
+Seen-Question Store
+
+Per-user history of pool questions already asked, so a returning user's
+plans exclude them (QuestionPoolManager asked_mask).
+
+- Stored as one UserSeenQuestions row per user: a bitmap over
+  question_pool_index ordinals (the full pool is a few hundred bits, so a
+  plain bitmap beats any compressed encoding here)
+- Loaded with one primary-key query at plan time
+- Updated in bulk when a session is finalized: one query for the
+  session's asked question IDs, one bitwise OR, one write
+- Recording is idempotent (OR), so a retried finalization is harmless
+"""
+
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.interviews.live_models import InterviewAnswer
+from app.interviews.plan_models import UserSeenQuestions
+from app.interviews.question_pools import question_pool_index
+
+
+def _decode(bitmap: Optional[bytes]) -> int:
+    return int.from_bytes(bitmap or b"", "little")
+
+
+def _encode(mask: int) -> bytes:
+    return mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+
+
+class SeenQuestionStore:
+    """Load and update per-user seen-question bitmaps."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _get_row(self, user_id: str) -> Optional[UserSeenQuestions]:
+        row = self.db.get(UserSeenQuestions, user_id)
+        if row is not None and row.pool_version != question_pool_index.version:
+            # Written against another pool layout - the ordinals mean different questions now
+            return None
+        return row
+
+    def load_mask(self, user_id: str) -> int:
+        """
+        Bitmask of every pool question the user has been asked.
+
+        Returns:
+            Mask over question_pool_index ordinals (0 for a new user or a changed pool)
+        """
+        row = self._get_row(user_id)
+        return _decode(row.seen_bitmap) if row else 0
+
+    def record_session(self, session_id: str, user_id: str) -> int:
+        """
+        Add the questions asked in a session (answered or skipped) to the user's history.
+
+        Args:
+            session_id: Live interview session
+            user_id: Session owner
+
+        Returns:
+            Number of questions newly marked as seen
+        """
+        question_ids = [
+            question_id for (question_id,) in self.db.query(InterviewAnswer.question_id).filter(
+                InterviewAnswer.session_id == session_id,
+                InterviewAnswer.user_id == user_id,
+            ).distinct()
+        ]
+        session_mask = question_pool_index.mask(question_ids)
+        if not session_mask:
+            return 0
+
+        row = self.db.get(UserSeenQuestions, user_id)
+        if row is None:
+            row = UserSeenQuestions(user_id=user_id, pool_version=question_pool_index.version)
+            self.db.add(row)
+            seen = 0
+        elif row.pool_version != question_pool_index.version:
+            row.pool_version = question_pool_index.version
+            seen = 0
+        else:
+            seen = _decode(row.seen_bitmap)
+
+        updated = seen | session_mask
+        row.seen_bitmap = _encode(updated)
+        row.seen_count = bin(updated).count("1")
+
+        try:
+            self.db.commit()
+        except IntegrityError:
+            # Another finalization created the row first - merge into it
+            self.db.rollback()
+            return self.record_session(session_id, user_id)
+
+        added = bin(updated & ~seen).count("1")
+        print(f"[SeenQuestions] User {user_id}: +{added} from session {session_id} ({row.seen_count} seen)")
+        return added
+
+
+def get_seen_question_store(db: Session) -> SeenQuestionStore:
+    """Get seen-question store instance."""
+    return SeenQuestionStore(db)
@@ -0,0 +1,151 @@
+"""
+Live Session State Cache
+
+Per-worker, write-through cache of live interview state so the hot path
+(submit_answer, skip_question, pause_interview, get_session_state) does
+not re-read the LiveInterviewSession row and re-parse the plan's
+questions JSON on every turn.
+
+- Holds the session counters, the parsed question list and the resolved
+  personality profile, keyed by session id
+- LRU-bounded (LIVE_SESSION_CACHE_SIZE); an entry expires once the
+  session has been idle for LIVE_SESSION_CACHE_TTL_SECONDS, measured
+  from last_activity_at
+- The database stays the source of truth: the service writes every state
+  change to the session row first (a guarded UPDATE, see
+  LiveInterviewService._write_session) and only then to the cache. A
+  guarded write that matches no row means another worker moved the
+  session on - the entry is dropped and reloaded from the database
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from app.core.config import settings
+from app.personalities.modes import PersonalityProfile
+
+
+@dataclass
+class LiveSessionState:
+    """Snapshot of a live session plus its parsed plan."""
+
+    session_id: str
+    user_id: str
+    plan_id: str
+    target_role: str
+    status: str
+    interviewer_persona: str
+    total_questions: int
+    current_question_index: int
+    questions_answered: int
+    questions_skipped: int
+    last_activity_at: Optional[datetime]
+    questions: List[Dict[str, Any]] = field(default_factory=list)
+    plan_difficulty: str = "medium"
+    plan_company_mode: Optional[str] = None
+    profile: Optional[PersonalityProfile] = None
+    prefetched: Dict[int, Dict[str, Any]] = field(default_factory=dict)  # question index -> content, see prefetch.py
+    served_question_text: Dict[int, str] = field(default_factory=dict)  # question index -> AI variant actually asked
+
+    @classmethod
+    def from_rows(cls, session, plan, profile: PersonalityProfile) -> "LiveSessionState":
+        """Build from a LiveInterviewSession and its InterviewPlan."""
+        return cls(
+            session_id=session.id,
+            user_id=session.user_id,
+            plan_id=session.plan_id,
+            target_role=session.target_role,
+            status=session.status,
+            interviewer_persona=session.interviewer_persona or "professional",
+            total_questions=session.total_questions or 0,
+            current_question_index=session.current_question_index or 0,
+            questions_answered=session.questions_answered or 0,
+            questions_skipped=session.questions_skipped or 0,
+            last_activity_at=session.last_activity_at,
+            questions=list(plan.questions or []),
+            plan_difficulty=plan.difficulty_level or "medium",
+            plan_company_mode=plan.company_mode,
+            profile=profile,
+        )
+
+
+class LiveSessionCache:
+    """LRU + idle-TTL cache of LiveSessionState."""
+
+    def __init__(self, max_size: int = None, ttl_seconds: float = None):
+        self.max_size = max_size or settings.LIVE_SESSION_CACHE_SIZE
+        self.ttl_seconds = ttl_seconds or settings.LIVE_SESSION_CACHE_TTL_SECONDS
+        self._entries: "OrderedDict[str, LiveSessionState]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "evicted": 0, "invalidated": 0}
+
+    def _is_expired(self, state: LiveSessionState) -> bool:
+        if state.last_activity_at is None:
+            return False
+        return (datetime.utcnow() - state.last_activity_at).total_seconds() > self.ttl_seconds
+
+    def get(self, session_id: str) -> Optional[LiveSessionState]:
+        """Cached state, or None on a miss / expired entry."""
+        with self._lock:
+            state = self._entries.get(session_id)
+            if state is None:
+                self._stats["misses"] += 1
+                return None
+
+            if self._is_expired(state):
+                del self._entries[session_id]
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(session_id)
+            self._stats["hits"] += 1
+            return state
+
+    def put(self, state: LiveSessionState) -> None:
+        """Insert or replace an entry, evicting the least recently used."""
+        with self._lock:
+            self._entries[state.session_id] = state
+            self._entries.move_to_end(state.session_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats["evicted"] += 1
+
+    def update(self, state: LiveSessionState, **fields: Any) -> None:
+        """Apply session row fields already committed to the database."""
+        with self._lock:
+            for name, value in fields.items():
+                if hasattr(state, name):
+                    setattr(state, name, value)
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop an entry (state changed outside the hot path)."""
+        with self._lock:
+            if self._entries.pop(session_id, None) is not None:
+                self._stats["invalidated"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Size and hit/miss counters."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                **self._stats,
+                "hit_rate_percent": round(self._stats["hits"] / lookups * 100, 1) if lookups else 0,
+            }
+
+
+# ===========================================
+# CACHE INSTANCE
+# ===========================================
+
+live_session_cache = LiveSessionCache()
@@ -0,0 +1,120 @@
+"""
+Live Turn Planner
+
+Decides, per answer, which AI enrichments a live turn can afford within
+LIVE_TURN_LATENCY_BUDGET_MS. Both enrichments have local equivalents
+already used as fallbacks, so dropping one costs quality, not function:
+
+- acknowledgment: Groq sentence vs. the word-count-tiered local
+  acknowledgment (_get_acknowledgment)
+- relevance: Groq check vs. the word-count heuristic
+
+Rules, in order, per enrichment:
+1. Groq not configured -> local
+2. Answer shorter than the enrichment's word threshold -> local (there is
+   little to reference or judge in a one-liner)
+3. Breaker open -> local (the call would be rejected anyway)
+4. Rolling p95 of the operation (circuit breaker window) over the
+   budget -> local; with too few samples to judge, Groq is used.
+   Every LIVE_TURN_PROBE_EVERY-th turn over budget still calls Groq so
+   the window keeps fresh samples and the operation can recover
+
+The two calls run concurrently, so each is judged against the whole
+budget. The plan is stored on InterviewAnswer.turn_plan together with
+the measured AI step time.
+"""
+
+import threading
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, Optional
+
+from app.core.config import settings
+from app.ai.gateway import ai_gateway
+from app.ai.circuit_breaker import circuit_breakers, OPEN
+
+
+GROQ = "groq"
+LOCAL = "local"
+
+ACK_OPERATION = "generate_acknowledgment"
+RELEVANCE_OPERATION = "check_answer_relevance"
+
+
+@dataclass
+class TurnPlan:
+    """Which enrichments a turn runs, and why."""
+
+    acknowledgment: str = GROQ
+    relevance: str = GROQ
+    budget_ms: int = 0
+    word_count: int = 0
+    reasons: Dict[str, str] = field(default_factory=dict)  # operation -> rule applied (local choices, probes)
+    p95_ms: Dict[str, Optional[int]] = field(default_factory=dict)
+    elapsed_ms: Optional[int] = None  # measured after the turn's AI step
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class TurnPlanner:
+    """Per-turn enrichment decisions from rolling Groq latency."""
+
+    def __init__(self, budget_ms: int = None):
+        self.budget_ms = budget_ms or settings.LIVE_TURN_LATENCY_BUDGET_MS
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+        self._over_budget: Dict[str, int] = {}  # operation -> turns planned out for latency
+
+    def _decide(self, operation: str, word_count: int, min_words: int, plan: TurnPlan) -> str:
+        breaker = circuit_breakers.get("groq", operation)
+        p95 = breaker.p95_latency_ms()
+        plan.p95_ms[operation] = p95
+
+        if not ai_gateway.is_groq_configured():
+            reason = "groq_not_configured"
+        elif word_count < min_words:
+            reason = "short_answer"
+        elif breaker.state == OPEN:
+            reason = "circuit_open"
+        elif p95 is not None and p95 > plan.budget_ms:
+            with self._lock:
+                self._over_budget[operation] = self._over_budget.get(operation, 0) + 1
+                probe = self._over_budget[operation] % max(1, settings.LIVE_TURN_PROBE_EVERY) == 0
+            if probe:
+                plan.reasons[operation] = "latency_probe"
+                return GROQ
+            reason = "p95_over_budget"
+        else:
+            return GROQ
+
+        plan.reasons[operation] = reason
+        return LOCAL
+
+    def plan(self, word_count: int) -> TurnPlan:
+        """Plan the enrichments for an answer of `word_count` words."""
+        plan = TurnPlan(budget_ms=self.budget_ms, word_count=word_count)
+        plan.acknowledgment = self._decide(
+            ACK_OPERATION, word_count, settings.LIVE_TURN_AI_ACK_MIN_WORDS, plan,
+        )
+        plan.relevance = self._decide(
+            RELEVANCE_OPERATION, word_count, settings.LIVE_TURN_AI_RELEVANCE_MIN_WORDS, plan,
+        )
+
+        with self._lock:
+            for name, choice in (("acknowledgment", plan.acknowledgment), ("relevance", plan.relevance)):
+                key = f"{name}_{choice}"
+                self._counts[key] = self._counts.get(key, 0) + 1
+            for reason in plan.reasons.values():
+                self._counts[reason] = self._counts.get(reason, 0) + 1
+        return plan
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"budget_ms": self.budget_ms, **self._counts}
+
+
+# ===========================================
+# PLANNER INSTANCE
+# ===========================================
+
+turn_planner = TurnPlanner()
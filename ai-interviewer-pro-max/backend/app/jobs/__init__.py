@@ -0,0 +1,6 @@
+"""
+Jobs Module
+
+Durable background jobs (interview finalization, deep evaluation,
+behavioral summaries) run by an in-process worker pool.
+"""
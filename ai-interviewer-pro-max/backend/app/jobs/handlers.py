@@ -0,0 +1,93 @@
+"""
+Background Job Handlers
+
+Each handler runs on the job worker's own DB session and its own deep
+deadline, and returns a small JSON result stored on the job row.
+Raising marks the attempt failed (and retried, see JobQueue).
+"""
+
+from typing import Dict, Any
+
+from sqlalchemy.orm import Session
+
+from app.core.deadline import Deadline
+from app.jobs.models import BackgroundJob
+
+
+async def run_batch_deep_evaluation(db: Session, job: BackgroundJob) -> Dict[str, Any]:
+    """Deep-evaluate every pending answer of a session (job_key = session id)."""
+    from app.evaluations.service import EvaluationService
+
+    service = EvaluationService(db, deadline=Deadline.deep())
+    results = await service.batch_deep_evaluate(
+        session_id=job.job_key,
+        user_id=job.user_id,
+        resume_context=(job.payload or {}).get("resume_context"),
+    )
+    return {"processed": len(results)}
+
+
+async def run_behavioral_summary(db: Session, job: BackgroundJob) -> Dict[str, Any]:
+    """Aggregate a session's behavioral insights (job_key = session id)."""
+    from app.simulation.service import BehavioralSimulationService
+
+    service = BehavioralSimulationService(db, deadline=Deadline.deep())
+    try:
+        summary = await service.generate_session_summary(
+            user_id=job.user_id,
+            session_id=job.job_key,
+        )
+    except ValueError as e:
+        # Nothing to summarize (no insights recorded) - not worth retrying
+        return {"summary_id": None, "skipped": str(e)}
+    return {"summary_id": summary.id}
+
+
+async def run_record_seen_questions(db: Session, job: BackgroundJob) -> Dict[str, Any]:
+    """Add a session's pool questions to the user's seen history (job_key = session id)."""
+    from app.interviews.seen_questions import get_seen_question_store
+
+    added = get_seen_question_store(db).record_session(session_id=job.job_key, user_id=job.user_id)
+    return {"newly_seen": added}
+
+
+async def run_finalize_interview(db: Session, job: BackgroundJob) -> Dict[str, Any]:
+    """
+    Finalize a completed interview (job_key = session id).
+
+    Runs the deep evaluation and behavioral summary first so the report
+    is built from them; either step failing only degrades the report.
+    Also records the session's questions in the user's seen history.
+    """
+    from app.reports.service import ReportService
+
+    steps = {}
+    for name, step in (
+        ("record_seen_questions", run_record_seen_questions),
+        ("batch_deep_evaluation", run_batch_deep_evaluation),
+        ("behavioral_summary", run_behavioral_summary),
+    ):
+        try:
+            steps[name] = await step(db, job)
+        except Exception as e:
+            db.rollback()
+            print(f"[FINALIZE] {name} failed for session {job.job_key}: {e}")
+            steps[name] = {"error": str(e)[:500]}
+
+    report = await ReportService(db, deadline=Deadline.deep()).finalize_interview(
+        session_id=job.job_key,
+        user_id=job.user_id,
+    )
+    return {
+        "report_id": report.id,
+        "readiness_score": report.readiness_score,
+        "steps": steps,
+    }
+
+
+JOB_HANDLERS = {
+    "finalize_interview": run_finalize_interview,
+    "batch_deep_evaluation": run_batch_deep_evaluation,
+    "behavioral_summary": run_behavioral_summary,
+    "record_seen_questions": run_record_seen_questions,
+}
@@ -0,0 +1,77 @@
+"""
+Background Job Models
+
+One row per queued unit of background work. The table is the queue:
+workers claim rows with a guarded UPDATE, so jobs survive restarts and
+are never run by two workers at once.
+
+At most one queued/running job may exist per (job_type, job_key); the
+partial unique index ux_background_jobs_active enforces it.
+"""
+
+from sqlalchemy import Column, String, Text, Integer, DateTime, JSON, Index, text
+from datetime import datetime
+import uuid
+
+from app.db.base import Base
+
+
+class BackgroundJob(Base):
+    """
+    Background job.
+    
+    Lifecycle: queued -> running -> done | failed
+    (a failed attempt goes back to queued until JOB_MAX_ATTEMPTS).
+    """
+    
+    __tablename__ = "background_jobs"
+    __table_args__ = (
+        Index("ix_background_jobs_type_key", "job_type", "job_key"),
+        Index(
+            "ux_background_jobs_active", "job_type", "job_key",
+            unique=True,
+            sqlite_where=text("status IN ('queued', 'running')"),
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+    )
+    
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    
+    # What to run
+    job_type = Column(String(50), nullable=False)  # finalize_interview, batch_deep_evaluation, behavioral_summary
+    job_key = Column(String(100), nullable=False)  # e.g. session id - one active job per type + key
+    user_id = Column(String(36), nullable=False, index=True)
+    payload = Column(JSON, nullable=True)
+    
+    # State
+    status = Column(String(20), nullable=False, default="queued", index=True)  # queued, running, done, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)  # Refreshed by the worker while running
+    finished_at = Column(DateTime, nullable=True)
+    
+    def is_finished(self) -> bool:
+        return self.status in ("done", "failed")
+    
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "job_type": self.job_type,
+            "job_key": self.job_key,
+            "status": self.status,
+            "attempts": self.attempts,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat() + 'Z' if self.created_at else None,
+            "started_at": self.started_at.isoformat() + 'Z' if self.started_at else None,
+            "heartbeat_at": self.heartbeat_at.isoformat() + 'Z' if self.heartbeat_at else None,
+            "finished_at": self.finished_at.isoformat() + 'Z' if self.finished_at else None,
+        }
+    
+    def __repr__(self):
+        return f"<BackgroundJob {self.id} {self.job_type}:{self.job_key} {self.status}>"
@@ -0,0 +1,421 @@
+"""
+Background Job Queue
+
+Durable, in-process job queue for work that should not block a request:
+interview finalization, batch deep evaluation and behavioral summaries.
+
+- Jobs are rows in background_jobs (see app/jobs/models.py); enqueue()
+  commits the row, then hands the id to a pool of asyncio workers
+  (JOB_WORKERS) running on the application event loop
+- A worker claims a job with a guarded UPDATE (queued -> running), so a
+  job is never run twice even with several processes on one database
+- One active job per (job_type, job_key): enqueueing finalization for a
+  session that already has a queued/running job joins that job. A
+  partial unique index on active jobs backs this up across processes
+- Failed attempts are re-queued up to JOB_MAX_ATTEMPTS
+- A running job's worker refreshes heartbeat_at every
+  JOB_HEARTBEAT_SECONDS; a job with no heartbeat for JOB_STALE_SECONDS
+  is assumed orphaned (its process died) and re-queued
+- stop() puts the jobs this process was running back to 'queued', so a
+  normal restart picks them up immediately
+- wait() lets a request join a job: it wakes on completion in this
+  process, and polls the row for jobs owned by another process
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Set
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.jobs.models import BackgroundJob
+
+
+JobHandler = Callable[[Session, BackgroundJob], Awaitable[Optional[Dict[str, Any]]]]
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+class JobQueue:
+    """DB-backed job queue with an asyncio worker pool."""
+
+    def __init__(self, workers: int = None, max_attempts: int = None):
+        self.worker_count = workers or settings.JOB_WORKERS
+        self.max_attempts = max_attempts or settings.JOB_MAX_ATTEMPTS
+
+        self._handlers: Dict[str, JobHandler] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._workers: List[asyncio.Task] = []
+        self._events: Dict[str, asyncio.Event] = {}
+        self._waiters: Dict[str, int] = {}  # Pending wait() calls per job id
+        self._claimed: Set[str] = set()  # Job ids this process is running
+
+        # Counters (exposed on the admin health report)
+        self.enqueued = 0
+        self.joined = 0
+        self.completed = 0
+        self.retried = 0
+        self.failed = 0
+
+    # ===========================================
+    # LIFECYCLE
+    # ===========================================
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers) and self._loop is not None and not self._loop.is_closed()
+
+    def start(self) -> None:
+        """Start the worker pool on the running event loop and recover pending jobs."""
+        if self.running:
+            return
+
+        from app.jobs.handlers import JOB_HANDLERS
+        self._handlers.update(JOB_HANDLERS)
+
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._workers = [
+            self._loop.create_task(self._work(), name=f"job-worker-{n}")
+            for n in range(max(1, self.worker_count))
+        ]
+
+        recovered = self._recover()
+        print(f"[Job Queue] Started {len(self._workers)} worker(s), recovered {recovered} pending job(s)")
+
+    async def stop(self) -> None:
+        """Stop the workers and re-queue the jobs they were cut off from."""
+        workers, self._workers = self._workers, []
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._release_claimed()
+        self._queue = None
+        self._loop = None
+
+    def _release_claimed(self) -> None:
+        """Put jobs interrupted in this process back to 'queued' (the attempt does not count)."""
+        claimed, self._claimed = self._claimed, set()
+        for job_id in claimed:
+            if job_id not in self._waiters:
+                self._events.pop(job_id, None)
+        if not claimed:
+            return
+
+        db = SessionLocal()
+        try:
+            released = db.query(BackgroundJob).filter(
+                BackgroundJob.id.in_(claimed),
+                BackgroundJob.status == "running",
+            ).update({
+                "status": "queued",
+                "attempts": BackgroundJob.attempts - 1,
+            }, synchronize_session=False)
+            db.commit()
+            print(f"[Job Queue] Released {released} interrupted job(s)")
+        except Exception as e:
+            print(f"[Job Queue] Failed to release interrupted jobs: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+    def _ensure_started(self) -> None:
+        """Start lazily when enqueued before the lifespan ran (scripts, tests)."""
+        if self.running:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self.start()
+
+    def _recover(self) -> int:
+        """Re-queue pending and orphaned jobs left over from a previous run."""
+        db = SessionLocal()
+        try:
+            stale_before = datetime.utcnow() - timedelta(seconds=settings.JOB_STALE_SECONDS)
+            db.query(BackgroundJob).filter(
+                BackgroundJob.status == "running",
+                func.coalesce(BackgroundJob.heartbeat_at, BackgroundJob.started_at) < stale_before,
+            ).update({"status": "queued"}, synchronize_session=False)
+            db.commit()
+
+            pending = db.query(BackgroundJob.id).filter(
+                BackgroundJob.status == "queued",
+            ).order_by(BackgroundJob.created_at).all()
+            for (job_id,) in pending:
+                self._dispatch(job_id)
+            return len(pending)
+        except Exception as e:
+            print(f"[Job Queue] Recovery failed: {e}")
+            db.rollback()
+            return 0
+        finally:
+            db.close()
+
+    # ===========================================
+    # PRODUCER SIDE
+    # ===========================================
+
+    def enqueue(
+        self,
+        db: Session,
+        job_type: str,
+        job_key: str,
+        user_id: str,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> BackgroundJob:
+        """
+        Queue a job, or join the active job for the same type and key.
+
+        Commits the job row on the caller's session.
+
+        Returns:
+            The new or already active BackgroundJob
+        """
+        existing = self.find_active(db, job_type, job_key)
+        if existing:
+            if existing.status == "running" and self._is_stale(existing):
+                existing.status = "queued"
+                db.commit()
+                self._dispatch(existing.id)
+            self.joined += 1
+            return existing
+
+        job = BackgroundJob(
+            job_type=job_type,
+            job_key=job_key,
+            user_id=user_id,
+            payload=payload or {},
+            status="queued",
+        )
+        db.add(job)
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another process queued the same job between the check and the insert
+            db.rollback()
+            existing = self.find_active(db, job_type, job_key)
+            if existing is None:
+                raise
+            self.joined += 1
+            return existing
+
+        self.enqueued += 1
+        self._dispatch(job.id)
+        print(f"[Job Queue] Queued {job_type} for {job_key}: {job.id}")
+        return job
+
+    def find_active(self, db: Session, job_type: str, job_key: str) -> Optional[BackgroundJob]:
+        """Queued or running job for a type and key."""
+        return db.query(BackgroundJob).filter(
+            BackgroundJob.job_type == job_type,
+            BackgroundJob.job_key == job_key,
+            BackgroundJob.status.in_(ACTIVE_STATUSES),
+        ).order_by(BackgroundJob.created_at.desc()).first()
+
+    def get(self, db: Session, job_id: str) -> Optional[BackgroundJob]:
+        return db.query(BackgroundJob).filter(BackgroundJob.id == job_id).first()
+
+    def _is_stale(self, job: BackgroundJob) -> bool:
+        """Running job whose worker has stopped sending heartbeats."""
+        if job.id in self._claimed:
+            return False
+        last_seen = job.heartbeat_at or job.started_at
+        if last_seen is None:
+            return False
+        return (datetime.utcnow() - last_seen).total_seconds() > settings.JOB_STALE_SECONDS
+
+    def _dispatch(self, job_id: str) -> None:
+        """Hand a committed job id to the workers."""
+        self._ensure_started()
+        if not self.running:
+            # No event loop yet - picked up by _recover() on startup
+            return
+
+        try:
+            in_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            in_loop = False
+
+        if in_loop:
+            self._queue.put_nowait(job_id)
+        else:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, job_id)
+
+    async def wait(self, db: Session, job_id: str, timeout: float = None) -> Optional[BackgroundJob]:
+        """
+        Wait until a job finishes or the timeout passes.
+
+        Returns:
+            The job as last read from the database (check job.status),
+            or None if it does not exist
+        """
+        timeout = settings.JOB_WAIT_SECONDS if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        self._waiters[job_id] = self._waiters.get(job_id, 0) + 1
+        try:
+            while True:
+                db.expire_all()
+                job = self.get(db, job_id)
+                if job is None or job.is_finished():
+                    return job
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return job
+
+                event = self._events.setdefault(job_id, asyncio.Event())
+                try:
+                    await asyncio.wait_for(
+                        event.wait(),
+                        timeout=min(remaining, settings.JOB_POLL_INTERVAL_SECONDS),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._waiters[job_id] -= 1
+            if not self._waiters[job_id]:
+                del self._waiters[job_id]
+                # A job running here pops its own event when it finishes;
+                # otherwise (other worker, timeout) nothing else would
+                if job_id not in self._claimed:
+                    self._events.pop(job_id, None)
+
+    # ===========================================
+    # WORKERS
+    # ===========================================
+
+    async def _work(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except Exception as e:
+                print(f"[Job Queue] Worker error on job {job_id}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        """Claim and run one job."""
+        db = SessionLocal()
+        finished = False
+        released = False
+        heartbeat: Optional[asyncio.Task] = None
+        try:
+            now = datetime.utcnow()
+            claimed = db.query(BackgroundJob).filter(
+                BackgroundJob.id == job_id,
+                BackgroundJob.status == "queued",
+            ).update({
+                "status": "running",
+                "started_at": now,
+                "heartbeat_at": now,
+                "attempts": BackgroundJob.attempts + 1,
+            }, synchronize_session=False)
+            db.commit()
+            if not claimed:
+                return  # Already taken by another worker, or finished
+
+            self._claimed.add(job_id)
+            heartbeat = asyncio.create_task(self._heartbeat(job_id), name=f"job-heartbeat-{job_id}")
+
+            job = self.get(db, job_id)
+            handler = self._handlers.get(job.job_type)
+
+            try:
+                if handler is None:
+                    raise ValueError(f"No handler registered for job type: {job.job_type}")
+                result = await handler(db, job)
+            except Exception as e:
+                db.rollback()
+                job = self.get(db, job_id)
+                job.error = str(e)[:2000]
+                if job.attempts < self.max_attempts:
+                    job.status = "queued"
+                    db.commit()
+                    released = True
+                    self.retried += 1
+                    print(f"[Job Queue] {job.job_type} {job_id} failed (attempt {job.attempts}), retrying: {e}")
+                    self._dispatch(job_id)
+                else:
+                    job.status = "failed"
+                    job.finished_at = datetime.utcnow()
+                    db.commit()
+                    released = True
+                    self.failed += 1
+                    finished = True
+                    print(f"[Job Queue] {job.job_type} {job_id} failed permanently: {e}")
+                return
+
+            job.status = "done"
+            job.result = result or {}
+            job.error = None
+            job.finished_at = datetime.utcnow()
+            db.commit()
+            released = True
+            self.completed += 1
+            finished = True
+            print(f"[Job Queue] {job.job_type} {job_id} done in {(job.finished_at - job.started_at).total_seconds():.2f}s")
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+            db.close()
+            if released:
+                # Cancelled jobs stay claimed so stop() can re-queue them
+                self._claimed.discard(job_id)
+            if finished:
+                event = self._events.pop(job_id, None)
+                if event is not None:
+                    event.set()
+
+    async def _heartbeat(self, job_id: str) -> None:
+        """Refresh heartbeat_at while a job runs, so other processes do not treat it as orphaned."""
+        while True:
+            await asyncio.sleep(settings.JOB_HEARTBEAT_SECONDS)
+            try:
+                await asyncio.to_thread(self._touch, job_id)
+            except Exception as e:
+                print(f"[Job Queue] Heartbeat failed for job {job_id}: {e}")
+
+    @staticmethod
+    def _touch(job_id: str) -> None:
+        db = SessionLocal()
+        try:
+            db.query(BackgroundJob).filter(
+                BackgroundJob.id == job_id,
+                BackgroundJob.status == "running",
+            ).update({"heartbeat_at": datetime.utcnow()}, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    # ===========================================
+    # STATS
+    # ===========================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "workers": len(self._workers),
+            "running": self.running,
+            "pending_in_process": self._queue.qsize() if self._queue is not None else 0,
+            "enqueued": self.enqueued,
+            "joined": self.joined,
+            "completed": self.completed,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+
+# ===========================================
+# QUEUE INSTANCE
+# ===========================================
+
+job_queue = JobQueue()
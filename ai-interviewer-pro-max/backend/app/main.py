@@ -14,6 +14,12 @@ from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.db.session import init_db, close_db
+from app.ai.gateway import ai_gateway
+from app.ai.registry import ai_client_registry
+from app.admin.ai_log_sink import ai_log_sink
+from app.jobs.queue import job_queue
+from app.interviews.plan_stream import plan_streams
+from app.interviews.plan_warmer import plan_warm_pool
 
 # Import routers
 from app.auth.routes import router as auth_router
@@ -21,6 +27,7 @@ from app.users.routes import router as users_router
 from app.interviews.routes import router as interviews_router
 from app.interviews.plan_routes import router as plan_router
 from app.interviews.live_routes import router as live_router
+from app.interviews.live_ws import router as live_ws_router
 from app.resumes.routes import router as resumes_router
 from app.ats.routes import router as ats_router
 from app.evaluations.routes import router as evaluations_router
@@ -59,6 +66,19 @@ async def lifespan(app: FastAPI):
     init_db()
     print("✅ Database initialized")
     
+    # Start AI call log writer
+    ai_log_sink.start()
+    
+    # Start background job workers (finalization, deep evaluation, summaries)
+    job_queue.start()
+    
+    # Finish streamed plans left short by a worker that died mid-stream
+    plan_streams.repair_orphans()
+    
+    # AI record/replay (offline benchmarking)
+    if ai_gateway.cassette.mode != "off":
+        print(f"⚠️  AI cassette in {ai_gateway.cassette.mode} mode: {ai_gateway.cassette.path}")
+    
     # Load API keys from database (overrides .env if set)
     try:
         from app.db.session import SessionLocal
@@ -72,8 +92,13 @@ async def lifespan(app: FastAPI):
             db_gemini = SettingsService.get_setting(db, "gemini_api_key", "")
             db_groq = SettingsService.get_setting(db, "groq_api_key", "")
             
+            # Build the shared AI clients for the active keys
+            ai_client_registry.configure(gemini_api_key=db_gemini, groq_api_key=db_groq)
+            
+            # Load admin edits to the AI model routing table
+            ai_gateway.router.load_from_db(db)
+            
             if db_gemini:
-                settings.GEMINI_API_KEY = db_gemini
                 print("✅ Gemini API configured (from database)")
             elif settings.GEMINI_API_KEY:
                 print("✅ Gemini API configured (from .env)")
@@ -81,7 +106,6 @@ async def lifespan(app: FastAPI):
                 print("⚠️  Gemini API NOT configured - AI features will use mock data")
             
             if db_groq:
-                settings.GROQ_API_KEY = db_groq
                 print("✅ Groq API configured (from database)")
             elif settings.GROQ_API_KEY:
                 print("✅ Groq API configured (from .env)")
@@ -102,6 +126,9 @@ async def lifespan(app: FastAPI):
         else:
             print("⚠️  Groq API NOT configured - Real-time features will use mock data")
     
+    # Pre-generate plans for popular plan requests (needs the AI clients configured above)
+    plan_warm_pool.start()
+    
     # Environment info
     print(f"📌 Environment: {settings.ENVIRONMENT}")
     print(f"📌 Debug Mode: {'ON' if settings.DEBUG else 'OFF'}")
@@ -121,6 +148,12 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     print("👋 AI Interviewer Pro Max is shutting down...")
+    await plan_warm_pool.stop()
+    await job_queue.stop()
+    await ai_gateway.aclose()
+    ai_log_sink.stop()
+    stats = ai_log_sink.get_stats()
+    print(f"✅ AI call logs flushed (written: {stats['written']}, dropped: {stats['dropped']})")
     close_db()
     print("✅ Application shutdown complete")
 
@@ -280,6 +313,13 @@ app.include_router(
     tags=["Live Interviews"]
 )
 
+# Live Interview WebSocket (authenticates on connect)
+app.include_router(
+    live_ws_router, 
+    prefix="/api/interviews", 
+    tags=["Live Interviews"]
+)
+
 # Evaluation routes (protected)
 app.include_router(
     evaluations_router, 
@@ -369,6 +409,7 @@ async def health_check():
         "status": "ok",
         "version": "1.0.0",
         "database": "connected",
-        "gemini_api": "configured" if settings.GEMINI_API_KEY else "not_configured",
-        "groq_api": "configured" if settings.GROQ_API_KEY else "not_configured",
+        "gemini_api": "configured" if ai_client_registry.is_gemini_configured() else "not_configured",
+        "groq_api": "configured" if ai_client_registry.is_groq_configured() else "not_configured",
+        "ai_cassette": ai_gateway.cassette.mode,
     }
@@ -8,11 +8,14 @@ Reports are IMMUTABLE after generation.
 """
 
 from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
+from app.core.deadline import Deadline
 from app.core.security import get_current_active_user
 from app.reports.service import ReportService
+from app.jobs.queue import job_queue
 from app.reports.schemas import (
     GenerateReportRequest,
     GenerateReportResponse,
@@ -31,12 +34,27 @@ from app.reports.schemas import (
     StatisticsSchema,
     QuestionFeedbackSchema,
     TopicToStudySchema,
+    BackgroundJobSchema,
+    JobStatusResponse,
     ErrorResponse,
 )
 
 router = APIRouter()
 
 
+def _report_pending_response(job) -> JSONResponse:
+    """202 while the finalization job is still queued/running."""
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={
+            "success": False,
+            "message": "Report is still being generated. Poll the job or retry shortly.",
+            "job_id": job.id,
+            "status": job.status,
+        },
+    )
+
+
 # ===========================================
 # GENERATE REPORT
 # ===========================================
@@ -77,7 +95,7 @@ async def generate_report(
     NOTE: Reports are IMMUTABLE after generation.
     """
     try:
-        service = ReportService(db)
+        service = ReportService(db, deadline=Deadline.deep())
         report = await service.generate_report(
             user_id=current_user["id"],
             session_id=session_id,
@@ -205,14 +223,34 @@ async def finalize_interview_endpoint(
     ✔ Mark session as COMPLETED
     
     This is idempotent - calling multiple times returns the same report.
+    Runs as (or joins) the session's background finalization job; returns
+    202 with the job id if it is not done within JOB_WAIT_SECONDS.
     """
     try:
-        service = ReportService(db)
-        report = await service.finalize_interview(
+        service = ReportService(db, deadline=Deadline.deep())
+        report = service.get_report(
             session_id=session_id,
             user_id=current_user["id"],
         )
         
+        if not report:
+            from app.interviews.live_models import LiveInterviewSession
+            session = db.query(LiveInterviewSession).filter(
+                LiveInterviewSession.id == session_id,
+                LiveInterviewSession.user_id == current_user["id"],
+            ).first()
+            if not session:
+                raise ValueError(f"Session not found: {session_id}")
+            
+            report, job = await service.join_finalization(
+                session_id=session_id,
+                user_id=current_user["id"],
+            )
+            if not report:
+                if job and not job.is_finished():
+                    return _report_pending_response(job)
+                raise RuntimeError(f"Finalization job failed: {job.error if job else 'missing'}")
+        
         # Build response using same logic as generate_report
         report_data = report.to_dict()
         
@@ -301,6 +339,42 @@ async def finalize_interview_endpoint(
         )
 
 
+# ===========================================
+# BACKGROUND JOB STATUS
+# ===========================================
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=JobStatusResponse,
+    summary="Get report job status",
+    description="Status of a background job (queued, running, done, failed), e.g. the finalization job returned by the final answer.",
+    responses={
+        200: {"description": "Job status"},
+        404: {"model": ErrorResponse, "description": "Job not found"},
+        401: {"model": ErrorResponse, "description": "Not authenticated"},
+    }
+)
+async def get_job_status(
+    job_id: str,
+    current_user: dict = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
+    """Get the status of a background job owned by the current user."""
+    job = job_queue.get(db, job_id)
+    
+    if not job or job.user_id != current_user["id"]:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    return JobStatusResponse(
+        success=True,
+        job=BackgroundJobSchema(**job.to_dict()),
+    )
+
+
 # ===========================================
 # GET REPORT
 # ===========================================
@@ -327,7 +401,7 @@ async def get_report(
     If the report doesn't exist but the session is completed,
     this endpoint will attempt to generate the report automatically.
     """
-    service = ReportService(db)
+    service = ReportService(db, deadline=Deadline.deep())
     report = service.get_report(
         session_id=session_id,
         user_id=current_user["id"],
@@ -342,10 +416,11 @@ async def get_report(
         ).first()
         
         if session and session.status == "completed":
-            # Session is completed but report missing - generate it now
+            # Session is completed but report missing - join (or queue)
+            # the finalization job rather than generating a second report
             try:
-                print(f"[GET_REPORT] Report missing for completed session {session_id}, generating now...")
-                report = await service.finalize_interview(
+                print(f"[GET_REPORT] Report missing for completed session {session_id}, waiting on finalization job...")
+                report, job = await service.join_finalization(
                     session_id=session_id,
                     user_id=current_user["id"],
                 )
@@ -355,6 +430,15 @@ async def get_report(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail="Report generation failed. Please try again."
                 )
+            
+            if not report:
+                if job and not job.is_finished():
+                    return _report_pending_response(job)
+                print(f"[GET_REPORT] Finalization job failed: {job.error if job else 'missing'}")
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Report generation failed. Please try again."
+                )
         else:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -176,6 +176,26 @@ class ReportsListResponse(BaseModel):
     total: int
 
 
+class BackgroundJobSchema(BaseModel):
+    """Schema for a background job (e.g. report finalization)."""
+    id: str
+    job_type: str
+    job_key: str
+    status: str = Field(..., description="queued, running, done or failed")
+    attempts: int
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: Optional[str] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+
+class JobStatusResponse(BaseModel):
+    """Schema for job status response."""
+    success: bool = True
+    job: BackgroundJobSchema
+
+
 class ErrorResponse(BaseModel):
     """Schema for error responses."""
     success: bool = False
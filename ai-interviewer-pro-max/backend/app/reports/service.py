@@ -5,20 +5,33 @@ Generates comprehensive interview reports with readiness scoring.
 Uses Gemini for AI-powered analysis and narrative generation.
 
 Reports are IMMUTABLE after generation.
+
+Concurrent requests for the same session's report share one generation
+(report_flight); across workers the unique session_id on
+interview_reports is the backstop.
 """
 
 import json
-import time
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.core.config import settings
+from app.core.deadline import Deadline
+from app.core.single_flight import SingleFlight
+from app.db.session import SessionLocal
+from app.ai.gateway import ai_gateway
 from app.reports.models import InterviewReport
 from app.evaluations.models import AnswerEvaluation
 from app.simulation.models import AnswerBehavioralInsight, SessionBehavioralSummary
 from app.interviews.live_models import LiveInterviewSession, InterviewAnswer
-from app.admin.service import AIAPILogService
+from app.interviews.session_cache import live_session_cache
+from app.jobs.models import BackgroundJob
+from app.jobs.queue import job_queue
+
+
+# One in-flight report generation per (user, session) per worker
+report_flight = SingleFlight("generate_report")
 
 
 class ReportService:
@@ -37,26 +50,16 @@ class ReportService:
     - Improvement suggestions
     """
     
-    def __init__(self, db: Session):
-        """Initialize service with database session."""
-        self.db = db
-        self._gemini_client = None
-    
-    def _get_gemini_client(self):
-        """Get Gemini client if configured."""
-        if not settings.is_gemini_configured():
-            return None
+    def __init__(self, db: Session, deadline: Optional[Deadline] = None):
+        """
+        Initialize service with database session.
         
-        if self._gemini_client is None:
-            try:
-                import google.generativeai as genai
-                genai.configure(api_key=settings.GEMINI_API_KEY)
-                self._gemini_client = genai.GenerativeModel('gemini-pro')
-            except Exception as e:
-                print(f"Failed to initialize Gemini client: {e}")
-                return None
-        
-        return self._gemini_client
+        Args:
+            db: Database session
+            deadline: Optional request deadline (bounds every AI call)
+        """
+        self.db = db
+        self.deadline = deadline
     
     # ===========================================
     # DATA COLLECTION
@@ -581,9 +584,7 @@ class ReportService:
         weaknesses: List[Dict[str, str]],
     ) -> Dict[str, Any]:
         """Use Gemini to generate enhanced report narrative."""
-        client = self._get_gemini_client()
-        
-        if not client:
+        if not ai_gateway.is_gemini_configured():
             return self._generate_mock_narrative(technical_scores, behavioral_scores, strengths, weaknesses)
         
         try:
@@ -629,23 +630,8 @@ Generate in JSON format:
 
 Be professional, constructive, and specific. Avoid vague praise."""
 
-            start_time = time.time()
-            response = client.generate_content(prompt)
+            response = await ai_gateway.gemini_generate(prompt, "generate_report_narrative", db=self.db, deadline=self.deadline)
             result_text = response.text
-            response_time_ms = int((time.time() - start_time) * 1000)
-            
-            # Log successful Gemini API call
-            try:
-                AIAPILogService.log_ai_call(
-                    db=self.db,
-                    provider="gemini",
-                    operation="generate_report_narrative",
-                    model="gemini-pro",
-                    response_time_ms=response_time_ms,
-                    status="success"
-                )
-            except Exception as log_error:
-                print(f"[AI Log Error] Failed to log Gemini call: {log_error}")
             
             if "{" in result_text:
                 json_str = result_text[result_text.find("{"):result_text.rfind("}")+1]
@@ -658,21 +644,7 @@ Be professional, constructive, and specific. Avoid vague praise."""
                     "source": "gemini",
                 }
         except Exception as e:
-            error_msg = str(e)
-            print(f"Gemini report generation error: {error_msg}")
-            
-            # Log failed Gemini API call
-            try:
-                AIAPILogService.log_ai_call(
-                    db=self.db,
-                    provider="gemini",
-                    operation="generate_report_narrative",
-                    model="gemini-pro",
-                    status="error",
-                    error_message=error_msg[:500]
-                )
-            except Exception as log_error:
-                print(f"[AI Log Error] Failed to log Gemini error: {log_error}")
+            print(f"Gemini report generation error: {e}")
         
         return self._generate_mock_narrative(technical_scores, behavioral_scores, strengths, weaknesses)
     
@@ -727,6 +699,9 @@ Be professional, constructive, and specific. Avoid vague praise."""
         
         Aggregates all data and produces final readiness score.
         Report is IMMUTABLE after generation.
+        
+        Concurrent callers for the same session (auto-finalization, the
+        report page, /finalize, /generate) share a single generation.
         """
         # Check if report already exists
         existing = self.db.query(InterviewReport).filter(
@@ -737,6 +712,25 @@ Be professional, constructive, and specific. Avoid vague praise."""
         if existing:
             return existing  # Reports are immutable
         
+        async def build() -> str:
+            # Own session: the shielded build outlives a leader that
+            # disconnects, and get_db closes the leader's session then
+            db = SessionLocal()
+            try:
+                service = ReportService(db, deadline=self.deadline)
+                return (await service._build_report(user_id=user_id, session_id=session_id)).id
+            finally:
+                db.close()
+        
+        report_id = await report_flight.do((user_id, session_id), build)
+        return self.db.get(InterviewReport, report_id)
+    
+    async def _build_report(
+        self,
+        user_id: str,
+        session_id: str,
+    ) -> InterviewReport:
+        """Score, narrate and save the report (run once per session via report_flight)."""
         # Collect session data
         session_data = self._get_session_data(session_id, user_id)
         session = session_data["session"]
@@ -816,7 +810,16 @@ Be professional, constructive, and specific. Avoid vague praise."""
         report.readiness_level = report.get_level()
         
         self.db.add(report)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError:
+            # Another worker saved this session's report first (unique session_id)
+            self.db.rollback()
+            existing = self.get_report(session_id=session_id, user_id=user_id)
+            if existing is None:
+                raise
+            print(f"[REPORT] Report for session {session_id} was saved concurrently, using {existing.id}")
+            return existing
         self.db.refresh(report)
         
         return report
@@ -942,6 +945,7 @@ Be professional, constructive, and specific. Avoid vague praise."""
             session.status = "completed"
             session.completed_at = datetime.utcnow()
             self.db.commit()
+            live_session_cache.invalidate(session_id)
             print(f"[FINALIZE] Session status updated to 'completed'")
         
         # Generate the full report using existing logic
@@ -1021,11 +1025,43 @@ Be professional, constructive, and specific. Avoid vague praise."""
             self.db.refresh(report)
             print(f"[FALLBACK] Fallback report saved: {report.id}")
             return report
+        except IntegrityError:
+            # A concurrent generation saved the report in the meantime
+            self.db.rollback()
+            existing = self.get_report(session_id=session_id, user_id=user_id)
+            if existing is None:
+                raise ValueError(f"Failed to create report for session {session_id}")
+            return existing
         except Exception as e:
             print(f"[FALLBACK] Failed to save fallback report: {e}")
             self.db.rollback()
             raise ValueError(f"Failed to create report: {e}")
     
+    async def join_finalization(
+        self,
+        session_id: str,
+        user_id: str,
+        timeout: Optional[float] = None,
+    ) -> Tuple[Optional[InterviewReport], Optional[BackgroundJob]]:
+        """
+        Wait on the session's finalization job, queueing it if none is active.
+        
+        Joins the job queued when the interview completed instead of
+        generating a second report alongside it.
+        
+        Returns:
+            (report or None if not ready yet, the finalization job)
+        """
+        job = job_queue.enqueue(
+            self.db,
+            job_type="finalize_interview",
+            job_key=session_id,
+            user_id=user_id,
+        )
+        job = await job_queue.wait(self.db, job.id, timeout=timeout)
+        report = self.get_report(session_id=session_id, user_id=user_id)
+        return report, job
+    
     def get_report_or_generate(
         self,
         session_id: str,
@@ -1056,6 +1092,6 @@ Be professional, constructive, and specific. Avoid vague praise."""
         return None
 
 
-def get_report_service(db: Session) -> ReportService:
+def get_report_service(db: Session, deadline: Optional[Deadline] = None) -> ReportService:
     """Get report service instance."""
-    return ReportService(db)
+    return ReportService(db, deadline=deadline)
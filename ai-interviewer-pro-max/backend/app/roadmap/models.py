@@ -5,7 +5,7 @@ SQLAlchemy models for storing personalized career roadmaps.
 Roadmaps are versioned to allow regeneration.
 """
 
-from sqlalchemy import Column, String, Text, Integer, Float, DateTime, JSON, Boolean
+from sqlalchemy import Column, String, Text, Integer, Float, DateTime, JSON, Boolean, Index
 from datetime import datetime
 import uuid
 
@@ -27,6 +27,11 @@ class CareerRoadmap(Base):
     """
     
     __tablename__ = "career_roadmaps"
+    __table_args__ = (
+        # One row per session version: concurrent generations on different
+        # workers cannot both save the same version (NULL session_id = standalone)
+        Index("ux_career_roadmaps_session_version", "session_id", "version", unique=True),
+    )
     
     # Primary key
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
@@ -9,6 +9,7 @@ from fastapi import APIRouter, HTTPException, status, Depends
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
+from app.core.deadline import Deadline
 from app.core.security import get_current_active_user
 from app.roadmap.service import RoadmapService
 from app.roadmap.schemas import (
@@ -139,7 +140,7 @@ async def generate_roadmap(
     Returns actionable learning path with timeline.
     """
     try:
-        service = RoadmapService(db)
+        service = RoadmapService(db, deadline=Deadline.deep())
         roadmap = await service.generate_roadmap(
             user_id=current_user["id"],
             session_id=session_id,
@@ -187,7 +188,7 @@ async def generate_standalone_roadmap(
 ):
     """Generate standalone roadmap without interview session."""
     try:
-        service = RoadmapService(db)
+        service = RoadmapService(db, deadline=Deadline.deep())
         roadmap = await service.generate_roadmap(
             user_id=current_user["id"],
             session_id=None,
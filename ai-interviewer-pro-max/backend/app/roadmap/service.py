@@ -3,22 +3,31 @@ Career Roadmap Service
 
 Generates personalized career roadmaps using Gemini AI.
 Based on resume, ATS analysis, and interview performance.
+
+Concurrent identical requests share one generation (roadmap_flight);
+across workers the unique (session_id, version) index is the backstop.
 """
 
 import json
-import time
 from datetime import datetime
 from typing import Dict, Any, List, Optional
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.core.config import settings
+from app.core.deadline import Deadline
+from app.core.single_flight import SingleFlight
+from app.db.session import SessionLocal
+from app.ai.gateway import ai_gateway
 from app.roadmap.models import CareerRoadmap
 from app.reports.models import InterviewReport
 from app.evaluations.models import AnswerEvaluation
 from app.resumes.models import Resume
 from app.ats.models import ATSAnalysis
 from app.interviews.live_models import LiveInterviewSession
-from app.admin.service import AIAPILogService
+
+
+# One in-flight generation per identical roadmap request per worker
+roadmap_flight = SingleFlight("generate_roadmap")
 
 
 class RoadmapService:
@@ -29,26 +38,16 @@ class RoadmapService:
     based on interview performance and career goals.
     """
     
-    def __init__(self, db: Session):
-        """Initialize service with database session."""
-        self.db = db
-        self._gemini_client = None
-    
-    def _get_gemini_client(self):
-        """Get Gemini client if configured."""
-        if not settings.is_gemini_configured():
-            return None
+    def __init__(self, db: Session, deadline: Optional[Deadline] = None):
+        """
+        Initialize service with database session.
         
-        if self._gemini_client is None:
-            try:
-                import google.generativeai as genai
-                genai.configure(api_key=settings.GEMINI_API_KEY)
-                self._gemini_client = genai.GenerativeModel('gemini-pro')
-            except Exception as e:
-                print(f"Failed to initialize Gemini client: {e}")
-                return None
-        
-        return self._gemini_client
+        Args:
+            db: Database session
+            deadline: Optional request deadline (bounds every AI call)
+        """
+        self.db = db
+        self.deadline = deadline
     
     # ===========================================
     # DATA COLLECTION
@@ -93,7 +92,7 @@ class RoadmapService:
         # Get latest resume
         resume = self.db.query(Resume).filter(
             Resume.user_id == user_id,
-        ).order_by(Resume.uploaded_at.desc()).first()
+        ).order_by(Resume.created_at.desc()).first()
         data["resume"] = resume
         
         # Get latest ATS analysis
@@ -354,9 +353,7 @@ class RoadmapService:
         readiness_score: int,
     ) -> Dict[str, Any]:
         """Generate roadmap using Gemini AI."""
-        client = self._get_gemini_client()
-        
-        if not client:
+        if not ai_gateway.is_gemini_configured():
             return self._generate_mock_roadmap(target_role, skill_gaps, readiness_score)
         
         try:
@@ -415,23 +412,8 @@ Make it:
 4. No external URLs required
 5. Professional and encouraging tone"""
 
-            start_time = time.time()
-            response = client.generate_content(prompt)
+            response = await ai_gateway.gemini_generate(prompt, "generate_career_roadmap", db=self.db, deadline=self.deadline)
             result_text = response.text
-            response_time_ms = int((time.time() - start_time) * 1000)
-            
-            # Log successful Gemini API call
-            try:
-                AIAPILogService.log_ai_call(
-                    db=self.db,
-                    provider="gemini",
-                    operation="generate_career_roadmap",
-                    model="gemini-pro",
-                    response_time_ms=response_time_ms,
-                    status="success"
-                )
-            except Exception as log_error:
-                print(f"[AI Log Error] Failed to log Gemini call: {log_error}")
             
             if "{" in result_text:
                 json_str = result_text[result_text.find("{"):result_text.rfind("}")+1]
@@ -485,14 +467,46 @@ Make it:
         Generate personalized career roadmap.
         
         Based on interview performance, resume, and ATS analysis.
+        A double-submitted request joins the generation already running
+        instead of creating a second version.
         """
+        async def build() -> str:
+            # Own session: the shielded build outlives a leader that
+            # disconnects, and get_db closes the leader's session then
+            db = SessionLocal()
+            try:
+                roadmap = await RoadmapService(db, deadline=self.deadline)._build_roadmap(
+                    user_id=user_id,
+                    session_id=session_id,
+                    target_role=target_role,
+                    current_level=current_level,
+                    target_level=target_level,
+                )
+                return roadmap.id
+            finally:
+                db.close()
+        
+        roadmap_id = await roadmap_flight.do(
+            (user_id, session_id, target_role, current_level, target_level),
+            build,
+        )
+        return self.db.get(CareerRoadmap, roadmap_id)
+    
+    async def _build_roadmap(
+        self,
+        user_id: str,
+        session_id: Optional[str],
+        target_role: Optional[str],
+        current_level: Optional[str],
+        target_level: Optional[str],
+    ) -> CareerRoadmap:
+        """Generate and save a new roadmap version (run via roadmap_flight)."""
         # Collect context
         context = self._get_context_data(user_id, session_id)
         
         session = context["session"]
         report = context["report"]
         evaluations = context["evaluations"]
-        resume = context["resume"]
         ats = context["ats_analysis"]
         
         # Determine target role
@@ -504,10 +518,10 @@ Make it:
         # Analyze skill gaps
         skill_gaps = self._analyze_skill_gaps(report, evaluations, ats)
         
-        # Get resume skills
+        # Get resume skills (extracted by the ATS analysis; Resume stores text only)
         resume_skills = []
-        if resume and resume.parsed_data:
-            resume_skills = resume.parsed_data.get("skills", [])
+        if ats and ats.skills_extracted:
+            resume_skills = [s.get("name", s) if isinstance(s, dict) else s for s in ats.skills_extracted]
         
         # Generate roadmap content
         roadmap_data = await self._generate_with_gemini(
@@ -568,7 +582,16 @@ Make it:
         )
         
         self.db.add(roadmap)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError:
+            # Another worker saved this version first (unique session_id + version)
+            self.db.rollback()
+            existing = self.get_roadmap(session_id=session_id, user_id=user_id) if session_id else None
+            if existing is None:
+                raise
+            print(f"[ROADMAP] Version {version} for session {session_id} was saved concurrently, using {existing.id}")
+            return existing
         self.db.refresh(roadmap)
         
         return roadmap
@@ -607,6 +630,6 @@ Make it:
         ).order_by(CareerRoadmap.generated_at.desc()).limit(limit).all()
 
 
-def get_roadmap_service(db: Session) -> RoadmapService:
+def get_roadmap_service(db: Session, deadline: Optional[Deadline] = None) -> RoadmapService:
     """Get roadmap service instance."""
-    return RoadmapService(db)
+    return RoadmapService(db, deadline=deadline)
@@ -12,6 +12,7 @@ from fastapi import APIRouter, HTTPException, status, Depends
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
+from app.core.deadline import Deadline
 from app.core.security import get_current_active_user
 from app.simulation.service import BehavioralSimulationService
 from app.simulation.schemas import (
@@ -68,7 +69,7 @@ async def analyze_answer(
     DISCLAIMER: This is text-based inference, not real emotion detection.
     """
     try:
-        service = BehavioralSimulationService(db)
+        service = BehavioralSimulationService(db, deadline=Deadline.deep())
         insight = await service.analyze_answer(
             user_id=current_user["id"],
             session_id=request.session_id,
@@ -166,7 +167,7 @@ async def generate_session_summary(
     DISCLAIMER: This is text-based inference, not real emotion detection.
     """
     try:
-        service = BehavioralSimulationService(db)
+        service = BehavioralSimulationService(db, deadline=Deadline.deep())
         summary = await service.generate_session_summary(
             user_id=current_user["id"],
             session_id=request.session_id,
@@ -16,15 +16,15 @@ Per AI Responsibility Split (Step 4):
 
 import re
 import json
-import time
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 from collections import Counter
 
-from app.core.config import settings
+from app.core.deadline import Deadline
+from app.ai.gateway import ai_gateway
+from app.ai.prompt_builder import build_prompt
 from app.simulation.models import AnswerBehavioralInsight, SessionBehavioralSummary
-from app.admin.service import AIAPILogService
 
 
 class BehavioralSimulationService:
@@ -72,26 +72,16 @@ class BehavioralSimulationService:
         'what i meant was', 'sorry', 'correction', 'wait',
     }
     
-    def __init__(self, db: Session):
-        """Initialize service with database session."""
+    def __init__(self, db: Session, deadline: Optional[Deadline] = None):
+        """
+        Initialize service with database session.
+        
+        Args:
+            db: Database session
+            deadline: Optional request deadline (bounds every AI call)
+        """
         self.db = db
-        self._gemini_client = None
-    
-    def _get_gemini_client(self):
-        """Get Gemini client if configured."""
-        if not settings.is_gemini_configured():
-            return None
-        
-        if self._gemini_client is None:
-            try:
-                import google.generativeai as genai
-                genai.configure(api_key=settings.GEMINI_API_KEY)
-                self._gemini_client = genai.GenerativeModel('gemini-pro')
-            except Exception as e:
-                print(f"Failed to initialize Gemini client: {e}")
-                return None
-        
-        return self._gemini_client
+        self.deadline = deadline
     
     # ===========================================
     # TEXT ANALYSIS (Deterministic)
@@ -375,18 +365,18 @@ class BehavioralSimulationService:
         - Better suggestions
         - Narrative interpretation
         """
-        client = self._get_gemini_client()
-        
-        if not client:
+        if not ai_gateway.is_gemini_configured():
             return base_analysis
         
         try:
-            prompt = f"""Analyze this interview answer for behavioral patterns.
+            prompt = build_prompt(
+                "behavioral_analysis",
+                lambda sections: f"""Analyze this interview answer for behavioral patterns.
 This is TEXT-BASED analysis only (no audio/video).
 
-Question: {question_text or 'Not provided'}
+Question: {sections["question"] or 'Not provided'}
 
-Answer: {answer_text[:1500]}
+Answer: {sections["answer"]}
 
 Current analysis:
 - Emotional state: {base_analysis.get('emotional_state', {}).get('state', 'unknown')}
@@ -401,25 +391,14 @@ Provide enhanced observations in JSON:
     "notable_patterns": ["any notable pattern"]
 }}
 
-Be professional and constructive. This is text-only inference."""
+Be professional and constructive. This is text-only inference.""",
+                caps={"question": 150},
+                question=question_text or "",
+                answer=answer_text,
+            )
 
-            start_time_ai = time.time()
-            response = client.generate_content(prompt)
+            response = await ai_gateway.gemini_generate(prompt, "behavioral_analysis", db=self.db, deadline=self.deadline)
             result_text = response.text
-            response_time_ms = int((time.time() - start_time_ai) * 1000)
-            
-            # Log successful Gemini API call
-            try:
-                AIAPILogService.log_ai_call(
-                    db=self.db,
-                    provider="gemini",
-                    operation="behavioral_analysis",
-                    model="gemini-pro",
-                    response_time_ms=response_time_ms,
-                    status="success"
-                )
-            except Exception as log_error:
-                print(f"[AI Log Error] Failed to log Gemini call: {log_error}")
             
             if "{" in result_text:
                 json_str = result_text[result_text.find("{"):result_text.rfind("}")+1]
@@ -485,7 +464,7 @@ Be professional and constructive. This is text-only inference."""
         
         # Optionally enhance with Gemini
         source = "mock"
-        if use_gemini and settings.is_gemini_configured():
+        if use_gemini and ai_gateway.is_gemini_configured():
             result = await self._enhance_with_gemini(answer_text, question_text, result)
             source = "gemini"
         
@@ -781,6 +760,6 @@ Be professional and constructive. This is text-only inference."""
         ).first()
 
 
-def get_simulation_service(db: Session) -> BehavioralSimulationService:
+def get_simulation_service(db: Session, deadline: Optional[Deadline] = None) -> BehavioralSimulationService:
     """Get simulation service instance."""
-    return BehavioralSimulationService(db)
+    return BehavioralSimulationService(db, deadline=deadline)
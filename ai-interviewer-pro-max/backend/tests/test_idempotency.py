@@ -0,0 +1,164 @@
+"""
+Idempotency Store Tests
+
+IdempotencyStore replay, join, conflict, failure and eviction behavior.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.core.idempotency import (
+    IdempotencyConflictError,
+    IdempotencyInProgressError,
+    IdempotencyStore,
+    request_fingerprint,
+)
+
+
+class Counter:
+    """Async call that counts its runs."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.runs = 0
+        self.delay = delay
+        self.fail = fail
+
+    async def __call__(self):
+        self.runs += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        return {"run": self.runs}
+
+
+def test_without_key_every_call_runs():
+    store = IdempotencyStore(max_size=10, ttl_seconds=60)
+    call = Counter()
+
+    async def scenario():
+        await store.run("submit_answer", "u1", None, "fp", call)
+        return await store.run("submit_answer", "u1", None, "fp", call)
+
+    assert asyncio.run(scenario()) == ({"run": 2}, False)
+    assert call.runs == 2
+
+
+def test_retry_replays_the_stored_response():
+    store = IdempotencyStore(max_size=10, ttl_seconds=60)
+    call = Counter()
+    fingerprint = request_fingerprint("session-1", "answer", 12)
+
+    async def scenario():
+        first = await store.run("submit_answer", "u1", "key-1", fingerprint, call)
+        second = await store.run("submit_answer", "u1", "key-1", fingerprint, call)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == ({"run": 1}, False)
+    assert second == ({"run": 1}, True)
+    assert call.runs == 1
+    assert store.get_stats()["replayed"] == 1
+
+
+def test_keys_are_scoped_per_user_and_endpoint():
+    store = IdempotencyStore(max_size=10, ttl_seconds=60)
+    call = Counter()
+
+    async def scenario():
+        await store.run("submit_answer", "u1", "key-1", "fp", call)
+        await store.run("submit_answer", "u2", "key-1", "fp", call)
+        await store.run("skip_question", "u1", "key-1", "fp", call)
+
+    asyncio.run(scenario())
+    assert call.runs == 3
+
+
+def test_key_reused_for_another_request_conflicts():
+    store = IdempotencyStore(max_size=10, ttl_seconds=60)
+    call = Counter()
+
+    async def scenario():
+        await store.run("submit_answer", "u1", "key-1", request_fingerprint("a"), call)
+        await store.run("submit_answer", "u1", "key-1", request_fingerprint("b"), call)
+
+    with pytest.raises(IdempotencyConflictError):
+        asyncio.run(scenario())
+    assert call.runs == 1
+
+
+def test_concurrent_duplicate_joins_the_original():
+    store = IdempotencyStore(max_size=10, ttl_seconds=60)
+    call = Counter(delay=0.05)
+
+    async def scenario():
+        return await asyncio.gather(
+            store.run("generate_plan", "u1", "key-1", "fp", call),
+            store.run("generate_plan", "u1", "key-1", "fp", call),
+        )
+
+    first, second = asyncio.run(scenario())
+    assert first == ({"run": 1}, False)
+    assert second == ({"run": 1}, True)
+    assert call.runs == 1
+    assert store.get_stats()["joined"] == 1
+
+
+def test_duplicate_gives_up_after_the_wait_window(monkeypatch):
+    monkeypatch.setattr(settings, "IDEMPOTENCY_WAIT_SECONDS", 0.01)
+    store = IdempotencyStore(max_size=10, ttl_seconds=60)
+    call = Counter(delay=0.2)
+
+    async def scenario():
+        original = asyncio.ensure_future(store.run("generate_plan", "u1", "key-1", "fp", call))
+        await asyncio.sleep(0)
+        try:
+            await store.run("generate_plan", "u1", "key-1", "fp", call)
+        finally:
+            await original
+
+    with pytest.raises(IdempotencyInProgressError):
+        asyncio.run(scenario())
+    assert call.runs == 1
+
+
+def test_failed_request_is_not_stored():
+    store = IdempotencyStore(max_size=10, ttl_seconds=60)
+    failing = Counter(fail=True)
+    succeeding = Counter()
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await store.run("submit_answer", "u1", "key-1", "fp", failing)
+        return await store.run("submit_answer", "u1", "key-1", "fp", succeeding)
+
+    assert asyncio.run(scenario()) == ({"run": 1}, False)
+    assert store.get_stats()["in_flight"] == 0
+
+
+def test_evicted_entry_runs_again():
+    store = IdempotencyStore(max_size=2, ttl_seconds=60)
+    call = Counter()
+
+    async def scenario():
+        for key in ("key-1", "key-2", "key-3"):
+            await store.run("submit_answer", "u1", key, "fp", call)
+        # key-1 was the least recently used entry
+        return await store.run("submit_answer", "u1", "key-1", "fp", call)
+
+    assert asyncio.run(scenario()) == ({"run": 4}, False)
+    assert store.get_stats()["size"] == 2
+
+
+def test_expired_entry_runs_again():
+    store = IdempotencyStore(max_size=10, ttl_seconds=0.01)
+    call = Counter()
+
+    async def scenario():
+        await store.run("submit_answer", "u1", "key-1", "fp", call)
+        await asyncio.sleep(0.05)
+        return await store.run("submit_answer", "u1", "key-1", "fp", call)
+
+    assert asyncio.run(scenario()) == ({"run": 2}, False)
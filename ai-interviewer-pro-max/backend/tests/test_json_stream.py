@@ -0,0 +1,82 @@
+"""
+Incremental JSON Array Parser Tests
+
+JSONArrayStreamParser fed a plan document in chunks of every size.
+"""
+
+import json
+
+from app.ai.json_stream import JSONArrayStreamParser
+
+
+PLAN = {
+    "summary": "Plan with [brackets] and {braces} in a string",
+    "questions": [
+        {"id": "q-1", "text": "What is a \"closure\"?", "topics": ["functions", "scope"]},
+        {"id": "q-2", "text": "Escaped backslash \\ then ] and }", "meta": {"nested": [1, 2, {"deep": True}]}},
+        {"id": "q-3", "text": "Last one"},
+    ],
+    "rationale": "After the array",
+}
+
+
+def _feed_in_chunks(parser: JSONArrayStreamParser, text: str, size: int) -> list:
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(parser.feed(text[start:start + size]))
+    return items
+
+
+def test_items_match_for_any_chunk_size():
+    text = json.dumps(PLAN, indent=2)
+
+    for size in (1, 2, 3, 7, 64, len(text)):
+        parser = JSONArrayStreamParser("questions")
+        assert _feed_in_chunks(parser, text, size) == PLAN["questions"], size
+        assert parser.done
+        assert parser.text == text
+
+
+def test_item_handed_out_when_its_brace_closes():
+    parser = JSONArrayStreamParser("questions")
+
+    assert parser.feed('{"questions": [{"id": "q-1", "text": "a"') == []
+    assert parser.feed('}, {"id": "q-2"') == [{"id": "q-1", "text": "a"}]
+    assert parser.feed('}]') == [{"id": "q-2"}]
+    assert parser.done
+
+
+def test_markdown_fence_and_key_split_across_chunks():
+    text = "```json\n" + json.dumps(PLAN) + "\n```"
+    split = text.index('"questions"') + len('"quest')
+    parser = JSONArrayStreamParser("questions")
+
+    # The key itself arrives in pieces
+    assert parser.feed(text[:split]) == []
+    assert parser.feed(text[split:]) == PLAN["questions"]
+    assert parser.done
+
+
+def test_other_keys_and_text_after_the_array_are_ignored():
+    parser = JSONArrayStreamParser("questions")
+    text = '{"other": [{"id": "nope"}], "questions": [{"id": "q-1"}], "more": [{"id": "nope"}]}'
+
+    assert parser.feed(text) == [{"id": "q-1"}]
+    assert parser.done
+    assert parser.feed('{"id": "late"}') == []
+
+
+def test_invalid_item_is_skipped():
+    parser = JSONArrayStreamParser("questions")
+
+    items = parser.feed('{"questions": [{"id": "q-1"}, {"id": q-2}, {"id": "q-3"}]}')
+
+    assert items == [{"id": "q-1"}, {"id": "q-3"}]
+    assert parser.skipped == 1
+
+
+def test_no_array_yet():
+    parser = JSONArrayStreamParser("questions")
+
+    assert parser.feed('{"summary": "still thinking"') == []
+    assert not parser.done
@@ -0,0 +1,196 @@
+"""
+Question Pool Index Tests
+
+QuestionPoolIndex (ordinals, buckets, ID masks, fallback IDs) and the
+QuestionPoolManager selection built on it (bitmask exclusions, seeded
+partial shuffle).
+"""
+
+import hashlib
+import random
+
+from app.interviews.question_pools import (
+    Difficulty,
+    QuestionPoolIndex,
+    QuestionPoolManager,
+    question_pool_index,
+    _question_id,
+)
+
+
+def _baseline_id(round_type: str, difficulty: str, text: str) -> str:
+    """ID as the pools hashed it before the index existed."""
+    return f"q-{hashlib.md5(f'{round_type}:{difficulty}:{text[:50]}'.encode()).hexdigest()[:12]}"
+
+
+TWIN_PREFIX = "Tell me about a time you had to explain something hard to a "
+
+POOLS = {
+    "technical": {
+        "easy": [
+            {"text": "What is a variable?", "topics": ["basics"]},
+            {"text": "What is a loop?"},
+        ],
+        "medium": [
+            {"text": "Explain closures.", "topics": ["functions"]},
+            {"text": TWIN_PREFIX + "manager."},
+            {"text": TWIN_PREFIX + "customer."},
+        ],
+    },
+    "hr": {
+        "medium": [
+            {"text": "Why do you want this job?"},
+            {"text": "Where do you see yourself in five years?"},
+        ],
+    },
+}
+
+
+# ===========================================
+# INDEX
+# ===========================================
+
+def test_index_assigns_ordinals_per_bucket():
+    index = QuestionPoolIndex(POOLS)
+
+    assert len(index) == 7
+    assert index.bucket("technical", "easy") == range(0, 2)
+    assert index.bucket("technical", "medium") == range(2, 5)
+    assert index.bucket("hr", "medium") == range(5, 7)
+    assert index.bucket("hr", "hard") == range(0)
+    assert index.texts[2] == "Explain closures."
+    assert index.topics[2] == ("functions",)
+    assert index.difficulties[0] == "easy"
+
+
+def test_index_ids_match_content_hash():
+    index = QuestionPoolIndex(POOLS)
+
+    for ordinal in index.bucket("technical", "medium"):
+        assert index.ids[ordinal] == _baseline_id("technical", "medium", index.texts[ordinal])
+
+
+def test_mask_and_shared_id_twins():
+    index = QuestionPoolIndex(POOLS)
+
+    # The two twins share their first 50 characters, hence their ID
+    assert index.ids[3] == index.ids[4]
+    assert index.id_mask(3) == index.id_mask(4) == (1 << 3) | (1 << 4)
+    assert index.mask([index.ids[0], index.ids[3]]) == (1 << 0) | (1 << 3) | (1 << 4)
+    assert index.mask(["q-not-in-pools"]) == 0
+
+
+def test_version_tracks_layout():
+    assert QuestionPoolIndex(POOLS).version == QuestionPoolIndex(POOLS).version
+
+    reordered = {"hr": POOLS["hr"], "technical": POOLS["technical"]}
+    assert QuestionPoolIndex(reordered).version != QuestionPoolIndex(POOLS).version
+
+
+def test_fallback_ids_use_requested_difficulty():
+    index = QuestionPoolIndex(POOLS)
+    medium = index.bucket("hr", "medium")
+
+    for ordinal in medium:
+        fallback_id = index.question_id(ordinal, "hr", Difficulty.EXPERT)
+        assert fallback_id == _baseline_id("hr", "expert", index.texts[ordinal])
+        # Fallback IDs resolve to the same ordinals (exclusions, seen history)
+        assert index.mask([fallback_id]) == index.id_mask(ordinal)
+        # A difficulty with its own pool keeps the ordinal's ID
+        assert index.question_id(ordinal, "hr", "medium") == index.ids[ordinal]
+
+    # Unknown difficulty names are hashed the same way
+    assert index.question_id(medium.start, "hr", "legendary") == _question_id(
+        "hr", "legendary", index.texts[medium.start]
+    )
+
+
+def test_empty_difficulty_ids_match_baseline():
+    questions = QuestionPoolManager("s1").get_questions_for_round("hr", Difficulty.EXPERT, 3)
+
+    assert len(questions) == 3
+    for question in questions:
+        if question["difficulty"] == Difficulty.EXPERT:
+            assert question["id"] == _baseline_id("hr", "expert", question["text"])
+
+
+# ===========================================
+# SELECTION
+# ===========================================
+
+def test_same_seed_same_questions():
+    first = QuestionPoolManager("seed-a").get_questions_for_round("technical", "medium", 5)
+    second = QuestionPoolManager("seed-a").get_questions_for_round("technical", "medium", 5)
+
+    assert [q["id"] for q in first] == [q["id"] for q in second]
+
+
+def test_no_repeats_within_a_session():
+    manager = QuestionPoolManager("seed-b")
+    seen = set()
+    for _ in range(3):
+        for question in manager.get_questions_for_round("technical", "medium", 4):
+            assert question["id"] not in seen
+            seen.add(question["id"])
+
+
+def test_exclude_ids_and_asked_mask():
+    bucket = question_pool_index.bucket("technical", "medium")
+    excluded = {question_pool_index.ids[o] for o in list(bucket)[:5]}
+    asked = question_pool_index.mask(question_pool_index.ids[o] for o in list(bucket)[5:10])
+
+    questions = QuestionPoolManager("seed-c", asked_mask=asked).get_questions_for_round(
+        "technical", "medium", len(bucket) - 10, exclude_ids=excluded,
+    )
+
+    ids = {q["id"] for q in questions}
+    assert not ids & excluded
+    assert not question_pool_index.mask(ids) & asked
+
+
+def test_history_reused_once_pool_is_exhausted():
+    # Every question seen: the manager falls back to history instead of coming up short
+    everything = (1 << len(question_pool_index)) - 1
+    questions = QuestionPoolManager("seed-d", asked_mask=everything).get_questions_for_round(
+        "behavioral", "medium", 4,
+    )
+
+    assert len(questions) == 4
+    assert len({q["id"] for q in questions}) == 4
+
+
+def test_sample_is_seeded_partial_shuffle():
+    manager = QuestionPoolManager("seed-e")
+    population = list(range(20))
+
+    picked = manager._sample(list(population), 5)
+    assert len(picked) == 5
+    assert len(set(picked)) == 5
+    assert set(picked) <= set(population)
+
+    # Same draws as a Fisher-Yates over the first `count` slots with the same RNG
+    rng = random.Random(manager._hash_seed("seed-e"))
+    expected = list(population)
+    for i in range(5):
+        j = rng.randrange(i, len(expected))
+        expected[i], expected[j] = expected[j], expected[i]
+    assert picked == expected[:5]
+
+    assert sorted(manager._sample([1, 2, 3], 10)) == [1, 2, 3]
+
+
+def test_same_id_twins_never_picked_together(monkeypatch):
+    import app.interviews.question_pools as question_pools
+
+    index = QuestionPoolIndex(POOLS)
+    monkeypatch.setattr(question_pools, "question_pool_index", index)
+
+    # Without history, then with the whole pool seen (the history pass)
+    for asked_mask in (0, (1 << len(index)) - 1):
+        for seed in range(20):
+            manager = QuestionPoolManager(f"twins-{seed}", asked_mask=asked_mask)
+            questions = manager.get_questions_for_round("technical", "medium", 3)
+            ids = [q["id"] for q in questions]
+            assert len(ids) == len(set(ids))
+            # Two distinct IDs in the medium bucket; the third comes from easy
+            assert len(ids) == 3